@@ -0,0 +1 @@
+"""Performance benchmarks for PyPSA Explorer."""
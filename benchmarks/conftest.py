@@ -0,0 +1,43 @@
+"""Fixtures for the benchmark suite."""
+
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pypsa = pytest.importorskip("pypsa")
+
+from benchmarks.synthetic import SIZES, make_synthetic_network  # noqa: E402
+from pypsa_explorer.config import setup_plotly_theme  # noqa: E402
+from pypsa_explorer.utils.network_loader import ensure_carriers_defined  # noqa: E402
+
+# Comma-separated preset sizes to benchmark; "large" is opt-in because it takes minutes
+BENCH_SIZES = os.environ.get("PYPSA_EXPLORER_BENCH_SIZES", "small,medium").split(",")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def plotly_theme():
+    """Register the dashboard's Plotly templates, as the app does on startup."""
+    setup_plotly_theme()
+
+
+@pytest.fixture(scope="session", params=BENCH_SIZES)
+def size_name(request):
+    """Name of the preset network size."""
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def synthetic_network(size_name):
+    """Synthetic solved network of the current size, prepared as the dashboard loads it."""
+    n = make_synthetic_network(SIZES[size_name])
+    ensure_carriers_defined(n)
+    return n
+
+
+@pytest.fixture(scope="session")
+def synthetic_network_path(tmp_path_factory, size_name, synthetic_network):
+    """The synthetic network exported to netCDF."""
+    path = tmp_path_factory.mktemp("networks") / f"{size_name}.nc"
+    synthetic_network.export_to_netcdf(path)
+    return str(path)
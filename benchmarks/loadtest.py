@@ -0,0 +1,424 @@
+"""
+Concurrent-user load test replaying realistic Dash callback sequences.
+
+Every virtual user opens the dashboard, selects a network, toggles carriers,
+switches through the tabs, opens the data explorer and toggles the theme. The
+harness speaks Dash's HTTP protocol: it reads the callback graph from
+``/_dash-dependencies`` and the initial component state from ``/_dash-layout``,
+fires the callbacks a browser would fire for each interaction and follows the
+chains of callbacks triggered by their outputs. It runs against the in-process
+Flask test client or a running server::
+
+    python -m benchmarks.loadtest network.nc --users 20 --iterations 3
+    python -m benchmarks.loadtest --url http://127.0.0.1:8050 --users 50
+
+Without network files, a synthetic network of the ``--size`` preset is served.
+"""
+
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Annotated, Any, Protocol
+
+import numpy as np
+import typer
+from rich.console import Console
+from rich.table import Table
+
+# Tabs visited by every user, in order
+TABS = ("energy-balance", "energy-balance-aggregated", "capacity", "capex", "opex", "comparison", "network-config")
+
+# Inputs of the chart tabs, forwarded to the server as a chart request by a clientside callback
+CHART_FILTER_PROPS = (
+    ("global-carrier-selector", "value"),
+    ("global-country-mode", "value"),
+    ("global-country-selector", "value"),
+    ("network-selector", "data"),
+    ("tabs", "value"),
+    ("dark-mode-store", "data"),
+)
+
+# Maximum length of a chain of callbacks triggered by outputs of other callbacks
+MAX_CHAIN_DEPTH = 4
+
+Prop = tuple[str, str]
+
+
+class Transport(Protocol):
+    """Minimal HTTP interface shared by the Flask test client and a live server."""
+
+    def get_json(self, path: str) -> Any: ...
+
+    def post_json(self, path: str, payload: dict[str, Any]) -> tuple[int, Any]: ...
+
+
+class FlaskTransport:
+    """Requests served in-process by a Flask test client."""
+
+    def __init__(self, server: Any) -> None:
+        self._client = server.test_client()
+
+    def get_json(self, path: str) -> Any:
+        return self._client.get(path).get_json()
+
+    def post_json(self, path: str, payload: dict[str, Any]) -> tuple[int, Any]:
+        response = self._client.post(path, json=payload)
+        return response.status_code, response.get_json(silent=True)
+
+
+class HttpTransport:
+    """Requests sent to a running server."""
+
+    def __init__(self, url: str) -> None:
+        import requests
+
+        self._url = url.rstrip("/")
+        self._session = requests.Session()
+
+    def get_json(self, path: str) -> Any:
+        response = self._session.get(self._url + path, timeout=60)
+        response.raise_for_status()
+        return response.json()
+
+    def post_json(self, path: str, payload: dict[str, Any]) -> tuple[int, Any]:
+        response = self._session.post(self._url + path, json=payload, timeout=300)
+        return response.status_code, response.json() if response.content else None
+
+
+@dataclass
+class Callback:
+    """A server-side callback as described by ``/_dash-dependencies``."""
+
+    output: str
+    outputs: list[Prop]
+    inputs: list[Prop]
+    state: list[Prop]
+    prevent_initial_call: bool
+
+    @property
+    def name(self) -> str:
+        """Short name: the first output as ``id.property``."""
+        return ".".join(self.outputs[0])
+
+
+def _parse_prop(spec: str) -> Prop:
+    component_id, prop = spec.rsplit(".", 1)
+    return component_id, prop
+
+
+def parse_dependencies(dependencies: list[dict[str, Any]]) -> list[Callback]:
+    """
+    Extract the callbacks the harness can fire.
+
+    Clientside callbacks run in the browser and pattern-matching callbacks need
+    wildcard resolution; both are skipped.
+    """
+    callbacks = []
+    for dep in dependencies:
+        output = dep["output"]
+        specs = output[2:-2].split("...") if output.startswith("..") else [output]
+        if dep.get("clientside_function") or "{" in output:
+            continue
+        inputs = [(item["id"], item["property"]) for item in dep["inputs"]]
+        state = [(item["id"], item["property"]) for item in dep.get("state", [])]
+        if any(not isinstance(component_id, str) for component_id, _ in inputs + state):
+            continue
+        callbacks.append(
+            Callback(
+                output=output,
+                outputs=[_parse_prop(spec) for spec in specs],
+                inputs=inputs,
+                state=state,
+                prevent_initial_call=bool(dep.get("prevent_initial_call")),
+            )
+        )
+    return callbacks
+
+
+def layout_state(node: Any) -> dict[Prop, Any]:
+    """Collect the initial ``(id, property) -> value`` state of a serialized layout."""
+    state: dict[Prop, Any] = {}
+
+    def walk(item: Any) -> None:
+        if isinstance(item, list):
+            for child in item:
+                walk(child)
+        elif isinstance(item, dict) and "props" in item:
+            props = item["props"]
+            component_id = props.get("id")
+            if isinstance(component_id, str):
+                for prop, value in props.items():
+                    state[(component_id, prop)] = value
+            walk(props.get("children"))
+
+    walk(node)
+    return state
+
+
+@dataclass
+class Sample:
+    """Outcome of one callback request."""
+
+    callback: str
+    step: str
+    latency: float
+    status: int
+
+
+@dataclass
+class LoadTestResult:
+    """Samples of a load test run."""
+
+    samples: list[Sample] = field(default_factory=list)
+    duration: float = 0.0
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return count, errors, latency percentiles (ms) and throughput per callback and overall."""
+        groups: dict[str, list[Sample]] = defaultdict(list)
+        for sample in self.samples:
+            groups[sample.callback].append(sample)
+        groups["TOTAL"] = self.samples
+
+        summary = {}
+        for name, samples in groups.items():
+            latencies = np.array([s.latency for s in samples]) * 1000 if samples else np.zeros(1)
+            summary[name] = {
+                "count": len(samples),
+                "errors": sum(s.status >= 400 for s in samples),
+                "p50_ms": float(np.percentile(latencies, 50)),
+                "p95_ms": float(np.percentile(latencies, 95)),
+                "p99_ms": float(np.percentile(latencies, 99)),
+                "throughput_rps": len(samples) / self.duration if self.duration else 0.0,
+            }
+        return summary
+
+
+class VirtualUser:
+    """One browser session firing callbacks for a sequence of interactions."""
+
+    def __init__(self, transport: Transport, callbacks: list[Callback], initial_state: dict[Prop, Any], seed: int):
+        self.transport = transport
+        self.callbacks = callbacks
+        self.state = dict(initial_state)
+        self.random = random.Random(seed)
+        self.samples: list[Sample] = []
+        # Chart requests are numbered per session, as the browser's figure cache does
+        self.session = f"loadtest-{seed}"
+        self._sequence = 0
+        self._by_input: dict[Prop, list[Callback]] = defaultdict(list)
+        for callback in callbacks:
+            for prop in callback.inputs:
+                self._by_input[prop].append(callback)
+
+    def _request(self, callback: Callback, changed: list[Prop], step: str) -> dict[Prop, Any]:
+        outputs = [{"id": component_id, "property": prop} for component_id, prop in callback.outputs]
+        payload = {
+            "output": callback.output,
+            "outputs": outputs if callback.output.startswith("..") else outputs[0],
+            "inputs": [{"id": i, "property": p, "value": self.state.get((i, p))} for i, p in callback.inputs],
+            "state": [{"id": i, "property": p, "value": self.state.get((i, p))} for i, p in callback.state],
+            "changedPropIds": [f"{i}.{p}" for i, p in changed],
+        }
+        start = time.perf_counter()
+        status, body = self.transport.post_json("/_dash-update-component", payload)
+        self.samples.append(Sample(callback.name, step, time.perf_counter() - start, status))
+
+        updates: dict[Prop, Any] = {}
+        if status == 200 and isinstance(body, dict):
+            for component_id, props in body.get("response", {}).items():
+                for prop, value in props.items():
+                    updates[(component_id, prop)] = value
+        return updates
+
+    def fire(self, step: str, changes: dict[Prop, Any] | None = None) -> None:
+        """
+        Apply ``changes`` and run the callbacks they trigger, following output chains.
+
+        Without changes, all callbacks without ``prevent_initial_call`` fire, as on page load.
+        """
+        if changes is None:
+            wave = [(callback, []) for callback in self.callbacks if not callback.prevent_initial_call]
+        else:
+            changes = {**changes, **self._clientside_updates(changes)}
+            self.state.update(changes)
+            wave = self._triggered(list(changes))
+
+        for _ in range(MAX_CHAIN_DEPTH):
+            if not wave:
+                break
+            updates: dict[Prop, Any] = {}
+            for callback, changed in wave:
+                updates.update(self._request(callback, changed, step))
+            updates.update(self._clientside_updates(updates))
+            self.state.update(updates)
+            wave = self._triggered(list(updates))
+
+    def _clientside_updates(self, changes: dict[Prop, Any]) -> dict[Prop, Any]:
+        """
+        Outputs of the clientside callbacks the browser would run for ``changes``.
+
+        The theme toggle sets the store the charts follow, and every filter change
+        is a miss of the browser's figure cache, so the chart tab is requested.
+        """
+        state = {**self.state, **changes}
+        updates: dict[Prop, Any] = {}
+        if ("dark-mode-toggle", "value") in changes:
+            updates[("dark-mode-store", "data")] = "dark" in (changes[("dark-mode-toggle", "value")] or [])
+        if any(prop in changes for prop in CHART_FILTER_PROPS) or updates:
+            state.update(updates)
+            self._sequence += 1
+            updates[("chart-request", "data")] = {
+                "session": self.session,
+                "sequence": self._sequence,
+                "tab": state.get(("tabs", "value")),
+                "network": state.get(("network-selector", "data")),
+                "carriers": state.get(("global-carrier-selector", "value")) or [],
+                "country_mode": state.get(("global-country-mode", "value")),
+                "countries": state.get(("global-country-selector", "value")) or [],
+                "dark": bool(state.get(("dark-mode-store", "data"))),
+            }
+        return updates
+
+    def _triggered(self, changed: list[Prop]) -> list[tuple[Callback, list[Prop]]]:
+        triggered: dict[int, tuple[Callback, list[Prop]]] = {}
+        for prop in changed:
+            for callback in self._by_input.get(prop, []):
+                triggered.setdefault(id(callback), (callback, []))[1].append(prop)
+        return list(triggered.values())
+
+    def run_session(self, network_labels: list[str]) -> None:
+        """Replay one full session of dashboard interactions."""
+        self.fire("open dashboard")
+        if network_labels:
+            self.fire("select network", {("network-selector", "data"): self.random.choice(network_labels)})
+
+        options = self.state.get(("global-carrier-selector", "options")) or []
+        values = [option["value"] if isinstance(option, dict) else option for option in options]
+        if values:
+            subset = self.random.sample(values, k=self.random.randint(1, len(values)))
+            self.fire("toggle carriers", {("global-carrier-selector", "value"): subset})
+
+        for tab in TABS:
+            self.fire("switch tab", {("tabs", "value"): tab})
+
+        self.fire("open data explorer", {("kpi-card-generators", "n_clicks"): 1})
+        self.fire("close data explorer", {("close-data-explorer-modal", "n_clicks"): 1})
+
+        self.fire("toggle theme", {("dark-mode-toggle", "value"): ["dark"]})
+        self.fire("toggle theme", {("dark-mode-toggle", "value"): []})
+
+
+def run_load_test(
+    transport_factory: Any,
+    *,
+    users: int = 10,
+    iterations: int = 1,
+    seed: int = 0,
+) -> LoadTestResult:
+    """
+    Run ``users`` concurrent virtual users, each replaying ``iterations`` sessions.
+
+    Parameters
+    ----------
+    transport_factory : callable
+        Returns a new :class:`Transport`; every user gets its own
+    users : int
+        Number of concurrent users
+    iterations : int
+        Sessions per user
+    seed : int
+        Seed for the random choices of the users
+
+    Returns
+    -------
+    LoadTestResult
+        All callback samples and the wall time of the run
+    """
+    probe = transport_factory()
+    callbacks = parse_dependencies(probe.get_json("/_dash-dependencies"))
+    initial_state = layout_state(probe.get_json("/_dash-layout"))
+    registry = initial_state.get(("network-registry", "data")) or {}
+    network_labels = list(registry.get("order", []))
+
+    result = LoadTestResult()
+    lock = threading.Lock()
+    barrier = threading.Barrier(users)
+
+    def run_user(index: int) -> None:
+        user = VirtualUser(transport_factory(), callbacks, initial_state, seed + index)
+        barrier.wait()
+        for _ in range(iterations):
+            user.run_session(network_labels)
+        with lock:
+            result.samples.extend(user.samples)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(users) as pool:
+        for future in [pool.submit(run_user, i) for i in range(users)]:
+            future.result()
+    result.duration = time.perf_counter() - start
+    return result
+
+
+def in_process_transport_factory(networks: list[str], size: str = "medium", cache: str | None = None) -> Any:
+    """Create a dashboard app in this process and return a factory of test-client transports."""
+    from pypsa_explorer.app import create_app
+    from pypsa_explorer.utils.network_loader import parse_cli_network_args
+
+    if networks:
+        networks_input: dict[str, Any] = dict(parse_cli_network_args(networks))
+    else:
+        from benchmarks.synthetic import SIZES, make_synthetic_network
+
+        networks_input = {f"synthetic-{size}": make_synthetic_network(SIZES[size])}
+    app = create_app(networks_input, cache_backend=cache)
+    return lambda: FlaskTransport(app.server)
+
+
+def print_summary(result: LoadTestResult, console: Console) -> None:
+    """Print the per-callback latency table."""
+    table = Table(title=f"Load test: {len(result.samples)} requests in {result.duration:.1f}s")
+    for column in ("Callback", "Count", "Errors", "p50 ms", "p95 ms", "p99 ms", "req/s"):
+        table.add_column(column, justify="left" if column == "Callback" else "right", overflow="fold")
+    for name, stats in sorted(result.summary().items(), key=lambda item: (item[0] == "TOTAL", item[0])):
+        table.add_row(
+            name,
+            str(stats["count"]),
+            str(stats["errors"]),
+            f"{stats['p50_ms']:.1f}",
+            f"{stats['p95_ms']:.1f}",
+            f"{stats['p99_ms']:.1f}",
+            f"{stats['throughput_rps']:.1f}",
+        )
+    console.print(table)
+
+
+def main(
+    networks: Annotated[list[str] | None, typer.Argument(help="Network files (path or path:label)")] = None,
+    url: Annotated[str | None, typer.Option(help="Test a running server instead of an in-process app")] = None,
+    users: Annotated[int, typer.Option(help="Number of concurrent users")] = 10,
+    iterations: Annotated[int, typer.Option(help="Sessions per user")] = 1,
+    size: Annotated[str, typer.Option(help="Synthetic network preset when no files are given")] = "medium",
+    cache: Annotated[str | None, typer.Option(help="Result cache backend of the in-process app")] = None,
+    seed: Annotated[int, typer.Option(help="Random seed")] = 0,
+    json_output: Annotated[str | None, typer.Option("--json", help="Also write the summary to this JSON file")] = None,
+) -> None:
+    """Replay concurrent dashboard sessions and report callback latency percentiles and throughput."""
+    if url is not None:
+        result = run_load_test(lambda: HttpTransport(url), users=users, iterations=iterations, seed=seed)
+    else:
+        factory = in_process_transport_factory(networks or [], size, cache)
+        result = run_load_test(factory, users=users, iterations=iterations, seed=seed)
+
+    print_summary(result, Console())
+    if json_output:
+        with open(json_output, "w") as f:
+            json.dump({"duration_s": result.duration, "callbacks": result.summary()}, f, indent=2)
+
+
+if __name__ == "__main__":
+    typer.run(main)
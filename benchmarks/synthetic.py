@@ -0,0 +1,136 @@
+"""Synthetic solved PyPSA networks of configurable size for benchmarks and load tests."""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import pypsa
+
+# Country codes assigned round-robin to buses (a real subset keeps maps and filters realistic)
+COUNTRIES = (
+    "DE", "FR", "PL", "ES", "IT", "NL", "BE", "AT", "CZ", "DK",
+    "SE", "NO", "FI", "PT", "GR", "HU", "RO", "BG", "SK", "IE",
+)  # fmt: skip
+
+# Generation carriers in the order they are added
+CARRIERS = ("wind", "solar", "gas", "coal", "nuclear", "hydro", "biomass", "oil")
+
+
+@dataclass(frozen=True)
+class NetworkSize:
+    """Dimensions of a synthetic network."""
+
+    buses: int
+    countries: int
+    carriers: int
+    snapshots: int
+    links: int
+
+
+# Preset sizes used by the benchmarks; "large" resembles a reduced European model
+SIZES = {
+    "small": NetworkSize(buses=10, countries=3, carriers=3, snapshots=24, links=10),
+    "medium": NetworkSize(buses=100, countries=10, carriers=6, snapshots=168, links=100),
+    "large": NetworkSize(buses=300, countries=20, carriers=8, snapshots=2190, links=300),
+}
+
+
+def make_synthetic_network(size: NetworkSize, seed: int = 0) -> pypsa.Network:
+    """
+    Create a network that looks solved without running an optimization.
+
+    Every bus gets one generator per carrier and a load; buses are connected in a
+    ring of AC lines and by DC links between random bus pairs. Dispatch and flow
+    time series are drawn at random, optimal capacities equal nominal capacities.
+    Carriers are added without colors, as in many solver outputs.
+
+    Parameters
+    ----------
+    size : NetworkSize
+        Number of buses, countries, carriers, snapshots and links
+    seed : int
+        Seed of the random number generator
+
+    Returns
+    -------
+    pypsa.Network
+        The synthetic network
+    """
+    rng = np.random.default_rng(seed)
+    n = pypsa.Network()
+    n.set_snapshots(pd.date_range("2030-01-01", periods=size.snapshots, freq="h"))
+    n_snapshots = size.snapshots
+
+    carriers = list(CARRIERS[: size.carriers])
+    n.add("Carrier", ["AC", "DC", "load", *carriers])
+
+    buses = pd.Index([f"bus{i}" for i in range(size.buses)])
+    countries = [COUNTRIES[i % min(size.countries, len(COUNTRIES))] for i in range(size.buses)]
+    n.add(
+        "Bus",
+        buses,
+        carrier="AC",
+        country=countries,
+        x=rng.uniform(-10, 30, size.buses),
+        y=rng.uniform(36, 70, size.buses),
+    )
+
+    dispatch = []
+    for carrier in carriers:
+        names = buses + f" {carrier}"
+        p_nom = rng.uniform(50, 500, size.buses)
+        n.add(
+            "Generator",
+            names,
+            bus=buses,
+            carrier=carrier,
+            p_nom=p_nom,
+            p_nom_opt=p_nom,
+            marginal_cost=rng.uniform(0, 100),
+            capital_cost=rng.uniform(1e4, 1e5),
+        )
+        dispatch.append(pd.DataFrame(rng.uniform(0, 1, (n_snapshots, size.buses)) * p_nom, n.snapshots, names))
+    n.generators_t["p"] = pd.concat(dispatch, axis=1)
+
+    loads = buses + " load"
+    n.add("Load", loads, bus=buses, carrier="load")
+    n.loads_t.p_set[loads] = rng.uniform(100, 800, (n_snapshots, size.buses))
+    n.loads_t.p[loads] = n.loads_t.p_set[loads]
+
+    if size.buses > 1:
+        lines = pd.Index([f"line{i}" for i in range(size.buses)])
+        s_nom = rng.uniform(500, 2000, size.buses)
+        n.add(
+            "Line",
+            lines,
+            bus0=buses,
+            bus1=np.roll(buses, -1),
+            x=0.1,
+            r=0.01,
+            s_nom=s_nom,
+            s_nom_opt=s_nom,
+            capital_cost=rng.uniform(100, 1000),
+        )
+        n.lines_t.p0[lines] = rng.uniform(-1, 1, (n_snapshots, size.buses)) * s_nom
+        n.lines_t.p1[lines] = -n.lines_t.p0[lines]
+
+    if size.links and size.buses > 1:
+        links = pd.Index([f"link{i}" for i in range(size.links)])
+        bus0 = rng.integers(0, size.buses, size.links)
+        bus1 = (bus0 + rng.integers(1, size.buses, size.links)) % size.buses
+        p_nom = rng.uniform(100, 1000, size.links)
+        n.add(
+            "Link",
+            links,
+            bus0=buses[bus0],
+            bus1=buses[bus1],
+            carrier="DC",
+            p_nom=p_nom,
+            p_nom_opt=p_nom,
+            p_min_pu=-1,
+            capital_cost=rng.uniform(100, 1000),
+        )
+        n.links_t.p0[links] = rng.uniform(-1, 1, (n_snapshots, size.links)) * p_nom
+        n.links_t.p1[links] = -n.links_t.p0[links]
+
+    return n
@@ -0,0 +1,24 @@
+"""Benchmarks of the data explorer table conversions."""
+
+import pytest
+
+from pypsa_explorer.utils.data_table import dataframe_to_datatable, get_timeseries_attributes
+
+
+@pytest.mark.parametrize("component", ["buses", "generators"])
+def test_dataframe_to_datatable_static(benchmark, synthetic_network, component):
+    """Convert a component table to DataTable records."""
+    data, columns = benchmark(dataframe_to_datatable, getattr(synthetic_network, component))
+    assert data and columns
+
+
+def test_dataframe_to_datatable_timeseries(benchmark, synthetic_network):
+    """Convert (and sample) the generator dispatch time series."""
+    data, _ = benchmark(dataframe_to_datatable, synthetic_network.generators_t.p)
+    assert len(data) <= 5000 + 1
+
+
+def test_get_timeseries_attributes(benchmark, synthetic_network):
+    """List the time-varying attributes of generators."""
+    attributes = benchmark(get_timeseries_attributes, synthetic_network, "generators")
+    assert "p" in attributes
@@ -0,0 +1,27 @@
+"""Benchmarks of network loading and carrier preparation."""
+
+from pypsa_explorer.utils.fingerprint import compute_network_fingerprint
+from pypsa_explorer.utils.network_loader import ensure_carriers_defined, load_networks
+
+
+def test_load_networks(benchmark, synthetic_network_path):
+    """Read a network file, including the carrier check."""
+    networks = benchmark(load_networks, {"bench": synthetic_network_path})
+    assert "bench" in networks
+
+
+def test_ensure_carriers_defined(benchmark, synthetic_network):
+    """Add missing carriers and assign colors to a network without colors."""
+
+    def setup():
+        n = synthetic_network.copy()
+        n.carriers["color"] = ""
+        return (n,), {}
+
+    benchmark.pedantic(ensure_carriers_defined, setup=setup, rounds=5)
+
+
+def test_network_fingerprint(benchmark, synthetic_network):
+    """Hash the component tables and time series of a network."""
+    fingerprint = benchmark(compute_network_fingerprint, synthetic_network)
+    assert len(fingerprint) == 32
@@ -0,0 +1,20 @@
+"""Smoke test of the load-test harness against an in-process dashboard."""
+
+from benchmarks.loadtest import in_process_transport_factory, run_load_test
+
+
+def test_load_test_replays_sessions():
+    """Concurrent sessions hit every chart callback without errors."""
+    factory = in_process_transport_factory([], size="small")
+    result = run_load_test(factory, users=2, iterations=1)
+
+    summary = result.summary()
+    assert summary["TOTAL"]["errors"] == 0
+    assert summary["TOTAL"]["count"] == len(result.samples) > 0
+    for callback in (
+        "energy-balance-charts-container.children",
+        "network-map.srcDoc",
+        "data-explorer-modal.is_open",
+    ):
+        assert summary[callback]["count"] > 0
+        assert summary[callback]["p50_ms"] <= summary[callback]["p99_ms"]
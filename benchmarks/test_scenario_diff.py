@@ -0,0 +1,25 @@
+"""Benchmarks of the scenario diffing engine."""
+
+import pytest
+
+from benchmarks.synthetic import SIZES, make_synthetic_network
+from pypsa_explorer.utils.cache import ResultCache
+from pypsa_explorer.utils.network_loader import ensure_carriers_defined
+from pypsa_explorer.utils.scenario_diff import diff_networks
+
+
+@pytest.fixture(scope="session")
+def other_scenario(size_name):
+    """A second synthetic network of the same size with different dispatch and capacities."""
+    n = make_synthetic_network(SIZES[size_name], seed=1)
+    ensure_carriers_defined(n)
+    return n
+
+
+def test_diff_networks(benchmark, synthetic_network, other_scenario):
+    """Per-asset and per-carrier differences, with the carrier statistics already cached."""
+    cache = ResultCache()
+    diff_networks(synthetic_network, other_scenario, cache=cache)
+
+    diff = benchmark(diff_networks, synthetic_network, other_scenario, cache=cache)
+    assert len(diff.top_assets(10)) == 10
@@ -0,0 +1,100 @@
+"""Benchmarks of chart and map rendering with a cold result cache."""
+
+import contextvars
+
+import dash
+import pytest
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+
+from pypsa_explorer.callbacks import register_all_callbacks
+from pypsa_explorer.callbacks.visualizations import (
+    build_capacity_figure,
+    build_energy_balance_figure,
+    build_expenditure_figure,
+)
+from pypsa_explorer.utils.cache import ResultCache
+
+# Country filters exercised by every chart benchmark
+COUNTRY_FILTERS = {
+    "all": {"country_mode": "All", "selected_countries": []},
+    "two-countries": {"country_mode": "Specific", "selected_countries": ["DE", "FR"]},
+}
+
+
+def _cold(benchmark, build, *args, **kwargs):
+    """Time ``build`` with an empty cache in every round."""
+
+    def setup():
+        return args, {**kwargs, "cache": ResultCache()}
+
+    return benchmark.pedantic(build, setup=setup, rounds=5)
+
+
+@pytest.mark.parametrize("country_filter", COUNTRY_FILTERS)
+@pytest.mark.parametrize("aggregated", [False, True], ids=["timeseries", "aggregated"])
+def test_energy_balance(benchmark, synthetic_network, aggregated, country_filter):
+    """Energy balance chart of the timeseries and totals tabs (``update_active_tab_charts``)."""
+    figure, _ = _cold(
+        benchmark,
+        build_energy_balance_figure,
+        synthetic_network,
+        "bench",
+        "AC",
+        aggregated=aggregated,
+        **COUNTRY_FILTERS[country_filter],
+    )
+    assert figure["data"]
+
+
+@pytest.mark.parametrize("country_filter", COUNTRY_FILTERS)
+def test_capacity(benchmark, synthetic_network, country_filter):
+    """Optimal capacity chart of the capacity tab (``update_active_tab_charts``)."""
+    figure, _ = _cold(benchmark, build_capacity_figure, synthetic_network, "bench", "AC", **COUNTRY_FILTERS[country_filter])
+    assert figure["data"]
+
+
+@pytest.mark.parametrize("country_filter", COUNTRY_FILTERS)
+@pytest.mark.parametrize("statistic", ["capex", "opex"])
+def test_expenditure(benchmark, synthetic_network, statistic, country_filter):
+    """CAPEX and OPEX charts of the expenditure tabs (``update_active_tab_charts``)."""
+    figure, _ = _cold(
+        benchmark, build_expenditure_figure, synthetic_network, "bench", statistic, **COUNTRY_FILTERS[country_filter]
+    )
+    assert figure["data"]
+
+
+def _in_callback_context(func, *args, triggered):
+    """Call a Dash callback function as if ``triggered`` had fired it."""
+
+    def run():
+        context_value.set(
+            AttributeDict(
+                triggered_inputs=[{"prop_id": triggered, "value": None}],
+                inputs_list=[],
+                states_list=[],
+                outputs_list=[],
+            )
+        )
+        return func(*args)
+
+    return contextvars.copy_context().run(run)
+
+
+def test_update_map(benchmark, synthetic_network):
+    """Folium network map (``update_map``) with a cold cache."""
+    app = dash.Dash(__name__)
+    cache = ResultCache()
+    register_all_callbacks(app, {"bench": synthetic_network}, default_network_path="", cache=cache)
+    update_map = next(
+        entry["callback"].__wrapped__
+        for entry in app.callback_map.values()
+        if "callback" in entry and entry["callback"].__wrapped__.__name__ == "update_map"
+    )
+
+    def setup():
+        cache.clear()
+        return (update_map, None, "bench"), {"triggered": "network-selector.data"}
+
+    html = benchmark.pedantic(_in_callback_context, setup=setup, rounds=3)
+    assert "unavailable" not in html
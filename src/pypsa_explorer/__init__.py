@@ -9,8 +9,19 @@ __version__ = "0.1.0"
 __author__ = "Open Energy Transition"
 __email__ = "info@openenergytransition.org"
 
-from pypsa_explorer.app import create_app, run_dashboard
-from pypsa_explorer.utils.network_loader import load_networks
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pypsa_explorer.app import create_app, run_dashboard
+    from pypsa_explorer.utils.network_loader import load_networks
+
+# Public names and the modules providing them. They are imported on first access
+# (PEP 562) so that ``pypsa-explorer --version`` does not load dash and pypsa.
+_LAZY_ATTRIBUTES = {
+    "create_app": "pypsa_explorer.app",
+    "run_dashboard": "pypsa_explorer.app",
+    "load_networks": "pypsa_explorer.utils.network_loader",
+}
 
 __all__ = [
     "create_app",
@@ -18,3 +29,13 @@ __all__ = [
     "load_networks",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
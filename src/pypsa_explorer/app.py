@@ -1,15 +1,20 @@
 """Main application module for PyPSA Explorer dashboard."""
 
 import dash
-import dash_bootstrap_components as dbc
 import pypsa
 import pypsa.consistency
 
 from pypsa_explorer.callbacks import register_all_callbacks
+from pypsa_explorer.callbacks.visualizations import warm_chart_cache
 from pypsa_explorer.config import get_html_template, setup_plotly_theme
 from pypsa_explorer.layouts.dashboard import create_dashboard_layout
-from pypsa_explorer.utils.helpers import resolve_default_network_path
-from pypsa_explorer.utils.network_loader import load_networks
+from pypsa_explorer.utils.cache import ResultCache, create_cache_backend
+from pypsa_explorer.utils.helpers import describe_network, resolve_default_network_path
+from pypsa_explorer.utils.http import StaticAssets, install_compression
+from pypsa_explorer.utils.metrics import CallbackMetrics
+from pypsa_explorer.utils.network_loader import LazyNetworks, load_networks
+from pypsa_explorer.utils.network_watcher import NetworkWatcher
+from pypsa_explorer.utils.profiling import CallbackProfiler
 
 
 def create_app(
@@ -19,6 +24,15 @@ def create_app(
     *,
     load_default_on_start: bool = True,
     default_network_path: str = "demo-network.nc",
+    watch_dir: str | None = None,
+    watch_interval: float = 2.0,
+    warm_cache: bool = False,
+    cache_backend: str | None = None,
+    log_metrics: bool = False,
+    callback_metrics: CallbackMetrics | None = None,
+    profile_dir: str | None = None,
+    compress: bool = True,
+    chart_deadline: float | None = None,
 ) -> dash.Dash:
     """
     Create and configure the Dash application.
@@ -39,6 +53,33 @@ def create_app(
         When ``False`` start without networks and rely on runtime uploads or sample loading.
     default_network_path : str
         Filesystem path to the bundled demo network used when loading the example network.
+    watch_dir : str, optional
+        Directory whose ``.nc`` files are indexed and registered as lazily loaded networks.
+        New files appear in the dashboard while it runs and modified files are reloaded.
+    watch_interval : float
+        Minimum number of seconds between two scans of ``watch_dir``
+    warm_cache : bool
+        Precompute the statistics and figures of all loaded networks before serving.
+        Lazily registered networks of ``watch_dir`` are not loaded for this.
+    cache_backend : str, optional
+        Where computed statistics, figures and maps are stored (see
+        :func:`~pypsa_explorer.utils.cache.create_cache_backend`). ``"shm"`` or a
+        directory share the results between all processes of a multi-worker server.
+        Defaults to an in-process memory cache.
+    log_metrics : bool
+        Log one JSON line with the timings and payload size of every data callback request
+    callback_metrics : CallbackMetrics, optional
+        Collector for the callback timings served at ``/metrics``; created when omitted
+    profile_dir : str, optional
+        Write a cProfile profile and flamegraph-ready folded stacks of every data
+        callback invocation to this directory
+    compress : bool
+        Compress the page, callback and script responses with brotli (when installed)
+        or gzip; disable when a reverse proxy compresses responses
+    chart_deadline : float, optional
+        Seconds a chart request may take: past it, the charts that are done are
+        returned with placeholders for the rest, which are finished in the
+        background to fill the cache. No deadline when omitted.
 
     Returns
     -------
@@ -52,34 +93,62 @@ def create_app(
     default_path_str = str(resolved_default_path) if resolved_default_path else default_network_path
 
     # Load networks while allowing empty start states
-    if networks_input is None and not load_default_on_start:
+    if networks_input is None and (watch_dir is not None or not load_default_on_start):
         networks: dict[str, pypsa.Network] = {}
     else:
         networks = load_networks(networks_input, default_network_path=default_path_str)
 
+    cache = ResultCache(create_cache_backend(cache_backend))
+    watcher: NetworkWatcher | None = None
+    networks_info: dict | None = None
+    if watch_dir is not None:
+        # Index the watched directory from file headers; networks load on first access
+        networks = LazyNetworks(networks)
+        watcher = NetworkWatcher(watch_dir, networks, cache=cache, poll_interval=watch_interval)
+        watcher.scan(force=True)
+        networks_info = {label: describe_network(n) for label, n in networks.items()}
+        networks_info.update(watcher.summaries)
+
+    if warm_cache:
+        for label, n in networks.items():
+            warm_chart_cache(n, label, cache)
+
     # Get the first network as the active network initially (if any)
-    network_labels = list(networks.keys())
+    network_labels = list(networks_info) if networks_info is not None else list(networks.keys())
     active_network_label = network_labels[0] if network_labels else None
 
     # Initialize Dash app
     app = dash.Dash(
         __name__,
-        external_stylesheets=[dbc.themes.BOOTSTRAP],
         title=title,
     )
 
-    # Set custom HTML template with embedded CSS
-    app.index_string = get_html_template()
+    if compress:
+        install_compression(app.server)
+
+    # Serve Bootstrap, the icon font and the dashboard CSS locally under content-hashed, immutable URLs
+    app.index_string = get_html_template(StaticAssets().install(app))
 
     # Create layout
     app.layout = create_dashboard_layout(
         networks,
         active_network_label,
         default_network_path=default_path_str,
+        networks_info=networks_info,
+        watch_interval_ms=int(watch_interval * 1000) if watcher is not None else None,
     )
 
     # Register all callbacks
-    register_all_callbacks(app, networks, default_network_path=default_path_str)
+    register_all_callbacks(
+        app,
+        networks,
+        default_network_path=default_path_str,
+        cache=cache,
+        watcher=watcher,
+        metrics=callback_metrics if callback_metrics is not None else CallbackMetrics(log_requests=log_metrics),
+        profiler=CallbackProfiler(profile_dir) if profile_dir is not None else None,
+        chart_deadline=chart_deadline,
+    )
 
     return app
 
@@ -92,6 +161,11 @@ def run_dashboard(
     *,
     load_default_on_start: bool = True,
     default_network_path: str = "demo-network.nc",
+    watch_dir: str | None = None,
+    cache_backend: str | None = None,
+    log_metrics: bool = False,
+    profile_dir: str | None = None,
+    chart_deadline: float | None = None,
 ) -> None:
     """
     Run the PyPSA Explorer dashboard.
@@ -113,12 +187,27 @@ def run_dashboard(
         Controls whether the bundled demo network loads automatically when ``networks_input`` is ``None``.
     default_network_path : str
         Filesystem path to the bundled demo network used for the sample loader.
+    watch_dir : str, optional
+        Directory to watch for new and modified network files.
+    cache_backend : str, optional
+        Result cache backend: ``"memory"`` (default), ``"shm"``, ``"diskcache:<dir>"`` or a directory.
+    log_metrics : bool
+        Log the timings of every data callback request as a JSON line.
+    profile_dir : str, optional
+        Directory receiving per-callback profiles and folded stacks.
+    chart_deadline : float, optional
+        Seconds after which chart requests return placeholders for unfinished charts.
     """
     app = create_app(
         networks_input,
         debug=debug,
         load_default_on_start=load_default_on_start,
         default_network_path=default_network_path,
+        watch_dir=watch_dir,
+        cache_backend=cache_backend,
+        log_metrics=log_metrics,
+        profile_dir=profile_dir,
+        chart_deadline=chart_deadline,
     )
 
     print(f"Starting PyPSA Explorer Dashboard on http://{host}:{port}")
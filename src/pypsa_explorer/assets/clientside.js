@@ -0,0 +1,45 @@
+/*
+ * Clientside callbacks of the PyPSA Explorer dashboard.
+ *
+ * These callbacks only toggle styles and store values, so they run in the
+ * browser instead of costing a server round trip. Dash serves this file from
+ * the package's assets folder; the functions are registered with
+ * ``ClientsideFunction(CLIENTSIDE_NAMESPACE, ...)`` in ``pypsa_explorer.callbacks``.
+ */
+window.dash_clientside = window.dash_clientside || {};
+window.dash_clientside.pypsa_explorer = Object.assign({}, window.dash_clientside.pypsa_explorer, {
+    /* Enable/disable country selector based on mode, clearing the selection. */
+    toggleGlobalCountrySelector: function (mode) {
+        return [mode === "All", []];
+    },
+
+    /* Hide the carrier selector on the CAPEX/OPEX tabs and remember the active tab. */
+    handleTabSpecificUi: function (activeTab) {
+        if (activeTab === "capex" || activeTab === "opex") {
+            return [{display: "none"}, {display: "block"}, activeTab];
+        }
+        return [{display: "block"}, {display: "none"}, activeTab];
+    },
+
+    /* Manage navigation between welcome page and dashboard. */
+    navigatePages: function (nClicks, pageState, registry) {
+        const noUpdate = window.dash_clientside.no_update;
+        const hasNetwork = Boolean(registry && registry.order && registry.order.length);
+        const currentPage = (pageState || {}).current_page;
+
+        if (nClicks && currentPage === "welcome" && hasNetwork) {
+            return [{display: "none"}, {display: "block"}, {current_page: "dashboard"}, {display: "flex"}];
+        }
+        if (currentPage === "dashboard" && hasNetwork) {
+            return [noUpdate, noUpdate, noUpdate, {display: "flex"}];
+        }
+        // No networks or still on welcome page keeps selector hidden
+        return [noUpdate, noUpdate, noUpdate, {display: "none"}];
+    },
+
+    /* Apply the theme class based on toggle state and update the store. */
+    toggleDarkMode: function (toggleValue) {
+        const isDark = (toggleValue || []).includes("dark");
+        return [isDark ? "dark-mode" : "", isDark];
+    },
+});
@@ -0,0 +1,300 @@
+/*
+ * Browser cache of rendered chart tabs.
+ *
+ * The charts of a tab are stored in IndexedDB under a key of the network
+ * version (its content fingerprint), the tab, the filters and the theme.
+ * ``lookupCharts`` runs before the server is asked to render a tab: on a hit it
+ * shows the stored charts and no request is made. ``storeCharts`` stores the
+ * charts the server rendered. Entries are evicted least recently used first
+ * once their estimated size exceeds the configured budget.
+ *
+ * Server requests carry the page's session identifier and an increasing
+ * sequence number, so the server can cancel the rendering of requests
+ * superseded by a newer one.
+ */
+(function () {
+    const DB_NAME = "pypsa-explorer-figures";
+    const DB_VERSION = 1;
+    const PAYLOADS = "payloads";
+    const ENTRIES = "entries";
+
+    let database = null;
+
+    // Identifies this page to the server, which renders only its latest chart request
+    const SESSION =
+        typeof crypto !== "undefined" && crypto.randomUUID
+            ? crypto.randomUUID()
+            : Date.now().toString(36) + Math.random().toString(36).slice(2);
+    let sequence = 0;
+
+    function openDatabase() {
+        if (typeof indexedDB === "undefined") {
+            return Promise.resolve(null);
+        }
+        if (database === null) {
+            database = new Promise(function (resolve) {
+                const request = indexedDB.open(DB_NAME, DB_VERSION);
+                request.onupgradeneeded = function () {
+                    const db = request.result;
+                    db.createObjectStore(PAYLOADS);
+                    db.createObjectStore(ENTRIES, {keyPath: "key"}).createIndex("accessed", "accessed");
+                };
+                request.onsuccess = function () {
+                    resolve(request.result);
+                };
+                // Private browsing modes may refuse IndexedDB; charts are then always requested
+                request.onerror = request.onblocked = function () {
+                    resolve(null);
+                };
+            });
+        }
+        return database;
+    }
+
+    function result(request) {
+        return new Promise(function (resolve, reject) {
+            request.onsuccess = function () {
+                resolve(request.result);
+            };
+            request.onerror = function () {
+                reject(request.error);
+            };
+        });
+    }
+
+    function completion(transaction) {
+        return new Promise(function (resolve, reject) {
+            transaction.oncomplete = function () {
+                resolve();
+            };
+            transaction.onerror = transaction.onabort = function () {
+                reject(transaction.error);
+            };
+        });
+    }
+
+    /* Estimated size in bytes of a stored value; typed arrays count their buffer size. */
+    function estimateSize(value) {
+        if (value === null || value === undefined || typeof value === "boolean" || typeof value === "number") {
+            return 8;
+        }
+        if (typeof value === "string") {
+            return 2 * value.length;
+        }
+        if (ArrayBuffer.isView(value)) {
+            return value.byteLength;
+        }
+        if (Array.isArray(value)) {
+            return value.reduce(function (total, item) {
+                return total + estimateSize(item);
+            }, 8);
+        }
+        return Object.keys(value).reduce(function (total, key) {
+            return total + 2 * key.length + estimateSize(value[key]);
+        }, 8);
+    }
+
+    /* Keys to evict, least recently used first, until the entries fit ``maxBytes``. */
+    function evictionOrder(entries, maxBytes) {
+        const ordered = entries.slice().sort(function (a, b) {
+            return a.accessed - b.accessed;
+        });
+        let total = ordered.reduce(function (sum, entry) {
+            return sum + entry.size;
+        }, 0);
+        const evicted = [];
+        for (const entry of ordered) {
+            if (total <= maxBytes) {
+                break;
+            }
+            evicted.push(entry.key);
+            total -= entry.size;
+        }
+        return evicted;
+    }
+
+    /* Request of the server-side chart dispatcher for the given filters. */
+    function chartRequest(carriers, countryMode, countries, network, tab, dark) {
+        return {
+            tab: tab,
+            network: network,
+            carriers: carriers || [],
+            country_mode: countryMode,
+            countries: countries || [],
+            dark: Boolean(dark),
+        };
+    }
+
+    function sortedUnique(values) {
+        return Array.from(new Set(values)).sort();
+    }
+
+    function carrierTab(tab, config) {
+        return config.carrierTabs.includes(tab);
+    }
+
+    /*
+     * Cache key of a request, or null when it is not cacheable: when the network
+     * has no known version or the server would show a message instead of charts.
+     */
+    function chartCacheKey(request, registry, config) {
+        const info = ((registry || {}).info || {})[request.network];
+        if (!info) {
+            return null;
+        }
+        // Watched networks are versioned by file and modification time until they are loaded
+        const version = info.fingerprint || (info.source ? info.source + "@" + info.mtime : null);
+        const specific = request.country_mode === "Specific";
+        const carriers = carrierTab(request.tab, config) ? sortedUnique(request.carriers) : null;
+        if (!version || (carriers !== null && !carriers.length) || (specific && !request.countries.length)) {
+            return null;
+        }
+        return JSON.stringify([
+            config.version,
+            version,
+            request.tab,
+            request.network,
+            request.country_mode,
+            specific ? request.countries : null,
+            request.dark,
+            carriers,
+        ]);
+    }
+
+    /* Whether a tab's render state (see ``carrier_chart_render_key``) shows the charts of a request. */
+    function rendersRequest(state, request, config) {
+        if (!state || !state.key || state.partial) {
+            return false;
+        }
+        const label = state.key[0];
+        const countryMode = state.key[2];
+        const countries = state.key[3];
+        const dark = state.key[4];
+        const specific = request.country_mode === "Specific";
+        if (label !== request.network || countryMode !== request.country_mode || dark !== request.dark) {
+            return false;
+        }
+        if (JSON.stringify(countries) !== JSON.stringify(specific ? request.countries : null)) {
+            return false;
+        }
+        if (!carrierTab(request.tab, config)) {
+            return state.carriers === null;
+        }
+        return (
+            Array.isArray(state.carriers) &&
+            JSON.stringify(sortedUnique(state.carriers)) === JSON.stringify(sortedUnique(request.carriers))
+        );
+    }
+
+    async function getCharts(key) {
+        const db = await openDatabase();
+        if (db === null) {
+            return null;
+        }
+        const transaction = db.transaction([PAYLOADS, ENTRIES], "readwrite");
+        const done = completion(transaction);
+        const payload = await result(transaction.objectStore(PAYLOADS).get(key));
+        if (payload !== undefined) {
+            const entries = transaction.objectStore(ENTRIES);
+            const entry = await result(entries.get(key));
+            if (entry) {
+                entries.put(Object.assign({}, entry, {accessed: Date.now()}));
+            }
+        }
+        await done;
+        return payload === undefined ? null : payload;
+    }
+
+    async function putCharts(key, payload, maxBytes) {
+        const size = estimateSize(payload);
+        const db = size <= maxBytes ? await openDatabase() : null;
+        if (db === null) {
+            return;
+        }
+        const transaction = db.transaction([PAYLOADS, ENTRIES], "readwrite");
+        const done = completion(transaction);
+        const payloads = transaction.objectStore(PAYLOADS);
+        const entries = transaction.objectStore(ENTRIES);
+        payloads.put(payload, key);
+        entries.put({key: key, size: size, accessed: Date.now()});
+        for (const evicted of evictionOrder(await result(entries.getAll()), maxBytes)) {
+            payloads.delete(evicted);
+            entries.delete(evicted);
+        }
+        await done;
+    }
+
+    const dc = (window.dash_clientside = window.dash_clientside || {});
+    dc.pypsa_explorer = Object.assign({}, dc.pypsa_explorer, {
+        figureCache: {
+            estimateSize: estimateSize,
+            evictionOrder: evictionOrder,
+            chartCacheKey: chartCacheKey,
+            rendersRequest: rendersRequest,
+        },
+
+        /*
+         * Show the charts of the active tab from the browser cache, or ask the
+         * server to render them. Outputs: the chart containers in the order of
+         * ``config.tabs``, the render states of the tabs and the server request.
+         */
+        lookupCharts: async function (carriers, countryMode, countries, network, tab, dark, registry, rendered, config) {
+            const noUpdate = window.dash_clientside.no_update;
+            const outputs = config.tabs.map(function () {
+                return noUpdate;
+            });
+            outputs.push(noUpdate, noUpdate);
+            const position = config.tabs.indexOf(tab);
+            if (position < 0) {
+                return outputs;
+            }
+
+            const request = chartRequest(carriers, countryMode, countries, network, tab, dark);
+            const state = (rendered || {})[tab];
+            const info = ((registry || {}).info || {})[network] || {};
+            // The tab shows these charts already
+            if (info.fingerprint && state && state.key[1] === info.fingerprint && rendersRequest(state, request, config)) {
+                return outputs;
+            }
+
+            const key = config.maxBytes > 0 ? chartCacheKey(request, registry, config) : null;
+            let cached = null;
+            if (key !== null) {
+                try {
+                    cached = await getCharts(key);
+                } catch (error) {
+                    cached = null;
+                }
+            }
+            if (cached !== null) {
+                outputs[position] = cached.children;
+                outputs[config.tabs.length] = Object.assign({}, rendered, {[tab]: cached.state});
+            } else {
+                sequence += 1;
+                outputs[config.tabs.length + 1] = Object.assign({session: SESSION, sequence: sequence}, request);
+            }
+            return outputs;
+        },
+
+        /* Store the charts the server rendered for the latest request. */
+        storeCharts: async function (rendered, request, registry, config) {
+            const noUpdate = window.dash_clientside.no_update;
+            const children = Array.prototype.slice.call(arguments, 4);
+            if (!request || !(config.maxBytes > 0)) {
+                return noUpdate;
+            }
+            const position = config.tabs.indexOf(request.tab);
+            const state = (rendered || {})[request.tab];
+            const key = chartCacheKey(request, registry, config);
+            if (position < 0 || key === null || !rendersRequest(state, request, config)) {
+                return noUpdate;
+            }
+            try {
+                await putCharts(key, {children: children[position], state: state}, config.maxBytes);
+            } catch (error) {
+                // A full quota or an unavailable database only disables caching
+            }
+            return noUpdate;
+        },
+    });
+})();
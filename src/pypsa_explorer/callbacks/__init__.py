@@ -1,13 +1,19 @@
 """Callback functions for PyPSA Explorer dashboard interactivity."""
 
+from pypsa_explorer.callbacks.comparison import register_comparison_callbacks
 from pypsa_explorer.callbacks.data_explorer import register_data_explorer_callbacks
 from pypsa_explorer.callbacks.filters import register_filter_callbacks
 from pypsa_explorer.callbacks.navigation import register_navigation_callbacks
 from pypsa_explorer.callbacks.network import register_network_callbacks
 from pypsa_explorer.callbacks.theme import register_theme_callbacks
 from pypsa_explorer.callbacks.visualizations import register_visualization_callbacks
+from pypsa_explorer.utils.cache import ResultCache
+from pypsa_explorer.utils.metrics import CallbackMetrics
+from pypsa_explorer.utils.network_watcher import NetworkWatcher
+from pypsa_explorer.utils.profiling import CallbackProfiler
 
 __all__ = [
+    "register_comparison_callbacks",
     "register_data_explorer_callbacks",
     "register_filter_callbacks",
     "register_navigation_callbacks",
@@ -17,7 +23,17 @@ __all__ = [
 ]
 
 
-def register_all_callbacks(app, networks: dict, *, default_network_path: str) -> None:
+def register_all_callbacks(
+    app,
+    networks: dict,
+    *,
+    default_network_path: str,
+    cache: ResultCache | None = None,
+    watcher: NetworkWatcher | None = None,
+    metrics: CallbackMetrics | None = None,
+    profiler: CallbackProfiler | None = None,
+    chart_deadline: float | None = None,
+) -> None:
     """
     Register all dashboard callbacks.
 
@@ -27,10 +43,35 @@ def register_all_callbacks(app, networks: dict, *, default_network_path: str) ->
         The Dash application instance
     networks : dict
         Dictionary of loaded PyPSA networks
+    cache : ResultCache, optional
+        Cache shared by the statistics, figure, comparison and map callbacks
+    watcher : NetworkWatcher, optional
+        Directory watcher whose files are synced into the network registry
+    metrics : CallbackMetrics, optional
+        Collector timing the network, visualization and data explorer callbacks.
+        Its Prometheus endpoint is served at ``/metrics`` on ``app.server``.
+    profiler : CallbackProfiler, optional
+        Profiler recording every invocation of the timed callbacks
+    chart_deadline : float, optional
+        Seconds after which chart requests return placeholders for the charts
+        that are not done and finish them in the background
     """
+    cache = cache if cache is not None else ResultCache()
+    metrics = metrics if metrics is not None else CallbackMetrics()
+    metrics.install(app.server)
+
     register_filter_callbacks(app)
     register_navigation_callbacks(app)
-    register_network_callbacks(app, networks, default_network_path=default_network_path)
-    register_visualization_callbacks(app, networks)
-    register_data_explorer_callbacks(app, networks)
+    # Time the callbacks that load data, compute statistics or build figures
+    with metrics.instrument(app, wrappers=[profiler.wrap] if profiler is not None else []):
+        register_network_callbacks(
+            app,
+            networks,
+            default_network_path=default_network_path,
+            cache=cache,
+            watcher=watcher,
+        )
+        register_visualization_callbacks(app, networks, cache, chart_deadline=chart_deadline)
+        register_comparison_callbacks(app, networks, cache)
+        register_data_explorer_callbacks(app, networks)
     register_theme_callbacks(app)
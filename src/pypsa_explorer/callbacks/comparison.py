@@ -0,0 +1,242 @@
+"""Scenario comparison callbacks for PyPSA Explorer dashboard."""
+
+from collections.abc import Mapping
+from typing import Any, cast
+
+import dash
+import dash_bootstrap_components as dbc
+import pandas as pd
+import pypsa
+from dash import Input, Output, State, dcc, html
+
+from pypsa_explorer.config import COLORS, COLORS_DARK, PLOTLY_TEMPLATE_NAME, PLOTLY_TEMPLATE_NAME_DARK
+from pypsa_explorer.layouts.components import NO_DATA_MSG, PLEASE_SELECT_SCENARIOS_MSG, create_error_message
+from pypsa_explorer.utils.aggregation import SelectionAggregator
+from pypsa_explorer.utils.cache import ResultCache
+from pypsa_explorer.utils.comparison import COMPARISON_METRICS, compare_scenarios, scenario_deltas
+from pypsa_explorer.utils.figure_encoding import encode_figure
+from pypsa_explorer.utils.figures import grouped_bar_figure
+from pypsa_explorer.utils.helpers import get_country_selection
+from pypsa_explorer.utils.metrics import phase
+from pypsa_explorer.utils.scenario_diff import diff_scenarios
+
+COMPARISON_CHART_HEIGHT = 600
+
+# Number of assets listed in the largest changes table of a two-scenario difference
+TOP_CHANGES = 10
+
+
+def carrier_colors(networks: Mapping[str, pypsa.Network], labels: list[str]) -> dict[str, str]:
+    """Map carrier names and nice names to the colors defined in the given networks."""
+    colors: dict[str, str] = {}
+    for label in labels:
+        carriers = networks[label].carriers
+        for carrier, row in carriers.iterrows():
+            color = row.get("color")
+            if not isinstance(color, str) or not color:
+                continue
+            colors.setdefault(str(carrier), color)
+            nice_name = row.get("nice_name")
+            if isinstance(nice_name, str) and nice_name:
+                colors.setdefault(nice_name, color)
+    return colors
+
+
+@phase("figure")
+def build_comparison_figure(
+    matrix: pd.DataFrame,
+    metric: str,
+    *,
+    reference: str | None = None,
+    colors: dict[str, str] | None = None,
+    is_dark_mode: bool = False,
+) -> dict[str, Any]:
+    """
+    Build a grouped bar chart of a scenario × carrier matrix.
+
+    Parameters
+    ----------
+    matrix : pd.DataFrame
+        Totals with one row per scenario and one column per carrier
+    metric : str
+        Key of :data:`~pypsa_explorer.utils.comparison.COMPARISON_METRICS`
+    reference : str, optional
+        When given, the differences of the other scenarios to this one are plotted
+    colors : dict, optional
+        Colors by carrier
+    is_dark_mode : bool
+        Whether to apply the dark theme
+
+    Returns
+    -------
+    dict
+        Figure dictionary
+    """
+    title = COMPARISON_METRICS[metric][1]
+    if reference is not None:
+        matrix = scenario_deltas(matrix, reference)
+        title = f"{title}: Difference to {reference}"
+
+    figure = grouped_bar_figure(
+        matrix,
+        colors=colors,
+        template=PLOTLY_TEMPLATE_NAME_DARK if is_dark_mode else PLOTLY_TEMPLATE_NAME,
+        legend_title="Carrier",
+        zero_line=reference is not None,
+        height=COMPARISON_CHART_HEIGHT,
+    )
+    bg_color = (COLORS_DARK if is_dark_mode else COLORS)["background"]
+    figure["layout"].update(
+        title={"text": title},
+        paper_bgcolor=bg_color,
+        plot_bgcolor=bg_color,
+        margin={"l": 80, "r": 60, "t": 80, "b": 100},
+    )
+    return encode_figure(figure)
+
+
+def create_top_changes_table(
+    networks: Mapping[str, pypsa.Network], reference: str, other: str, cache: ResultCache
+) -> html.Div:
+    """List the assets whose optimal capacity changed most between two scenarios."""
+    top = diff_scenarios(networks, reference, other, cache=cache).top_assets(TOP_CHANGES)
+    table = top[["carrier", "status", "capacity_a", "capacity_b", "capacity_delta", "energy_delta"]].reset_index()
+    table.columns = ["Component", "Asset", "Carrier", "Status", reference, other, "Capacity Δ", "Energy Δ"]
+    return html.Div(
+        [
+            html.H5(f"Largest Asset Changes: {other} vs. {reference}", className="mb-3"),
+            dbc.Table.from_dataframe(table.round(1), striped=True, bordered=False, hover=True, size="sm"),
+        ],
+        className="mt-2",
+    )
+
+
+def register_comparison_callbacks(
+    app,
+    networks: dict[str, pypsa.Network],
+    cache: ResultCache | None = None,
+) -> None:
+    """
+    Register scenario comparison callbacks.
+
+    Parameters
+    ----------
+    app : dash.Dash
+        The Dash application instance
+    networks : dict
+        Dictionary of loaded PyPSA networks
+    cache : ResultCache, optional
+        Cache for statistics; a private cache is used when omitted
+    """
+    cache = cache if cache is not None else ResultCache()
+    # Country totals follow each session's selection by adding and subtracting per-country partial sums
+    aggregator = SelectionAggregator()
+
+    @app.callback(
+        [
+            Output("comparison-scenario-selector", "options"),
+            Output("comparison-scenario-selector", "value"),
+        ],
+        [Input("network-registry", "data")],
+        [State("comparison-scenario-selector", "value")],
+    )
+    def sync_comparison_scenarios(
+        registry_data: dict[str, Any] | None, selected: list[str] | None
+    ) -> tuple[list[str], list[str]]:
+        """Offer every registered network; all are compared until the user narrows the selection."""
+        order: list[str] = (registry_data or {}).get("order", [])
+        if selected:
+            kept = [label for label in selected if label in order]
+            return order, kept or order
+        return order, order
+
+    @app.callback(
+        [
+            Output("comparison-reference", "options"),
+            Output("comparison-reference", "value"),
+        ],
+        [Input("comparison-scenario-selector", "value")],
+        [State("comparison-reference", "value")],
+    )
+    def sync_comparison_reference(selected: list[str] | None, reference: str | None) -> tuple[list[str], str | None]:
+        """Restrict the reference scenario to the compared scenarios."""
+        selected = selected or []
+        return selected, reference if reference in selected else (selected[0] if selected else None)
+
+    @app.callback(
+        Output("comparison-chart-container", "children"),
+        [
+            Input("comparison-scenario-selector", "value"),
+            Input("comparison-metric", "value"),
+            Input("comparison-mode", "value"),
+            Input("comparison-reference", "value"),
+            Input("global-carrier-selector", "value"),
+            Input("global-country-mode", "value"),
+            Input("global-country-selector", "value"),
+            Input("tabs", "value"),
+            Input("dark-mode-store", "data"),
+        ],
+        [State("chart-request", "data")],
+        prevent_initial_call=True,
+    )
+    def update_comparison_chart(
+        selected: list[str] | None,
+        metric: str,
+        mode: str,
+        reference: str | None,
+        selected_carriers: list[str] | None,
+        country_mode: str,
+        selected_countries: list[str] | None,
+        active_tab: str,
+        is_dark_mode: bool,
+        chart_request: dict[str, Any] | None = None,
+    ) -> list[dcc.Graph | html.Div]:
+        # Only render while the comparison tab is active
+        if active_tab != "comparison":
+            return cast(list[dcc.Graph | html.Div], dash.no_update)
+
+        labels = [label for label in selected or [] if label in networks]
+        if len(labels) < 2:
+            return [PLEASE_SELECT_SCENARIOS_MSG]
+
+        # Use helper for country filtering
+        _, _, error_message = get_country_selection(country_mode, selected_countries or [])
+        if error_message:
+            return [error_message]
+
+        try:
+            matrix = compare_scenarios(
+                networks,
+                labels,
+                metric,
+                bus_carriers=selected_carriers,
+                countries=selected_countries if country_mode == "Specific" else None,
+                cache=cache,
+                aggregator=aggregator,
+                # The browser session identifier is sent with the chart requests (assets/figure_cache.js)
+                session=(chart_request or {}).get("session"),
+            )
+            if matrix.empty or not matrix.columns.size:
+                return [NO_DATA_MSG]
+
+            figure = build_comparison_figure(
+                matrix,
+                metric,
+                reference=reference if mode == "delta" and reference in labels else None,
+                colors=carrier_colors(networks, labels),
+                is_dark_mode=is_dark_mode,
+            )
+        except Exception as e:
+            return [create_error_message("scenario comparison", e)]
+
+        children: list[dcc.Graph | html.Div] = [
+            dcc.Graph(figure=figure, className="mb-4", style={"height": f"{COMPARISON_CHART_HEIGHT}px"})
+        ]
+        # With two scenarios, the asset-level differences fit on one table
+        if mode == "delta" and reference in labels and len(labels) == 2:
+            other = next(label for label in labels if label != reference)
+            try:
+                children.append(create_top_changes_table(networks, reference, other, cache))
+            except Exception as e:
+                children.append(create_error_message("asset changes", e))
+        return children
@@ -1,28 +1,26 @@
 """Filter-related callbacks for PyPSA Explorer dashboard."""
 
-from typing import Any
+from dash import ClientsideFunction, Input, Output
 
-from dash import Input, Output
+from pypsa_explorer.config import CLIENTSIDE_NAMESPACE
 
 
 def register_filter_callbacks(app) -> None:
-    """Register filter-related callbacks."""
+    """Register filter-related callbacks; both run in the browser (``assets/clientside.js``)."""
 
-    @app.callback(
+    # Enable/disable country selector based on mode
+    app.clientside_callback(
+        ClientsideFunction(CLIENTSIDE_NAMESPACE, "toggleGlobalCountrySelector"),
         [
             Output("global-country-selector", "disabled"),
             Output("global-country-selector", "value"),
         ],
         [Input("global-country-mode", "value")],
     )
-    def toggle_global_country_selector(mode: str) -> tuple[bool, list[Any]]:
-        """Enable/disable country selector based on mode."""
-        if mode == "All":
-            return True, []
-        else:
-            return False, []
 
-    @app.callback(
+    # Hide the carrier selector on the CAPEX/OPEX tabs
+    app.clientside_callback(
+        ClientsideFunction(CLIENTSIDE_NAMESPACE, "handleTabSpecificUi"),
         [
             Output("global-carrier-selector-container", "style"),
             Output("carrier-not-applicable-text", "style"),
@@ -30,11 +28,3 @@ def register_filter_callbacks(app) -> None:
         ],
         [Input("tabs", "value")],
     )
-    def handle_tab_specific_ui(active_tab: str) -> tuple[dict[str, str], dict[str, str], str]:
-        """Handle UI elements based on the active tab."""
-        if active_tab in ["capex", "opex"]:
-            # Hide carrier selector for CAPEX/OPEX tabs
-            return {"display": "none"}, {"display": "block"}, active_tab
-        else:
-            # Show carrier selector for other tabs
-            return {"display": "block"}, {"display": "none"}, active_tab
@@ -2,10 +2,9 @@
 
 import base64
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import dash_bootstrap_components as dbc
-import folium
 import pypsa
 import pypsa.consistency
 import yaml  # type: ignore[import]
@@ -14,12 +13,72 @@ from dash.development.base_component import Component
 from dash.exceptions import PreventUpdate
 
 from pypsa_explorer.layouts.components import create_header
-from pypsa_explorer.utils.helpers import get_bus_carrier_options, get_country_options, summarize_network
+from pypsa_explorer.utils.cache import ResultCache
+from pypsa_explorer.utils.helpers import describe_network, get_bus_carrier_options, get_country_options
+from pypsa_explorer.utils.metrics import phase
 from pypsa_explorer.utils.network_loader import ensure_carriers_defined
+from pypsa_explorer.utils.network_watcher import NetworkWatcher
+
+if TYPE_CHECKING:
+    import folium
+
+
+def build_network_map(n: pypsa.Network, label: str, cache: ResultCache) -> str:
+    """
+    Render (or fetch from cache) the interactive map of a network as HTML.
+
+    Parameters
+    ----------
+    n : pypsa.Network
+        The PyPSA network object
+    label : str
+        Network label, used to scope the cache entry
+    cache : ResultCache
+        Cache holding the rendered maps
+
+    Returns
+    -------
+    str
+        Self-contained folium map HTML
+    """
+
+    @phase("figure")
+    def render_map() -> str:
+        # Create a folium map using PyPSA's explore method
+        # Note: popup and components parameters removed for PyPSA v1.0 compatibility
+        map_obj: folium.Map = n.plot.explore(tooltip=True)  # type: ignore[call-arg, attr-defined]
+        return map_obj._repr_html_()
+
+    return cache.get_or_compute("maps", label, (), render_map, network=n)
+
+
+def build_filter_options(
+    n: pypsa.Network, label: str, cache: ResultCache
+) -> tuple[list[dict[str, Any]], list[dict[str, str]]]:
+    """
+    Return (or fetch from cache) the bus carrier and country filter options of a network.
+
+    Parameters are the same as for :func:`build_network_map`.
+    """
+    return cache.get_or_compute(
+        "options",
+        label,
+        (),
+        lambda: (get_bus_carrier_options(n), get_country_options(n)),
+        network=n,
+    )
 
 
-def register_network_callbacks(app, networks: dict[str, pypsa.Network], *, default_network_path: str) -> None:
+def register_network_callbacks(
+    app,
+    networks: dict[str, pypsa.Network],
+    *,
+    default_network_path: str,
+    cache: ResultCache | None = None,
+    watcher: NetworkWatcher | None = None,
+) -> None:
     """Register network-related callbacks."""
+    cache = cache if cache is not None else ResultCache()
 
     uploads_dir = Path("uploaded_networks")
     uploads_dir.mkdir(exist_ok=True)
@@ -148,7 +207,7 @@ def register_network_callbacks(app, networks: dict[str, pypsa.Network], *, defau
                 networks[label] = network
                 order = [existing for existing in order if existing != label]
                 order.append(label)
-                summary = summarize_network(network)
+                summary = describe_network(network)
                 summary_payload: dict[str, Any] = {
                     "source": str(stored_path),
                     "origin": "upload",
@@ -184,7 +243,7 @@ def register_network_callbacks(app, networks: dict[str, pypsa.Network], *, defau
                 networks[label] = network
                 order = [existing for existing in order if existing != label]
                 order.append(label)
-                summary = summarize_network(network)
+                summary = describe_network(network)
                 summary_payload = {
                     "source": str(demo_path),
                     "origin": "example",
@@ -350,15 +409,8 @@ def register_network_callbacks(app, networks: dict[str, pypsa.Network], *, defau
         if not selected_network_label or selected_network_label not in networks:
             return [], []
 
-        n = networks[selected_network_label]
-
-        # Update bus carrier options for the new network
-        updated_bus_carrier_options = get_bus_carrier_options(n)
-
-        # Update country options for the new network
-        updated_country_options = get_country_options(n)
-
-        return updated_bus_carrier_options, updated_country_options
+        # Bus carrier and country options of the new network
+        return build_filter_options(networks[selected_network_label], selected_network_label, cache)
 
     @app.callback(
         Output("kpi-header-container", "children"),
@@ -385,11 +437,11 @@ def register_network_callbacks(app, networks: dict[str, pypsa.Network], *, defau
             return "<div style='padding:20px;text-align:center;color:#6c757d;'>Load a network to view the map.</div>"
 
         n = networks[selected_network_label]
+
         try:
-            # Create a folium map using PyPSA's explore method
-            # Note: popup and components parameters removed for PyPSA v1.0 compatibility
-            map_obj: folium.Map = n.plot.explore(tooltip=True)  # type: ignore[call-arg, attr-defined]
-            return map_obj._repr_html_()
+            if ctx.triggered_id == "refresh-map-button":
+                cache.discard("maps", selected_network_label, network=n)
+            return build_network_map(n, selected_network_label, cache)
         except Exception as e:
             print(f"Error creating map: {e}")
             return f"<div style='padding:20px;'><h2>Map visualization unavailable</h2><p>Error: {str(e)}</p></div>"
@@ -435,3 +487,41 @@ def register_network_callbacks(app, networks: dict[str, pypsa.Network], *, defau
                     html.P(f"Error: {str(e)}", className="text-danger"),
                 ]
             )
+
+    if watcher is not None:
+
+        @app.callback(
+            Output("network-registry", "data", allow_duplicate=True),
+            [Input("network-watch-interval", "n_intervals")],
+            [State("network-registry", "data")],
+            prevent_initial_call=True,
+        )
+        def sync_watched_networks(
+            n_intervals: int | None,  # noqa: ARG001 - tick count unused, present for signature
+            registry_data: dict[str, Any] | None,
+        ) -> dict[str, Any]:
+            """Merge new, modified and removed files of the watched directory into the registry."""
+            registry = _ensure_registry(registry_data)
+            info: dict[str, Any] = dict(registry.get("info", {}))
+            order: list[str] = list(registry.get("order", []))
+
+            watcher.scan()
+            watched = watcher.summaries
+
+            # Drop watched networks whose files disappeared, keep uploads and examples
+            stale = [label for label in order if info.get(label, {}).get("origin") == "watch" and label not in watched]
+            order = [label for label in order if label not in stale]
+            for label in stale:
+                info.pop(label, None)
+
+            for label, summary in watched.items():
+                if label not in order:
+                    order.append(label)
+                info[label] = summary
+
+            if order == registry.get("order", []) and info == registry.get("info", {}):
+                raise PreventUpdate
+
+            registry["order"] = order
+            registry["info"] = info
+            return registry
@@ -1,25 +1,26 @@
 """Theme callbacks for dark mode toggle."""
 
-from dash import Input, Output
+from dash import ClientsideFunction, Input, Output
+
+from pypsa_explorer.config import CLIENTSIDE_NAMESPACE
 
 
 def register_theme_callbacks(app) -> None:
     """
     Register callbacks for theme/dark mode functionality.
 
+    The toggle runs in the browser (``assets/clientside.js``).
+
     Parameters
     ----------
     app : dash.Dash
         The Dash application instance
     """
 
-    @app.callback(
+    # Apply the theme class based on toggle state and update store
+    app.clientside_callback(
+        ClientsideFunction(CLIENTSIDE_NAMESPACE, "toggleDarkMode"),
         [Output("app-container", "className"), Output("dark-mode-store", "data")],
         Input("dark-mode-toggle", "value"),
         prevent_initial_call=False,
     )
-    def toggle_dark_mode(toggle_value):
-        """Apply the appropriate theme class based on toggle state and update store."""
-
-        is_dark = "dark" in (toggle_value or [])
-        return ("dark-mode" if is_dark else "", is_dark)
@@ -1,521 +1,780 @@
 """Visualization callbacks for PyPSA Explorer dashboard."""
 
+import json
+import logging
+import threading
 from collections.abc import Callable
-from typing import Any, cast
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+from typing import Any
 
 import dash
-import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 import pypsa
-from dash import Input, Output, ctx, dcc, html
-
-from pypsa_explorer.config import COLORS, COLORS_DARK, PLOTLY_TEMPLATE_NAME, PLOTLY_TEMPLATE_NAME_DARK
+from dash import ClientsideFunction, Input, Output, Patch, State, dcc, html
+
+from pypsa_explorer.config import (
+    CHART_BACKGROUND_WORKERS,
+    CHART_TAB_CONTAINERS,
+    CLIENTSIDE_NAMESPACE,
+    COLORS,
+    COLORS_DARK,
+    PLOTLY_TEMPLATE_NAME,
+    PLOTLY_TEMPLATE_NAME_DARK,
+)
 from pypsa_explorer.layouts.components import (
-    NO_DATA_MSG,
     NO_NETWORK_SELECTED_MSG,
     PLEASE_SELECT_CARRIER_MSG,
     create_error_message,
+    create_pending_chart_message,
 )
-from pypsa_explorer.utils.helpers import get_carrier_nice_name, get_country_filter
-
-
-def register_visualization_callbacks(app, networks: dict[str, pypsa.Network]) -> None:
-    """Register visualization-related callbacks."""
-
-    def _compute_bar_chart_height(
-        fig: go.Figure,
-        base_height: int = 240,
-        bar_height: int = 18,
-        min_height: int = 320,
-        max_height: int = 1100,
-    ) -> int:
-        """Estimate a sensible height for horizontal bar charts."""
-
-        axis_categories: dict[str, set[object]] = {}
+from pypsa_explorer.utils.cache import ResultCache
+from pypsa_explorer.utils.concurrency import (
+    Cancelled,
+    CancelToken,
+    DeadlineExceeded,
+    LatestWins,
+    cancellation_scope,
+    checkpoint,
+)
+from pypsa_explorer.utils.figure_encoding import encode_figure
+from pypsa_explorer.utils.figures import carrier_color_map, horizontal_bar_figure, stacked_area_figure
+from pypsa_explorer.utils.fingerprint import network_fingerprint
+from pypsa_explorer.utils.helpers import get_carrier_nice_name, get_country_selection
+from pypsa_explorer.utils.metrics import phase
+from pypsa_explorer.utils.statistics import chart_statistic
+
+logger = logging.getLogger(__name__)
+
+# Statistics shown in the expenditure tabs, mapped to their chart titles
+EXPENDITURE_TITLES = {
+    "capex": "Capital Expenditure Totals",
+    "opex": "Operational Expenditure Totals",
+}
+
+
+def _trace_attribute(trace: Any, name: str, default: Any = None) -> Any:
+    if isinstance(trace, dict):
+        return trace.get(name, default)
+    return getattr(trace, name, default)
+
+
+def compute_bar_chart_height(
+    fig: go.Figure | dict[str, Any],
+    base_height: int = 240,
+    bar_height: int = 18,
+    min_height: int = 320,
+    max_height: int = 1100,
+) -> int:
+    """Estimate a sensible height for horizontal bar charts, given as a figure or a figure dictionary."""
+
+    axis_categories: dict[str, set[object]] = {}
+
+    for trace in fig["data"] if isinstance(fig, dict) else fig.data:
+        if _trace_attribute(trace, "type", "") != "bar":
+            continue
+
+        axis_name = _trace_attribute(trace, "yaxis", "y") or "y"
+        if axis_name == "y":
+            axis_key = "yaxis"
+        elif isinstance(axis_name, str) and axis_name.startswith("yaxis"):
+            axis_key = axis_name
+        elif isinstance(axis_name, str) and axis_name.startswith("y"):
+            axis_key = f"yaxis{axis_name[1:]}"
+        else:
+            axis_key = "yaxis"
+
+        # Plotly >= 6 stores trace data as numpy arrays, whose truth value is ambiguous
+        values = _trace_attribute(trace, "y")
+        if values is None:
+            values = []
+        try:
+            iterator = list(values)
+        except TypeError:
+            continue
 
-        for trace in fig.data:
-            if getattr(trace, "type", "") != "bar":
+        categories = axis_categories.setdefault(axis_key, set())
+        for value in iterator:
+            if value is None:
                 continue
-
-            axis_name = getattr(trace, "yaxis", "y") or "y"
-            if axis_name == "y":
-                axis_key = "yaxis"
-            elif isinstance(axis_name, str) and axis_name.startswith("yaxis"):
-                axis_key = axis_name
-            elif isinstance(axis_name, str) and axis_name.startswith("y"):
-                axis_key = f"yaxis{axis_name[1:]}"
-            else:
-                axis_key = "yaxis"
-
-            values = getattr(trace, "y", []) or []
+            categories.add(value)
+
+    if not axis_categories:
+        return max(min_height, base_height)
+
+    max_category_count = max(len(categories) for categories in axis_categories.values())
+    estimated_height = base_height + bar_height * max_category_count
+    return max(min_height, min(estimated_height, max_height))
+
+
+def _theme(is_dark_mode: bool) -> tuple[str, str]:
+    """Return the background color and Plotly template name for a theme."""
+    colors = COLORS_DARK if is_dark_mode else COLORS
+    template = PLOTLY_TEMPLATE_NAME_DARK if is_dark_mode else PLOTLY_TEMPLATE_NAME
+    return colors["background"], template
+
+
+def _title_with_countries(title: str, facet_col: str | None, selected_countries: list[str] | None) -> str:
+    if facet_col and selected_countries:
+        countries_str = ", ".join(selected_countries)
+        title += f" (Countries: {countries_str})"
+    return title
+
+
+def build_energy_balance_figure(
+    n: pypsa.Network,
+    label: str,
+    carrier: str,
+    *,
+    aggregated: bool,
+    country_mode: str = "All",
+    selected_countries: list[str] | None = None,
+    is_dark_mode: bool = False,
+    cache: ResultCache,
+) -> tuple[dict[str, Any], int]:
+    """
+    Build (or fetch from cache) an energy balance chart for one bus carrier.
+
+    Parameters
+    ----------
+    n : pypsa.Network
+        The PyPSA network object
+    label : str
+        Network label, used to scope the cache entries
+    carrier : str
+        Bus carrier to plot
+    aggregated : bool
+        Whether to build the aggregated bar chart (True) or the timeseries area chart (False)
+    country_mode : str
+        Either "All" or "Specific"
+    selected_countries : list[str], optional
+        Countries to show when ``country_mode`` is "Specific"
+    is_dark_mode : bool
+        Whether to apply the dark theme
+    cache : ResultCache
+        Cache holding statistics and figures
+
+    Returns
+    -------
+    tuple[dict, int]
+        Figure dictionary and chart height in pixels
+    """
+    countries, facet_col, _ = get_country_selection(country_mode, selected_countries or [])
+    country_key = tuple(countries) if countries else None
+    view = "energy-balance-aggregated" if aggregated else "energy-balance"
+
+    @phase("figure")
+    def build() -> tuple[dict[str, Any], int]:
+        bg_color, template = _theme(is_dark_mode)
+
+        if aggregated:
+            # Bar plot for aggregated view
+            data = chart_statistic(n, label, "energy_balance", cache, countries=countries, bus_carrier=carrier)
+            figure = horizontal_bar_figure(data, facet_col=facet_col, template=template, category_title="")
+            height = compute_bar_chart_height(figure)
+            layout: dict[str, Any] = {
+                "margin": {"l": 160, "r": 60, "t": 80, "b": 60},
+                "showlegend": False,
+            }
+        else:
+            # Area plot for timeseries view
+            data = chart_statistic(
+                n, label, "energy_balance", cache, countries=countries, bus_carrier=carrier, groupby_time=False
+            )
+            figure = stacked_area_figure(data, colors=carrier_color_map(n), facet_col=facet_col, template=template)
+            height = 500
+            layout = {
+                "legend": {**figure["layout"]["legend"], "title": {"text": "Component Carrier"}},
+                "hovermode": "closest",
+            }
+
+        carrier_name = get_carrier_nice_name(n, carrier)
+        title = _title_with_countries(
+            f"{'Aggregated Balance' if aggregated else 'Energy Balance'} for {carrier_name}",
+            facet_col,
+            selected_countries,
+        )
+        # Apply robust height settings to prevent resizing
+        figure["layout"].update(layout, title={"text": title}, height=height, paper_bgcolor=bg_color, plot_bgcolor=bg_color)
+        return encode_figure(figure), height
+
+    return cache.get_or_compute("figures", label, (view, carrier, country_key, is_dark_mode), build, network=n)
+
+
+def build_capacity_figure(
+    n: pypsa.Network,
+    label: str,
+    carrier: str,
+    *,
+    country_mode: str = "All",
+    selected_countries: list[str] | None = None,
+    is_dark_mode: bool = False,
+    cache: ResultCache,
+) -> tuple[dict[str, Any], int]:
+    """
+    Build (or fetch from cache) the optimal capacity chart for one bus carrier.
+
+    Parameters are the same as for :func:`build_energy_balance_figure`.
+    """
+    countries, facet_col, _ = get_country_selection(country_mode, selected_countries or [])
+    country_key = tuple(countries) if countries else None
+
+    @phase("figure")
+    def build() -> tuple[dict[str, Any], int]:
+        bg_color, template = _theme(is_dark_mode)
+
+        # Generate capacity bar chart directly with carrier
+        data = chart_statistic(n, label, "optimal_capacity", cache, countries=countries, bus_carrier=carrier)
+        figure = horizontal_bar_figure(data, facet_col=facet_col, template=template, category_title="")
+
+        # Set title based on selections
+        carrier_name = get_carrier_nice_name(n, carrier)
+        title = _title_with_countries(f"Optimal Capacity for {carrier_name}", facet_col, selected_countries)
+
+        height = compute_bar_chart_height(figure)
+        figure["layout"].update(
+            title={"text": title},
+            paper_bgcolor=bg_color,
+            plot_bgcolor=bg_color,
+            height=height,
+            margin={"l": 160, "r": 60, "t": 80, "b": 60},
+            showlegend=False,
+        )
+        return encode_figure(figure), height
+
+    return cache.get_or_compute("figures", label, ("capacity", carrier, country_key, is_dark_mode), build, network=n)
+
+
+def build_expenditure_figure(
+    n: pypsa.Network,
+    label: str,
+    statistic: str,
+    *,
+    country_mode: str = "All",
+    selected_countries: list[str] | None = None,
+    is_dark_mode: bool = False,
+    cache: ResultCache,
+) -> tuple[dict[str, Any], int]:
+    """
+    Build (or fetch from cache) the CAPEX or OPEX totals chart.
+
+    ``statistic`` is either ``"capex"`` or ``"opex"``; the remaining parameters are
+    the same as for :func:`build_energy_balance_figure`.
+    """
+    countries, facet_col, _ = get_country_selection(country_mode, selected_countries or [])
+    country_key = tuple(countries) if countries else None
+
+    @phase("figure")
+    def build() -> tuple[dict[str, Any], int]:
+        bg_color, template = _theme(is_dark_mode)
+
+        data = chart_statistic(n, label, statistic, cache, countries=countries)
+        figure = horizontal_bar_figure(data, facet_col=facet_col, template=template, category_title="", height=1000)
+
+        # Set title based on selections
+        title = _title_with_countries(EXPENDITURE_TITLES[statistic], facet_col, selected_countries)
+
+        height = compute_bar_chart_height(figure, base_height=260, bar_height=40, min_height=360, max_height=1200)
+        figure["layout"].update(
+            title={"text": title},
+            height=height,
+            margin={"l": 160, "r": 60, "t": 100, "b": 60},
+            paper_bgcolor=bg_color,
+            plot_bgcolor=bg_color,
+            showlegend=False,
+        )
+        return encode_figure(figure), height
+
+    return cache.get_or_compute("figures", label, (statistic, country_key, is_dark_mode), build, network=n)
+
+
+def warm_chart_cache(
+    n: pypsa.Network,
+    label: str,
+    cache: ResultCache,
+    carriers: list[str] | None = None,
+    themes: tuple[bool, ...] = (False, True),
+) -> int:
+    """
+    Precompute the statistics and figures of every chart tab for one network.
+
+    Charts are built for all countries. Charts that fail are skipped; the callbacks
+    report their errors when the chart is requested.
+
+    Parameters
+    ----------
+    n : pypsa.Network
+        The PyPSA network object
+    label : str
+        Network label
+    cache : ResultCache
+        Cache to fill
+    carriers : list[str], optional
+        Bus carriers to precompute; defaults to all bus carriers of the network
+    themes : tuple[bool, ...]
+        Dark mode flags to render figures for; both themes by default
+
+    Returns
+    -------
+    int
+        Number of charts that were built successfully
+    """
+    if carriers is None:
+        carriers = sorted(c for c in n.buses.carrier.unique() if c != "none")
+
+    # Builders of every chart, called with the ``is_dark_mode`` keyword
+    builders: list[Callable[..., tuple[dict[str, Any], int]]] = []
+    for carrier in carriers:
+        for aggregated in (False, True):
+            builders.append(partial(build_energy_balance_figure, n, label, carrier, aggregated=aggregated, cache=cache))
+        builders.append(partial(build_capacity_figure, n, label, carrier, cache=cache))
+    for statistic in EXPENDITURE_TITLES:
+        builders.append(partial(build_expenditure_figure, n, label, statistic, cache=cache))
+
+    built = 0
+    for is_dark_mode in themes:
+        for build in builders:
             try:
-                iterator = list(values)
-            except TypeError:
+                build(is_dark_mode=is_dark_mode)
+                built += 1
+            except Exception:  # noqa: BLE001 - errors are shown when the chart is viewed
                 continue
-
-            categories = axis_categories.setdefault(axis_key, set())
-            for value in iterator:
-                if value is None:
-                    continue
-                categories.add(value)
-
-        if not axis_categories:
-            return max(min_height, base_height)
-
-        max_category_count = max(len(categories) for categories in axis_categories.values())
-        estimated_height = base_height + bar_height * max_category_count
-        return max(min_height, min(estimated_height, max_height))
-
-    def create_energy_balance_callback(aggregated: bool = False) -> Callable:
+    return built
+
+
+def carrier_chart_render_key(
+    n: pypsa.Network,
+    label: str,
+    country_mode: str,
+    selected_countries: list[str] | None,
+    is_dark_mode: bool,
+) -> list[Any]:
+    """Identify everything but the carrier selection that the charts of a per-carrier tab depend on."""
+    countries = list(selected_countries or []) if country_mode == "Specific" else None
+    return [label, network_fingerprint(n), country_mode, countries, bool(is_dark_mode)]
+
+
+def background_chart_key(tab: str, render_key: list[Any], carrier: str | None = None) -> str:
+    """Identify a chart rendered in the background, from its tab, render key and carrier."""
+    return json.dumps([tab, render_key, carrier])
+
+
+def plan_carrier_chart_updates(
+    rendered: dict[str, Any] | None, render_key: list[Any], carriers: list[str]
+) -> tuple[list[int], list[str]] | None:
+    """
+    Plan the partial update of a container holding one chart per selected carrier.
+
+    Parameters
+    ----------
+    rendered : dict, optional
+        What the container shows, as ``{"key": render_key, "carriers": [...]}``;
+        ``carriers`` is ``None`` when it shows a message instead of charts
+    render_key : list
+        Key of the charts to show, see :func:`carrier_chart_render_key`
+    carriers : list[str]
+        Selected carriers
+
+    Returns
+    -------
+    tuple[list[int], list[str]] or None
+        Positions of the charts to remove, in descending order, and the carriers
+        whose charts are appended; ``None`` when the container must be rendered
+        afresh because its charts are for other settings, some of them are
+        placeholders (``"partial"``) or none of them is kept
+    """
+    if not rendered or rendered.get("key") != render_key or not rendered.get("carriers") or rendered.get("partial"):
+        return None
+    shown: list[str] = rendered["carriers"]
+    removed = [position for position in reversed(range(len(shown))) if shown[position] not in carriers]
+    if len(removed) == len(shown):
+        return None
+    added = [carrier for carrier in dict.fromkeys(carriers) if carrier not in shown]
+    return removed, added
+
+
+def register_visualization_callbacks(
+    app,
+    networks: dict[str, pypsa.Network],
+    cache: ResultCache | None = None,
+    chart_deadline: float | None = None,
+) -> None:
+    """
+    Register visualization-related callbacks.
+
+    Parameters
+    ----------
+    app : dash.Dash
+        The Dash application instance
+    networks : dict
+        Dictionary of loaded PyPSA networks
+    cache : ResultCache, optional
+        Cache for statistics and figures; a private cache is used when omitted
+    chart_deadline : float, optional
+        Seconds after which a chart request returns the charts that are done and
+        placeholders for the rest, which are finished in the background; no
+        deadline when omitted
+    """
+    cache = cache if cache is not None else ResultCache()
+    # A newer chart request of a browser session cancels the one in flight
+    latest = LatestWins()
+    # Charts that missed the deadline are rendered into the cache here; threads start on first use
+    background = ThreadPoolExecutor(CHART_BACKGROUND_WORKERS, thread_name_prefix="pypsa-explorer-charts")
+    # Keys of the charts queued or being rendered in the background
+    background_keys: set[str] = set()
+    background_lock = threading.Lock()
+
+    def finished_in_background(key: str, future: Future) -> None:
+        with background_lock:
+            background_keys.discard(key)
+        if (error := future.exception()) is not None:
+            logger.error("Rendering chart %s in the background failed", key, exc_info=error)
+
+    def finish_in_background(renders: dict[str, Callable[[], object]]) -> None:
         """
-        Create a callback function for updating energy balance charts.
+        Render charts that missed the deadline, without a deadline, to fill the cache.
 
-        Parameters
-        ----------
-        aggregated : bool
-            Whether to create a callback for aggregated (True) or timeseries (False) views
-
-        Returns
-        -------
-        Callable
-            Callback function for updating energy balance charts
+        ``renders`` maps chart keys (see :func:`background_chart_key`) to their
+        render functions; charts that are already queued or being rendered are skipped.
         """
-
-        def update_energy_balance(
-            selected_carriers: list[str],
-            country_mode: str,
-            selected_countries: list[str],
-            selected_network_label: str,
-            is_dark_mode: bool,
-        ) -> list[dbc.Col | html.Div | dcc.Graph] | html.Div:
-            n = networks[selected_network_label]
-            s = n.statistics
-
-            # Select colors and template based on dark mode
-            colors = COLORS_DARK if is_dark_mode else COLORS
-            bg_color = colors["background"]
-            template = PLOTLY_TEMPLATE_NAME_DARK if is_dark_mode else PLOTLY_TEMPLATE_NAME
-
-            if not selected_carriers:
-                return [PLEASE_SELECT_CARRIER_MSG] if aggregated else PLEASE_SELECT_CARRIER_MSG
-
-            # Use helper for country filtering
-            query, facet_col, error_message = get_country_filter(country_mode, selected_countries)
-            if error_message:
-                return [error_message] if aggregated else error_message
-
-            charts: list[dbc.Col | html.Div | dcc.Graph] = []
-
-            for carrier in selected_carriers:
-                try:
-                    # Generate plot based on view type
-                    plot_args = {
-                        "x": "value",
-                        "y": "carrier",
-                        "color": "carrier",
-                        "bus_carrier": carrier,
-                        "nice_names": True,
-                        "width": None,
-                        "query": query,
-                        "facet_col": facet_col,
-                    }
-
-                    if aggregated:
-                        # Bar plot for aggregated view
-                        fig = s.energy_balance.iplot.bar(**plot_args)
-                    else:
-                        # Area plot for timeseries view
-                        plot_args.update(
-                            {
-                                "x": "snapshot",
-                                "y": "value",
-                                "stacked": True,
-                                "height": 500,
-                            }
-                        )
-                        fig = s.energy_balance.iplot.area(**plot_args)
-                        # Adjust layout for area plot
-                        fig.update_layout(
-                            legend_title="Component Carrier",
-                            hovermode="closest",
-                            paper_bgcolor=bg_color,
-                            plot_bgcolor=bg_color,
-                            template=template,
-                        )
-
-                    # Common title setting
-                    carrier_name = get_carrier_nice_name(n, carrier)
-
-                    title = f"{'Aggregated Balance' if aggregated else 'Energy Balance'} for {carrier_name}"
-                    if facet_col and selected_countries:
-                        countries_str = ", ".join(selected_countries)
-                        title += f" (Countries: {countries_str})"
-
-                    # Apply robust height settings to prevent resizing
-                    height = 500
-                    layout_kwargs: dict[str, Any] = {
-                        "title": title,
-                        "paper_bgcolor": bg_color,
-                        "plot_bgcolor": bg_color,
-                        "template": template,
-                    }
-                    if aggregated:
-                        height = _compute_bar_chart_height(fig)
-                        layout_kwargs["margin"] = {"l": 160, "r": 60, "t": 80, "b": 60}
-                        layout_kwargs["showlegend"] = False
-                        layout_kwargs["height"] = height
-                    else:
-                        layout_kwargs["height"] = height
-
-                    fig.update_layout(**layout_kwargs)
-                    if aggregated:
-                        fig.update_yaxes(title_text="")
-
-                    # Add explicit height constraint to prevent growth
-                    graph_style = {"height": f"{height}px"}
-                    graph_component = dcc.Graph(figure=fig, style=graph_style, className="mb-4")
-                    charts.append(graph_component)
-
-                except Exception as e:
-                    error_context = f"carrier '{carrier}'"
-                    carrier_error_message = create_error_message(error_context, e)
-                    charts.append(carrier_error_message)
-
-            # If no charts were created successfully, show a message
-            if not charts:
-                return [NO_DATA_MSG] if aggregated else NO_DATA_MSG
-
-            return charts
-
-        return update_energy_balance
-
-    # Callback for Energy Balance charts (timeseries view)
-    @app.callback(
-        Output("energy-balance-charts-container", "children"),
-        [
-            Input("global-carrier-selector", "value"),
-            Input("global-country-mode", "value"),
-            Input("global-country-selector", "value"),
-            Input("network-selector", "data"),
-            Input("tabs", "value"),
-            Input("dark-mode-store", "data"),
-        ],
-        prevent_initial_call=True,
-    )
-    def update_energy_balance(
-        selected_carriers: list[str],
-        country_mode: str,
-        selected_countries: list[str],
-        selected_network_label: str | None,
-        active_tab: str,
-        is_dark_mode: bool,
-    ) -> list[dbc.Col | html.Div | dcc.Graph] | html.Div:
-        # Only render if this tab is active OR if tab just became active
-        if active_tab != "energy-balance" and ctx.triggered_id != "tabs":
-            return cast(list[dbc.Col | html.Div | dcc.Graph] | html.Div, dash.no_update)
-
-        if not selected_network_label or selected_network_label not in networks:
-            return NO_NETWORK_SELECTED_MSG
-
-        return create_energy_balance_callback(aggregated=False)(
-            selected_carriers, country_mode, selected_countries, selected_network_label, is_dark_mode
-        )
-
-    # Callback for Aggregated Energy Balance charts
-    @app.callback(
-        Output("agg-energy-balance-charts-container", "children"),
-        [
-            Input("global-carrier-selector", "value"),
-            Input("global-country-mode", "value"),
-            Input("global-country-selector", "value"),
-            Input("network-selector", "data"),
-            Input("tabs", "value"),
-            Input("dark-mode-store", "data"),
-        ],
-        prevent_initial_call=True,
-    )
-    def update_energy_balance_aggregated(
-        selected_carriers: list[str],
+        for key, render in renders.items():
+            with background_lock:
+                if key in background_keys:
+                    continue
+                background_keys.add(key)
+            background.submit(render).add_done_callback(partial(finished_in_background, key))
+
+    def render_energy_balance_chart(
+        n: pypsa.Network,
+        label: str,
+        carrier: str,
+        aggregated: bool,
         country_mode: str,
         selected_countries: list[str],
-        selected_network_label: str | None,
-        active_tab: str,
         is_dark_mode: bool,
-    ) -> list[dbc.Col | html.Div | dcc.Graph] | html.Div:
-        # Only render if this tab is active OR if tab just became active
-        if active_tab != "energy-balance-aggregated" and ctx.triggered_id != "tabs":
-            return cast(list[dbc.Col | html.Div | dcc.Graph] | html.Div, dash.no_update)
-
-        if not selected_network_label or selected_network_label not in networks:
-            return [NO_NETWORK_SELECTED_MSG]
-
-        return create_energy_balance_callback(aggregated=True)(
-            selected_carriers, country_mode, selected_countries, selected_network_label, is_dark_mode
-        )
-
-    # Callback for Capacity charts
-    @app.callback(
-        Output("capacity-charts-container", "children"),
-        [
-            Input("global-carrier-selector", "value"),
-            Input("global-country-mode", "value"),
-            Input("global-country-selector", "value"),
-            Input("network-selector", "data"),
-            Input("tabs", "value"),
-            Input("dark-mode-store", "data"),
-        ],
-        prevent_initial_call=True,
-    )
-    def update_capacity_charts(
-        selected_carriers: list[str],
+    ) -> dcc.Graph | html.Div:
+        """Render the energy balance chart of one carrier, or the error that prevented it."""
+        try:
+            figure, height = build_energy_balance_figure(
+                n,
+                label,
+                carrier,
+                aggregated=aggregated,
+                country_mode=country_mode,
+                selected_countries=selected_countries,
+                is_dark_mode=is_dark_mode,
+                cache=cache,
+            )
+        except Exception as e:
+            return create_error_message(f"carrier '{carrier}'", e)
+        # Add explicit height constraint to prevent growth
+        return dcc.Graph(figure=figure, style={"height": f"{height}px"}, className="mb-4")
+
+    def render_capacity_chart(
+        n: pypsa.Network,
+        label: str,
+        carrier: str,
         country_mode: str,
         selected_countries: list[str],
-        selected_network_label: str | None,
-        active_tab: str,
         is_dark_mode: bool,
-    ) -> list[dcc.Graph | html.Div]:
-        # Only render if this tab is active OR if tab just became active
-        if active_tab != "capacity" and ctx.triggered_id != "tabs":
-            return cast(list[dcc.Graph | html.Div], dash.no_update)
-
-        if not selected_network_label or selected_network_label not in networks:
-            return [NO_NETWORK_SELECTED_MSG]
-
-        n = networks[selected_network_label]
-        s = n.statistics
-
-        # Select colors and template based on dark mode
-        colors = COLORS_DARK if is_dark_mode else COLORS
-        bg_color = colors["background"]
-        template = PLOTLY_TEMPLATE_NAME_DARK if is_dark_mode else PLOTLY_TEMPLATE_NAME
+    ) -> dcc.Graph | html.Div:
+        """Render the optimal capacity chart of one carrier, or the error that prevented it."""
+        try:
+            figure, height = build_capacity_figure(
+                n,
+                label,
+                carrier,
+                country_mode=country_mode,
+                selected_countries=selected_countries,
+                is_dark_mode=is_dark_mode,
+                cache=cache,
+            )
+        except Exception as e:
+            return create_error_message(f"carrier '{carrier}'", e)
+        # Add the graph without wrapping in dbc.Col so it takes full width
+        return dcc.Graph(figure=figure, className="mb-4", style={"height": f"{height}px"})
+
+    def update_carrier_charts(
+        tab: str,
+        render: Callable[[str], dcc.Graph | html.Div],
+        render_key: list[Any],
+        selected_carriers: list[str] | None,
+        rendered: dict[str, Any] | None,
+    ) -> tuple[Any, Any]:
+        """
+        Show one chart per selected carrier, appending and removing charts through a ``Patch`` where possible.
 
-        if not selected_carriers:
-            return [PLEASE_SELECT_CARRIER_MSG]
+        Only the charts of newly selected carriers are rendered and sent; charts
+        of deselected carriers are deleted in the browser. Charts are rendered
+        afresh when the network, country filter or theme changed. A superseded
+        request stops between two carriers. Past the deadline, charts that are
+        not cached are replaced by placeholders and finished in the background.
 
-        # Use helper for country filtering
-        query, facet_col, error_message = get_country_filter(country_mode, selected_countries)
-        if error_message:
-            return [error_message]
+        Returns
+        -------
+        tuple
+            The container's children (or a ``Patch`` of them) and its new render state
+        """
 
-        charts: list[dcc.Graph | html.Div] = []
+        pending: list[str] = []
 
-        for carrier in selected_carriers:
+        def render_next(carrier: str) -> dcc.Graph | html.Div:
+            with suppress(DeadlineExceeded):
+                # Past the deadline, charts are still built from cached statistics; others stop at their first computation
+                checkpoint()
             try:
-                # Generate capacity bar chart directly with carrier
-                fig: go.Figure = s.optimal_capacity.iplot.bar(
-                    x="value",
-                    y="carrier",
-                    color="carrier",
-                    bus_carrier=carrier,
-                    width=None,
-                    height=500,
-                    nice_names=True,
-                    query=query,
-                    facet_col=facet_col,
-                )
-
-                # Set title based on selections
-                carrier_name = get_carrier_nice_name(n, carrier)
-                title = f"Optimal Capacity for {carrier_name}"
-                if facet_col and selected_countries:
-                    countries_str = ", ".join(selected_countries)
-                    title += f" (Countries: {countries_str})"
-
-                height = _compute_bar_chart_height(fig)
-                fig.update_layout(
-                    title=title,
-                    paper_bgcolor=bg_color,
-                    plot_bgcolor=bg_color,
-                    template=template,
-                    height=height,
-                    margin={"l": 160, "r": 60, "t": 80, "b": 60},
-                    showlegend=False,
-                )
-
-                # Remove redundant carrier axis title and keep consistent height
-                fig.update_yaxes(title_text="")
-
-                # Add the graph without wrapping in dbc.Col so it takes full width
-                charts.append(
-                    dcc.Graph(
-                        figure=fig,
-                        className="mb-4",
-                        style={"height": f"{height}px"},
-                    )
+                return render(carrier)
+            except DeadlineExceeded:
+                pending.append(carrier)
+                return create_pending_chart_message(f"carrier '{carrier}'")
+
+        def render_state(shown: list[str]) -> dict[str, Any]:
+            state: dict[str, Any] = {"key": render_key, "carriers": shown}
+            if pending:
+                state["partial"] = True
+                finish_in_background(
+                    {background_chart_key(tab, render_key, carrier): partial(render, carrier) for carrier in pending}
                 )
-
-            except Exception as e:
-                message = create_error_message(f"carrier '{carrier}'", e)
-                charts.append(message)
-
-        # If no charts were created successfully, show a message
-        if not charts:
-            return [NO_DATA_MSG]
-
-        return charts
-
-    # Callback for CAPEX charts
-    @app.callback(
-        Output("capex-charts-container", "children"),
-        [
-            Input("global-country-mode", "value"),
-            Input("global-country-selector", "value"),
-            Input("network-selector", "data"),
-            Input("tabs", "value"),
-            Input("dark-mode-store", "data"),
-        ],
-        prevent_initial_call=True,
-    )
-    def update_capex_charts(
+            return state
+
+        carriers = list(dict.fromkeys(selected_carriers or []))
+        plan = plan_carrier_chart_updates(rendered, render_key, carriers)
+        if plan is None:
+            children = [render_next(carrier) for carrier in carriers]
+            return children, render_state(carriers)
+
+        removed, added = plan
+        if not removed and not added:
+            return dash.no_update, dash.no_update
+        patch = Patch()
+        for position in removed:
+            del patch[position]
+        for carrier in added:
+            patch.append(render_next(carrier))
+        kept = [carrier for carrier in rendered["carriers"] if carrier in carriers] if rendered else []
+        return patch, render_state(kept + added)
+
+    def render_expenditure_charts(
+        statistic: str,
+        error_context: str,
         country_mode: str,
         selected_countries: list[str],
-        selected_network_label: str | None,
-        active_tab: str,
+        selected_network_label: str,
         is_dark_mode: bool,
     ) -> list[dcc.Graph | html.Div]:
-        # Only render if this tab is active OR if tab just became active
-        if active_tab != "capex" and ctx.triggered_id != "tabs":
-            return cast(list[dcc.Graph | html.Div], dash.no_update)
-
-        if not selected_network_label or selected_network_label not in networks:
-            return [NO_NETWORK_SELECTED_MSG]
-
+        """Render the CAPEX or OPEX totals chart of the selected network."""
         n = networks[selected_network_label]
-        s = n.statistics
-
-        # Select colors and template based on dark mode
-        colors = COLORS_DARK if is_dark_mode else COLORS
-        bg_color = colors["background"]
-        template = PLOTLY_TEMPLATE_NAME_DARK if is_dark_mode else PLOTLY_TEMPLATE_NAME
 
         # Use helper for country filtering
-        query, facet_col, error_message = get_country_filter(country_mode, selected_countries)
+        _, _, error_message = get_country_selection(country_mode, selected_countries)
         if error_message:
             return [error_message]
 
         try:
-            # Generate CAPEX bar chart
-            fig: go.Figure = s.capex.iplot.bar(
-                x="value",
-                y="carrier",
-                color="carrier",
-                nice_names=True,
-                height=1000,
-                width=None,
-                query=query,
-                facet_col=facet_col,
+            figure, height = build_expenditure_figure(
+                n,
+                selected_network_label,
+                statistic,
+                country_mode=country_mode,
+                selected_countries=selected_countries,
+                is_dark_mode=is_dark_mode,
+                cache=cache,
             )
 
-            # Set title based on selections
-            title = "Capital Expenditure Totals"
-            if facet_col and selected_countries:
-                countries_str = ", ".join(selected_countries)
-                title += f" (Countries: {countries_str})"
-
-            height = _compute_bar_chart_height(fig, base_height=260, bar_height=40, min_height=360, max_height=1200)
-            fig.update_layout(
-                title=title,
-                height=height,
-                margin={"l": 160, "r": 60, "t": 100, "b": 60},
-                paper_bgcolor=bg_color,
-                plot_bgcolor=bg_color,
-                template=template,
-                showlegend=False,
-            )
-            fig.update_yaxes(title_text="")
-
             # Return the graph with explicit height in component
             return [
                 dcc.Graph(
-                    figure=fig,
+                    figure=figure,
                     className="mb-4",
                     style={"height": f"{height}px"},
                 )
             ]
 
         except Exception as e:
-            message = create_error_message("CAPEX chart", e)
+            message = create_error_message(error_context, e)
             return [message]
 
-    # Callback for OPEX charts
-    @app.callback(
-        Output("opex-charts-container", "children"),
-        [
-            Input("global-country-mode", "value"),
-            Input("global-country-selector", "value"),
-            Input("network-selector", "data"),
-            Input("tabs", "value"),
-            Input("dark-mode-store", "data"),
-        ],
-        prevent_initial_call=True,
-    )
-    def update_opex_charts(
+    def render_tab(
+        tab: str,
+        selected_carriers: list[str] | None,
         country_mode: str,
         selected_countries: list[str],
         selected_network_label: str | None,
-        active_tab: str,
         is_dark_mode: bool,
-    ) -> list[dcc.Graph | html.Div]:
-        # Only render if this tab is active OR if tab just became active
-        if active_tab != "opex" and ctx.triggered_id != "tabs":
-            return cast(list[dcc.Graph | html.Div], dash.no_update)
+        rendered: dict[str, Any] | None,
+    ) -> tuple[Any, Any]:
+        """
+        Render the charts of one tab, or update them where they are only partly out of date.
+
+        Returns
+        -------
+        tuple
+            The children of the tab's chart container (``dash.no_update`` when they
+            are current) and the tab's new render state, ``None`` for a message
+        """
+
+        # The timeseries container shows a message as its only child, the others as a list
+        def message(component: html.Div) -> tuple[Any, None]:
+            return (component if tab == "energy-balance" else [component]), None
 
         if not selected_network_label or selected_network_label not in networks:
-            return [NO_NETWORK_SELECTED_MSG]
+            return message(NO_NETWORK_SELECTED_MSG)
 
         n = networks[selected_network_label]
-        s = n.statistics
+        render_key = carrier_chart_render_key(n, selected_network_label, country_mode, selected_countries, is_dark_mode)
+
+        if tab in EXPENDITURE_TITLES:
+            if rendered and rendered.get("key") == render_key and not rendered.get("partial"):
+                return dash.no_update, dash.no_update
+            render_expenditure = partial(
+                render_expenditure_charts,
+                tab,
+                f"{tab.upper()} chart",
+                country_mode,
+                selected_countries,
+                selected_network_label,
+                is_dark_mode,
+            )
+            try:
+                return render_expenditure(), {"key": render_key, "carriers": None}
+            except DeadlineExceeded:
+                finish_in_background({background_chart_key(tab, render_key): render_expenditure})
+                return [create_pending_chart_message(f"{tab.upper()} chart")], {
+                    "key": render_key,
+                    "carriers": None,
+                    "partial": True,
+                }
 
-        # Select colors and template based on dark mode
-        colors = COLORS_DARK if is_dark_mode else COLORS
-        bg_color = colors["background"]
-        template = PLOTLY_TEMPLATE_NAME_DARK if is_dark_mode else PLOTLY_TEMPLATE_NAME
+        if not selected_carriers:
+            return message(PLEASE_SELECT_CARRIER_MSG)
 
         # Use helper for country filtering
-        query, facet_col, error_message = get_country_filter(country_mode, selected_countries)
+        _, _, error_message = get_country_selection(country_mode, selected_countries)
         if error_message:
-            return [error_message]
+            return message(error_message)
 
-        try:
-            # Generate OPEX bar chart
-            fig: go.Figure = s.opex.iplot.bar(
-                x="value",
-                y="carrier",
-                color="carrier",
-                nice_names=True,
-                height=1000,
-                width=None,
-                query=query,
-                facet_col=facet_col,
-            )
+        render: Callable[[str], dcc.Graph | html.Div]
+        if tab == "capacity":
 
-            # Set title based on selections
-            title = "Operational Expenditure Totals"
-            if facet_col and selected_countries:
-                countries_str = ", ".join(selected_countries)
-                title += f" (Countries: {countries_str})"
-
-            height = _compute_bar_chart_height(fig, base_height=260, bar_height=40, min_height=360, max_height=1200)
-            fig.update_layout(
-                title=title,
-                height=height,
-                margin={"l": 160, "r": 60, "t": 100, "b": 60},
-                paper_bgcolor=bg_color,
-                plot_bgcolor=bg_color,
-                template=template,
-                showlegend=False,
-            )
-            fig.update_yaxes(title_text="")
+            def render(carrier: str) -> dcc.Graph | html.Div:
+                return render_capacity_chart(
+                    n, selected_network_label, carrier, country_mode, selected_countries, is_dark_mode
+                )
 
-            # Return the graph with explicit height in component
-            return [
-                dcc.Graph(
-                    figure=fig,
-                    className="mb-4",
-                    style={"height": f"{height}px"},
+        else:
+
+            def render(carrier: str) -> dcc.Graph | html.Div:
+                return render_energy_balance_chart(
+                    n,
+                    selected_network_label,
+                    carrier,
+                    tab == "energy-balance-aggregated",
+                    country_mode,
+                    selected_countries,
+                    is_dark_mode,
                 )
-            ]
 
-        except Exception as e:
-            message = create_error_message("OPEX chart", e)
-            return [message]
+        return update_carrier_charts(tab, render, render_key, selected_carriers, rendered)
+
+    filter_inputs = [
+        Input("global-carrier-selector", "value"),
+        Input("global-country-mode", "value"),
+        Input("global-country-selector", "value"),
+        Input("network-selector", "data"),
+        Input("tabs", "value"),
+        Input("dark-mode-store", "data"),
+    ]
+
+    # Filter changes are looked up in the browser's figure cache (assets/figure_cache.js) first;
+    # only misses reach the server, as a chart request
+    app.clientside_callback(
+        ClientsideFunction(CLIENTSIDE_NAMESPACE, "lookupCharts"),
+        [Output(container, "children", allow_duplicate=True) for container in CHART_TAB_CONTAINERS.values()]
+        + [Output("chart-tabs-rendered", "data", allow_duplicate=True), Output("chart-request", "data")],
+        filter_inputs,
+        [
+            State("network-registry", "data"),
+            State("chart-tabs-rendered", "data"),
+            State("figure-cache-config", "data"),
+        ],
+        prevent_initial_call=True,
+    )
+
+    # Charts rendered by the server are stored in the figure cache
+    app.clientside_callback(
+        ClientsideFunction(CLIENTSIDE_NAMESPACE, "storeCharts"),
+        Input("chart-tabs-rendered", "data"),
+        [
+            State("chart-request", "data"),
+            State("network-registry", "data"),
+            State("figure-cache-config", "data"),
+        ]
+        + [State(container, "children") for container in CHART_TAB_CONTAINERS.values()],
+        prevent_initial_call=True,
+    )
+
+    # One callback serves the chart requests of all chart tabs: filter changes render the
+    # active tab only, hidden tabs keep their charts until they are activated
+    @app.callback(
+        [Output(container, "children") for container in CHART_TAB_CONTAINERS.values()]
+        + [Output("chart-tabs-rendered", "data")],
+        [Input("chart-request", "data")],
+        [State("chart-tabs-rendered", "data")],
+        prevent_initial_call=True,
+    )
+    def update_active_tab_charts(request: dict[str, Any] | None, rendered: dict[str, Any] | None) -> list[Any]:
+        """
+        Render the charts of the active tab.
+
+        ``request`` holds the active tab, network, carriers, country filter and
+        theme, as sent by the ``lookupCharts`` clientside callback when the
+        browser's figure cache has no charts for them. The render state of every
+        chart tab records the network, filters and theme its charts were rendered
+        for. Hidden tabs are not rendered on filter changes; their render state no
+        longer matches, which marks them stale, so they are rendered when
+        activated. Activating a tab whose charts are current sends nothing.
+
+        Requests carrying the browser ``session`` and a ``sequence`` number have
+        latest-wins semantics: a newer request of the session cancels this one
+        between carriers and statistics calls, and nothing is updated for it.
+        Past the chart deadline, the charts that are not done are shown as
+        placeholders and finished in the background; the render state of the
+        tab is marked ``"partial"``, so the tab is rendered again when the user
+        returns to it.
+        """
+        outputs: list[Any] = [dash.no_update] * (len(CHART_TAB_CONTAINERS) + 1)
+        active_tab = (request or {}).get("tab")
+        if request is None or active_tab not in CHART_TAB_CONTAINERS:
+            return outputs
+
+        def render_request() -> tuple[Any, Any]:
+            return render_tab(
+                active_tab,
+                request.get("carriers"),
+                request.get("country_mode", "All"),
+                request.get("countries") or [],
+                request.get("network"),
+                bool(request.get("dark")),
+                (rendered or {}).get(active_tab),
+            )
+
+        session = request.get("session")
+        if session is None:
+            scope = cancellation_scope(CancelToken(chart_deadline))
+        else:
+            scope = latest.run(session, int(request.get("sequence") or 0), chart_deadline)
+        try:
+            with scope:
+                children, state = render_request()
+        except Cancelled:
+            # The browser discards the response of a superseded request anyway
+            raise dash.exceptions.PreventUpdate from None
+        if children is dash.no_update:
+            return outputs
+
+        outputs[list(CHART_TAB_CONTAINERS).index(active_tab)] = children
+        tab_states = Patch()
+        tab_states[active_tab] = state
+        outputs[-1] = tab_states
+        return outputs
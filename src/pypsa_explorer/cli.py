@@ -1,6 +1,6 @@
 """Command-line interface for PyPSA Explorer."""
 
-from typing import TYPE_CHECKING, Annotated, cast
+from typing import TYPE_CHECKING, Annotated, Any, cast
 
 if TYPE_CHECKING:
     import pypsa
@@ -9,13 +9,34 @@ import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from typer.core import TyperGroup
 
 from pypsa_explorer import __version__
-from pypsa_explorer.app import run_dashboard
-from pypsa_explorer.utils.network_loader import parse_cli_network_args
+
+# Command run when the arguments do not start with the name of a command
+DEFAULT_COMMAND = "serve"
+
+
+class DashboardGroup(TyperGroup):
+    """
+    Command group that launches the dashboard unless a command is named.
+
+    ``pypsa-explorer network.nc`` runs ``pypsa-explorer serve network.nc``; network
+    files named like a command are opened with an explicit ``serve``.
+    """
+
+    # The context is click's or, in newer typer releases, that of typer's vendored copy of click
+    def parse_args(self, ctx: Any, args: list[str]) -> list[str]:
+        # Options of the group itself, e.g. --help and --install-completion, stay with the group
+        group_options = {option for param in self.get_params(ctx) for option in param.opts}
+        if not args or (args[0] not in self.commands and args[0] not in group_options):
+            args = [DEFAULT_COMMAND, *args]
+        return super().parse_args(ctx, args)
+
 
 app = typer.Typer(
     name="pypsa-explorer",
+    cls=DashboardGroup,
     help="🔌 Interactive dashboard for visualizing PyPSA energy system networks",
     add_completion=True,
     rich_markup_mode="rich",
@@ -24,6 +45,20 @@ app = typer.Typer(
 console = Console()
 
 
+def run_dashboard(**kwargs: Any) -> None:
+    """Run the dashboard; the server stack is imported only when a dashboard is started."""
+    from pypsa_explorer.app import run_dashboard as _run_dashboard
+
+    _run_dashboard(**kwargs)
+
+
+def parse_cli_network_args(args: list[str]) -> dict[str, str]:
+    """Parse ``path`` or ``path:label`` arguments (see :mod:`pypsa_explorer.utils.network_loader`)."""
+    from pypsa_explorer.utils.network_loader import parse_cli_network_args as _parse_cli_network_args
+
+    return _parse_cli_network_args(args)
+
+
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
@@ -31,7 +66,7 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
-@app.command()
+@app.command(DEFAULT_COMMAND)
 def main(
     networks: Annotated[
         list[str] | None,
@@ -66,6 +101,46 @@ def main(
             rich_help_panel="Server Options",
         ),
     ] = True,
+    watch_dir: Annotated[
+        str | None,
+        typer.Option(
+            "--watch-dir",
+            help="Directory to watch: new .nc files are registered lazily and modified ones reloaded",
+            rich_help_panel="Network Options",
+        ),
+    ] = None,
+    cache: Annotated[
+        str | None,
+        typer.Option(
+            "--cache",
+            help="Result cache: memory, shm (shared by all workers), diskcache:DIR, or a directory for a SQLite cache",
+            rich_help_panel="Server Options",
+        ),
+    ] = None,
+    log_metrics: Annotated[
+        bool,
+        typer.Option(
+            "--log-metrics",
+            help="Log the timings and payload size of every data callback request as a JSON line",
+            rich_help_panel="Server Options",
+        ),
+    ] = False,
+    profile: Annotated[
+        str | None,
+        typer.Option(
+            "--profile",
+            help="Profile every data callback: cProfile files and flamegraph-ready folded stacks are written to this directory",
+            rich_help_panel="Server Options",
+        ),
+    ] = None,
+    chart_deadline: Annotated[
+        float | None,
+        typer.Option(
+            "--chart-deadline",
+            help="Seconds a chart request may take; charts not done by then are shown as placeholders and finished in the background",
+            rich_help_panel="Server Options",
+        ),
+    ] = None,
     _version: Annotated[
         bool | None,
         typer.Option(
@@ -91,11 +166,29 @@ def main(
     [cyan]# Run with multiple networks (with labels)[/cyan]
     $ pypsa-explorer network1.nc:Region1 network2.nc:Region2
 
+    [cyan]# Open a network file named like a command[/cyan]
+    $ pypsa-explorer serve export
+
     [cyan]# Run with custom host and port[/cyan]
     $ pypsa-explorer --host 0.0.0.0 --port 8080
 
     [cyan]# Run in production mode (no debug)[/cyan]
     $ pypsa-explorer --no-debug
+
+    [cyan]# Serve every network a solver writes into a directory[/cyan]
+    $ pypsa-explorer --watch-dir results/
+
+    [cyan]# Keep computed charts in a cache that survives restarts[/cyan]
+    $ pypsa-explorer network.nc --cache .explorer-cache/
+
+    [cyan]# Record callback profiles while using the dashboard[/cyan]
+    $ pypsa-explorer network.nc --profile profiles/
+
+    [cyan]# Export a static report instead of serving the dashboard[/cyan]
+    $ pypsa-explorer export network.nc --out report/
+
+    [cyan]# Precompute every view into a cache, e.g. in CI[/cyan]
+    $ pypsa-explorer precompute network.nc --out .explorer-cache/
     """
     # Parse network arguments
     networks_input = None
@@ -121,13 +214,17 @@ def main(
 
     # Display startup banner
     network_summary = len(networks_input) if networks_input else "interactive"
+    if watch_dir:
+        network_summary = f"{network_summary} + watching {watch_dir}"
+
+    profile_line = f"\n⏱  Profiling: [yellow]{profile}[/yellow]" if profile else ""
 
     startup_panel = Panel.fit(
         f"""[bold cyan]PyPSA Explorer[/bold cyan] [green]v{__version__}[/green]
 
 🌐 Server: [yellow]{host}:{port}[/yellow]
 🐛 Debug Mode: [yellow]{"enabled" if debug else "disabled"}[/yellow]
-📁 Networks: [yellow]{network_summary}[/yellow]
+📁 Networks: [yellow]{network_summary}[/yellow]{profile_line}
 
 [dim]Press Ctrl+C to stop the server[/dim]""",
         title="🔌 Starting Dashboard",
@@ -144,6 +241,11 @@ def main(
             host=host,
             port=port,
             load_default_on_start=networks_input is not None,
+            watch_dir=watch_dir,
+            cache_backend=cache,
+            log_metrics=log_metrics,
+            profile_dir=profile,
+            chart_deadline=chart_deadline,
         )
     except KeyboardInterrupt:
         console.print("\n[yellow]⏹  Shutting down PyPSA Explorer...[/yellow]")
@@ -153,6 +255,183 @@ def main(
         raise typer.Exit(1) from e
 
 
+@app.command("export", help="📄 Render every dashboard chart to a static report bundle")
+def export(
+    networks: Annotated[
+        list[str],
+        typer.Argument(
+            help="Network files to export. Format: path or path:label",
+            show_default=False,
+        ),
+    ],
+    out: Annotated[
+        str,
+        typer.Option(
+            "--out",
+            "-o",
+            help="Directory receiving the report bundle",
+        ),
+    ] = "report",
+    carriers: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--carrier",
+            "-c",
+            help="Bus carrier to render (repeatable); defaults to all bus carriers",
+            show_default=False,
+        ),
+    ] = None,
+    dark: Annotated[
+        bool,
+        typer.Option(
+            "--dark",
+            help="Render the charts in the dark theme",
+        ),
+    ] = False,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-j",
+            help="Number of rendering processes; defaults to the number of CPUs",
+            show_default=False,
+        ),
+    ] = None,
+) -> None:
+    """
+    Export a static HTML/JSON report of all networks, without a server.
+
+    [dim]Examples:[/dim]
+
+    [cyan]# Render all tabs of two scenarios into report/[/cyan]
+    $ pypsa-explorer export base.nc:Base high_res.nc:HighRES --out report/
+
+    [cyan]# Only the AC carrier, with four processes[/cyan]
+    $ pypsa-explorer export network.nc -c AC -j 4
+    """
+    from pypsa_explorer.export import export_report
+
+    try:
+        network_paths = parse_cli_network_args(networks)
+    except Exception as e:
+        console.print(f"[bold red]❌ Error parsing network arguments:[/bold red] {e}")
+        raise typer.Exit(1) from None
+
+    failed = 0
+
+    def report_progress(result: Any) -> None:
+        nonlocal failed
+        chart = f"{result.job.label} / {result.job.name}"
+        if result.error is not None:
+            failed += 1
+            console.print(f"[red]✗[/red] {chart}: {result.error}")
+        else:
+            console.print(f"[green]✓[/green] {chart}")
+
+    try:
+        index = export_report(
+            dict(network_paths),
+            out,
+            carriers=carriers or None,
+            is_dark_mode=dark,
+            workers=workers,
+            progress=report_progress,
+        )
+    except Exception as e:
+        console.print(f"[bold red]❌ Error:[/bold red] {e}")
+        raise typer.Exit(1) from e
+
+    summary = f" ([yellow]{failed} charts failed[/yellow])" if failed else ""
+    console.print(f"\n📄 Report written to [green]{index}[/green]{summary}")
+
+
+# Theme names accepted by ``precompute --theme``, mapped to dark mode flags
+THEMES = {"light": False, "dark": True}
+
+
+@app.command("precompute", help="🧮 Precompute a persistent cache so the dashboard serves every view warm")
+def precompute(
+    networks: Annotated[
+        list[str],
+        typer.Argument(
+            help="Network files to precompute. Format: path or path:label",
+            show_default=False,
+        ),
+    ],
+    out: Annotated[
+        str,
+        typer.Option(
+            "--out",
+            "-o",
+            help="Cache to fill: a directory for a SQLite cache, shm, or diskcache:DIR",
+        ),
+    ] = "cache",
+    themes: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--theme",
+            help="Theme to render figures for: light or dark (repeatable); defaults to both",
+            show_default=False,
+        ),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-j",
+            help="Number of worker processes; defaults to the number of CPUs",
+            show_default=False,
+        ),
+    ] = None,
+) -> None:
+    """
+    Precompute filter options, statistics, charts and maps into a cache, without a server.
+
+    Start the dashboard with [cyan]--cache[/cyan] pointing to the same cache to serve
+    these views without computing them.
+
+    [dim]Examples:[/dim]
+
+    [cyan]# In CI or on the solver cluster[/cyan]
+    $ pypsa-explorer precompute networks/*.nc --out cache/
+
+    [cyan]# On the serving host[/cyan]
+    $ pypsa-explorer networks/*.nc --cache cache/
+    """
+    from pypsa_explorer.precompute import precompute_cache
+
+    unknown = sorted(set(themes or []) - set(THEMES))
+    if unknown:
+        console.print(f"[bold red]❌ Unknown theme:[/bold red] {', '.join(unknown)} (choose from light, dark)")
+        raise typer.Exit(1)
+    dark_flags = tuple(dict.fromkeys(THEMES[theme] for theme in themes)) if themes else tuple(THEMES.values())
+
+    try:
+        network_paths = parse_cli_network_args(networks)
+    except Exception as e:
+        console.print(f"[bold red]❌ Error parsing network arguments:[/bold red] {e}")
+        raise typer.Exit(1) from None
+
+    def report_progress(result: Any) -> None:
+        if result.error is not None:
+            console.print(f"[red]✗[/red] {result.label}: {result.error}")
+        else:
+            map_note = "" if result.map else ", no map"
+            console.print(f"[green]✓[/green] {result.label}: {result.charts} charts{map_note} ({result.seconds:.1f}s)")
+
+    try:
+        results = precompute_cache(dict(network_paths), out, themes=dark_flags, workers=workers, progress=report_progress)
+    except Exception as e:
+        console.print(f"[bold red]❌ Error:[/bold red] {e}")
+        raise typer.Exit(1) from e
+
+    failed = [result.label for result in results if result.error is not None]
+    if failed:
+        console.print(f"\n[bold red]❌ {len(failed)} networks failed[/bold red]")
+        raise typer.Exit(1)
+    console.print(f"\n🧮 Cache written to [green]{out}[/green]; serve it with [cyan]--cache {out}[/cyan]")
+
+
 def cli() -> None:
     """CLI entry point wrapper."""
     app()
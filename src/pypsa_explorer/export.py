@@ -0,0 +1,388 @@
+"""Static report export: render every dashboard chart to HTML and JSON without a server."""
+
+import hashlib
+import html
+import json
+import logging
+import re
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any
+from urllib.error import URLError
+from urllib.parse import urlsplit
+from urllib.request import urlopen
+
+import plotly.io as pio
+import pypsa
+from plotly.offline import get_plotlyjs
+
+from pypsa_explorer.callbacks.visualizations import (
+    EXPENDITURE_TITLES,
+    build_capacity_figure,
+    build_energy_balance_figure,
+    build_expenditure_figure,
+)
+from pypsa_explorer.config import setup_plotly_theme
+from pypsa_explorer.utils.cache import ResultCache
+from pypsa_explorer.utils.helpers import get_carrier_nice_name, summarize_network
+from pypsa_explorer.utils.network_loader import load_network_file
+
+# Report sections in dashboard tab order, mapped to their headings
+REPORT_TABS = {
+    "energy-balance": "Energy Balance Timeseries",
+    "energy-balance-aggregated": "Energy Balance Totals",
+    "capacity": "Capacity Totals",
+    "capex": "CAPEX Totals",
+    "opex": "OPEX Totals",
+    "map": "Network Map",
+}
+
+PLOTLY_JS_FILENAME = "plotly.min.js"
+
+# Directory of the bundle receiving the scripts and stylesheets of the network maps
+ASSETS_DIRNAME = "assets"
+
+# Seconds to wait for the download of a map asset
+ASSET_TIMEOUT = 30
+
+logger = logging.getLogger(__name__)
+
+_IFRAME_SRCDOC = re.compile(r'<iframe[^>]*\ssrcdoc="([^"]*)"', re.DOTALL)
+_REMOTE_ASSET = re.compile(r'(<(?:script|link)\b[^>]*?\s(?:src|href)=["\'])(https?://[^"\']+)(["\'])', re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """One chart of the report: a tab of one network, for one bus carrier where applicable."""
+
+    label: str
+    path: str
+    tab: str
+    carrier: str | None = None
+    is_dark_mode: bool = False
+
+    @property
+    def name(self) -> str:
+        """File name stem of the rendered chart."""
+        return _slug(f"{self.tab}-{self.carrier}" if self.carrier else self.tab)
+
+
+@dataclass
+class RenderResult:
+    """Output of a :class:`RenderJob`: the figure JSON and HTML fragment, or an error."""
+
+    job: RenderJob
+    title: str = ""
+    figure_json: str | None = None
+    html: str | None = None
+    height: int = 0
+    error: str | None = None
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", value).strip("_") or "network"
+
+
+def _unique_slugs(labels: Iterable[str]) -> dict[str, str]:
+    """Map labels to directory names, numbering labels whose slugs collide."""
+    slugs: dict[str, str] = {}
+    taken: set[str] = set()
+    for label in labels:
+        base = slug = _slug(label)
+        suffix = 2
+        while slug.casefold() in taken:
+            slug = f"{base}-{suffix}"
+            suffix += 1
+        taken.add(slug.casefold())
+        slugs[label] = slug
+    return slugs
+
+
+def _fetch_asset(url: str) -> bytes:
+    with urlopen(url, timeout=ASSET_TIMEOUT) as response:
+        return response.read()
+
+
+def bundle_map_assets(fragment: str, output_dir: Path, assets: dict[str, str | None]) -> str:
+    """
+    Turn a map's HTML fragment into a page loading its scripts and stylesheets from the bundle.
+
+    Maps are rendered as an ``<iframe srcdoc=...>`` fragment whose document loads
+    its libraries from CDNs; the document is unwrapped and every remote script and
+    stylesheet is downloaded once to ``output_dir/assets/``. Assets that cannot be
+    downloaded keep their remote URL, and the base map tiles are always loaded
+    from the tile server when the map is viewed.
+
+    Parameters
+    ----------
+    fragment : str
+        HTML of the map, as returned by ``_repr_html_()``
+    output_dir : Path
+        Root directory of the bundle
+    assets : dict
+        Downloaded assets by URL, holding their path relative to ``output_dir`` or
+        ``None`` for failed downloads; shared between the maps of one export
+
+    Returns
+    -------
+    str
+        Map page for ``output_dir/<network>/map.html``
+    """
+    match = _IFRAME_SRCDOC.search(fragment)
+    document = html.unescape(match.group(1)) if match else fragment
+
+    def localize(match: re.Match[str]) -> str:
+        url = match.group(2)
+        if url not in assets:
+            name = Path(urlsplit(url).path).name or "asset"
+            path = f"{ASSETS_DIRNAME}/{hashlib.sha1(url.encode()).hexdigest()[:8]}-{_slug(name)}"
+            try:
+                content = _fetch_asset(url)
+            except (URLError, OSError) as e:
+                logger.warning("Could not bundle map asset %s, the map loads it remotely: %s", url, e)
+                assets[url] = None
+            else:
+                (output_dir / ASSETS_DIRNAME).mkdir(exist_ok=True)
+                (output_dir / path).write_bytes(content)
+                assets[url] = path
+        local_path = assets[url]
+        return f"{match.group(1)}../{local_path}{match.group(3)}" if local_path else match.group(0)
+
+    return _REMOTE_ASSET.sub(localize, document)
+
+
+@cache
+def _worker_network(path: str) -> pypsa.Network:
+    """Load a network once per worker process."""
+    return load_network_file(path)
+
+
+@cache
+def _worker_cache() -> ResultCache:
+    """Cache shared by the jobs of one worker, so statistics are computed once per network."""
+    setup_plotly_theme()
+    return ResultCache()
+
+
+def render_job(job: RenderJob) -> RenderResult:
+    """
+    Render one chart of the report.
+
+    This runs in the worker processes of :func:`export_report`; errors are
+    returned rather than raised so that one broken chart does not abort the export.
+
+    Parameters
+    ----------
+    job : RenderJob
+        Chart to render
+
+    Returns
+    -------
+    RenderResult
+        The rendered chart
+    """
+    result = RenderResult(job)
+    try:
+        result_cache = _worker_cache()
+        n = _worker_network(job.path)
+        if job.tab == "map":
+            result.title = REPORT_TABS["map"]
+            result.html = n.plot.explore(tooltip=True)._repr_html_()  # type: ignore[call-arg, attr-defined]
+            return result
+
+        if job.tab in ("energy-balance", "energy-balance-aggregated"):
+            figure, height = build_energy_balance_figure(
+                n,
+                job.label,
+                str(job.carrier),
+                aggregated=job.tab == "energy-balance-aggregated",
+                is_dark_mode=job.is_dark_mode,
+                cache=result_cache,
+            )
+        elif job.tab == "capacity":
+            figure, height = build_capacity_figure(
+                n, job.label, str(job.carrier), is_dark_mode=job.is_dark_mode, cache=result_cache
+            )
+        else:
+            figure, height = build_expenditure_figure(
+                n, job.label, job.tab, is_dark_mode=job.is_dark_mode, cache=result_cache
+            )
+        result.title = get_carrier_nice_name(n, job.carrier) if job.carrier else EXPENDITURE_TITLES[job.tab]
+        result.height = height
+        result.figure_json = pio.to_json(figure, validate=False)
+        result.html = pio.to_html(figure, full_html=False, include_plotlyjs=False, default_height=height, validate=False)
+    except Exception as e:  # noqa: BLE001 - reported in the bundle instead
+        result.error = str(e) or type(e).__name__
+    return result
+
+
+def plan_jobs(networks: dict[str, str], *, carriers: list[str] | None = None, is_dark_mode: bool = False) -> list[RenderJob]:
+    """
+    List the charts of a report.
+
+    Parameters
+    ----------
+    networks : dict
+        Mapping of network labels to network file paths
+    carriers : list[str], optional
+        Bus carriers to render; defaults to all bus carriers of each network
+    is_dark_mode : bool
+        Whether to render the charts in the dark theme
+
+    Returns
+    -------
+    list[RenderJob]
+        One job per network, tab and (where applicable) bus carrier
+    """
+    jobs: list[RenderJob] = []
+    for label, path in networks.items():
+        network_carriers = carriers
+        if network_carriers is None:
+            n = _worker_network(path)
+            network_carriers = sorted(c for c in n.buses.carrier.unique() if c != "none")
+        for tab in REPORT_TABS:
+            if tab in ("energy-balance", "energy-balance-aggregated", "capacity"):
+                jobs.extend(RenderJob(label, path, tab, carrier, is_dark_mode) for carrier in network_carriers)
+            else:
+                jobs.append(RenderJob(label, path, tab, is_dark_mode=is_dark_mode))
+    return jobs
+
+
+def _render_all(jobs: list[RenderJob], workers: int | None) -> Iterator[RenderResult]:
+    if workers == 1 or len(jobs) <= 1:
+        yield from map(render_job, jobs)
+        return
+    # Jobs of one network are submitted next to each other, so each worker loads few networks;
+    # networks already loaded by plan_jobs() are inherited by forked workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(render_job, jobs)
+
+
+def export_report(
+    networks: dict[str, str],
+    output_dir: str | Path,
+    *,
+    carriers: list[str] | None = None,
+    is_dark_mode: bool = False,
+    workers: int | None = None,
+    progress: Callable[[RenderResult], None] | None = None,
+) -> Path:
+    """
+    Render every dashboard tab of every network into a static report bundle.
+
+    The bundle in ``output_dir`` opens without a server: ``index.html`` links one
+    page per network holding all its charts, each chart is also written as Plotly
+    JSON to ``<network>/figures/``, and ``report.json`` describes the bundle.
+    Plotly and the libraries of the network maps are bundled as well, so only
+    the base map tiles need an internet connection.
+    Charts are rendered in parallel by a pool of worker processes.
+
+    Parameters
+    ----------
+    networks : dict
+        Mapping of network labels to network file paths
+    output_dir : str or Path
+        Directory receiving the bundle; created if missing
+    carriers : list[str], optional
+        Bus carriers to render; defaults to all bus carriers of each network
+    is_dark_mode : bool
+        Whether to render the charts in the dark theme
+    workers : int, optional
+        Number of worker processes; defaults to the number of CPUs. ``1`` renders
+        in the current process.
+    progress : callable, optional
+        Called with every finished chart
+
+    Returns
+    -------
+    Path
+        Path of the report's ``index.html``
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / PLOTLY_JS_FILENAME).write_text(get_plotlyjs(), encoding="utf-8")
+
+    jobs = plan_jobs(networks, carriers=carriers, is_dark_mode=is_dark_mode)
+    results: dict[str, list[RenderResult]] = {label: [] for label in networks}
+    for result in _render_all(jobs, workers):
+        results[result.job.label].append(result)
+        if progress is not None:
+            progress(result)
+
+    manifest: dict[str, Any] = {"networks": {}}
+    slugs = _unique_slugs(results)
+    map_assets: dict[str, str | None] = {}
+    for label, network_results in results.items():
+        slug = slugs[label]
+        network_dir = output_dir / slug
+        (network_dir / "figures").mkdir(parents=True, exist_ok=True)
+        charts = []
+        for result in network_results:
+            entry: dict[str, Any] = {"tab": result.job.tab, "carrier": result.job.carrier, "title": result.title}
+            if result.error is not None:
+                entry["error"] = result.error
+            elif result.job.tab == "map":
+                entry["file"] = f"{slug}/map.html"
+                (network_dir / "map.html").write_text(
+                    bundle_map_assets(result.html or "", output_dir, map_assets), encoding="utf-8"
+                )
+            else:
+                entry["file"] = f"{slug}/figures/{result.job.name}.json"
+                entry["height"] = result.height
+                (network_dir / "figures" / f"{result.job.name}.json").write_text(result.figure_json or "", encoding="utf-8")
+            charts.append(entry)
+        (network_dir / "index.html").write_text(_network_page(label, network_results), encoding="utf-8")
+        manifest["networks"][label] = {
+            "page": f"{slug}/index.html",
+            "summary": summarize_network(_worker_network(networks[label])),
+            "charts": charts,
+        }
+
+    (output_dir / "report.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    index = output_dir / "index.html"
+    index.write_text(_index_page(manifest), encoding="utf-8")
+    return index
+
+
+def _page(title: str, body: Iterable[str], plotly_js: str | None = None) -> str:
+    script = f'<script src="{plotly_js}"></script>' if plotly_js else ""
+    return (
+        "<!DOCTYPE html>\n<html>\n<head>\n"
+        f'<meta charset="utf-8">\n<title>{html.escape(title)}</title>\n{script}\n'
+        "<style>body{font-family:sans-serif;margin:2rem auto;max-width:1200px;padding:0 1rem}"
+        "iframe{border:0;width:100%;height:700px}.error{color:#c0392b}</style>\n"
+        f"</head>\n<body>\n<h1>{html.escape(title)}</h1>\n" + "\n".join(body) + "\n</body>\n</html>\n"
+    )
+
+
+def _network_page(label: str, results: list[RenderResult]) -> str:
+    body = []
+    for tab, heading in REPORT_TABS.items():
+        tab_results = [result for result in results if result.job.tab == tab]
+        if not tab_results:
+            continue
+        body.append(f"<h2>{html.escape(heading)}</h2>")
+        for result in tab_results:
+            if result.error is not None:
+                body.append(
+                    f'<p class="error">{html.escape(result.title or result.job.name)}: {html.escape(result.error)}</p>'
+                )
+            elif tab == "map":
+                body.append('<iframe src="map.html" title="Network map"></iframe>')
+            else:
+                body.append(result.html or "")
+    body.insert(0, '<p><a href="../index.html">All networks</a></p>')
+    return _page(label, body, plotly_js=f"../{PLOTLY_JS_FILENAME}")
+
+
+def _index_page(manifest: dict[str, Any]) -> str:
+    rows = []
+    for label, entry in manifest["networks"].items():
+        summary = ", ".join(f"{count} {name}" for name, count in entry["summary"].items())
+        failed = sum("error" in chart for chart in entry["charts"])
+        status = f' <span class="error">({failed} charts failed)</span>' if failed else ""
+        rows.append(f'<li><a href="{html.escape(entry["page"])}">{html.escape(label)}</a> &mdash; {summary}{status}</li>')
+    return _page("PyPSA Explorer Report", ["<ul>", *rows, "</ul>"])
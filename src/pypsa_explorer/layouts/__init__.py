@@ -4,12 +4,14 @@ from pypsa_explorer.layouts.components import (
     NO_DATA_MSG,
     PLEASE_SELECT_CARRIER_MSG,
     PLEASE_SELECT_COUNTRY_MSG,
+    PLEASE_SELECT_SCENARIOS_MSG,
     create_error_message,
 )
 from pypsa_explorer.layouts.dashboard import create_dashboard_layout
 from pypsa_explorer.layouts.tabs import (
     create_capacity_tab,
     create_capex_totals_tab,
+    create_comparison_tab,
     create_energy_balance_aggregated_tab,
     create_energy_balance_tab,
     create_network_map_tab,
@@ -25,9 +27,11 @@ __all__ = [
     "create_capacity_tab",
     "create_capex_totals_tab",
     "create_opex_totals_tab",
+    "create_comparison_tab",
     "create_network_map_tab",
     "create_error_message",
     "PLEASE_SELECT_CARRIER_MSG",
     "PLEASE_SELECT_COUNTRY_MSG",
+    "PLEASE_SELECT_SCENARIOS_MSG",
     "NO_DATA_MSG",
 ]
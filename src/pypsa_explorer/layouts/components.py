@@ -39,6 +39,21 @@ PLEASE_SELECT_COUNTRY_MSG = html.Div(
     className="text-center my-5 p-5 empty-state",
 )
 
+PLEASE_SELECT_SCENARIOS_MSG = html.Div(
+    [
+        html.Div(
+            [html.I(className="fas fa-layer-group", style={"fontSize": "3rem", "color": "#4ECDC4", "marginBottom": "20px"})],
+        ),
+        html.H4("Select Scenarios", style={"marginBottom": "12px", "fontWeight": "600"}),
+        html.P(
+            "Please select at least two loaded networks to compare.",
+            className="text-muted",
+            style={"fontSize": "1rem"},
+        ),
+    ],
+    className="text-center my-5 p-5 empty-state",
+)
+
 NO_DATA_MSG = html.Div(
     [
         html.Div(
@@ -187,6 +202,36 @@ def create_error_message(context: str, error: Exception) -> html.Div:
     )
 
 
+def create_pending_chart_message(context: str) -> html.Div:
+    """
+    Create the placeholder of a chart that was not ready within the chart deadline.
+
+    Parameters
+    ----------
+    context : str
+        Description of the chart, e.g. ``"carrier 'AC'"``
+
+    Returns
+    -------
+    html.Div
+        Placeholder component
+    """
+    return html.Div(
+        [
+            html.H5(
+                [html.I(className="fas fa-hourglass-half", style={"marginRight": "8px"}), f"Still computing {context}"],
+                className="text-muted",
+            ),
+            html.P(
+                "This chart takes longer than usual and is finished in the background. Open the tab again to show it.",
+                className="text-muted",
+            ),
+        ],
+        className="text-center p-5 border rounded mb-4 chart-pending",
+        style={"background-color": "#FAFBFC"},
+    )
+
+
 def create_header(n: pypsa.Network | None) -> html.Div:
     """Create the KPI section for the active network."""
 
@@ -1,12 +1,14 @@
 """Main dashboard layout for PyPSA Explorer."""
 
 from pathlib import Path
+from typing import Any
 
 import dash_bootstrap_components as dbc
 import pypsa
 from dash import dcc, html
 
-from pypsa_explorer.config import DEFAULT_CARRIERS
+from pypsa_explorer import __version__
+from pypsa_explorer.config import CARRIER_CHART_TABS, CHART_TAB_CONTAINERS, DEFAULT_CARRIERS, FIGURE_CACHE_MAX_BYTES
 from pypsa_explorer.layouts.components import (
     create_data_explorer_modal,
     create_footer,
@@ -17,13 +19,14 @@ from pypsa_explorer.layouts.components import (
 from pypsa_explorer.layouts.tabs import (
     create_capacity_tab,
     create_capex_totals_tab,
+    create_comparison_tab,
     create_energy_balance_aggregated_tab,
     create_energy_balance_tab,
     create_network_map_tab,
     create_opex_totals_tab,
 )
 from pypsa_explorer.layouts.welcome import create_welcome_page
-from pypsa_explorer.utils.helpers import get_bus_carrier_options, get_country_options, summarize_network
+from pypsa_explorer.utils.helpers import describe_network, get_bus_carrier_options, get_country_options
 
 
 def create_dashboard_layout(
@@ -31,6 +34,8 @@ def create_dashboard_layout(
     active_network_label: str | None,
     *,
     default_network_path: str = "demo-network.nc",
+    networks_info: dict[str, dict[str, Any]] | None = None,
+    watch_interval_ms: int | None = None,
 ) -> dbc.Container:
     """
     Create the complete dashboard layout.
@@ -41,13 +46,18 @@ def create_dashboard_layout(
         Dictionary of loaded networks
     active_network_label : str
         Label of the initially active network
+    networks_info : dict, optional
+        Registry info per network label. When given, it defines the listed networks
+        instead of summarizing every entry of ``networks`` (which would load lazy entries).
+    watch_interval_ms : int, optional
+        Polling interval of the watched network directory; no polling when ``None``
 
     Returns
     -------
     dbc.Container
         Complete dashboard layout
     """
-    network_labels = list(networks.keys())
+    network_labels = list(networks_info) if networks_info is not None else list(networks.keys())
     n = networks[active_network_label] if active_network_label else None
 
     # Get options for filters
@@ -55,7 +65,8 @@ def create_dashboard_layout(
     country_options = get_country_options(n) if n else []
 
     # Prepare network info for welcome page
-    networks_info = {label: summarize_network(net) for label, net in networks.items()} if networks else {}
+    if networks_info is None:
+        networks_info = {label: describe_network(net) for label, net in networks.items()} if networks else {}
     demo_network_available = Path(default_network_path).is_file()
 
     return dbc.Container(
@@ -74,6 +85,25 @@ def create_dashboard_layout(
             ),
             # Store component for dark mode state (cached)
             dcc.Store(id="dark-mode-store", data=False),
+            # Network, filters and theme the charts of each chart tab were rendered for
+            dcc.Store(id="chart-tabs-rendered", data={}),
+            # Chart tab the server is asked to render, on misses of the browser's figure cache
+            dcc.Store(id="chart-request"),
+            dcc.Store(
+                id="figure-cache-config",
+                data={
+                    "version": __version__,
+                    "maxBytes": FIGURE_CACHE_MAX_BYTES,
+                    "tabs": list(CHART_TAB_CONTAINERS),
+                    "carrierTabs": list(CARRIER_CHART_TABS),
+                },
+            ),
+            # Polls the watched network directory for new or modified files
+            dcc.Interval(
+                id="network-watch-interval",
+                interval=watch_interval_ms or 2000,
+                disabled=watch_interval_ms is None,
+            ),
             # Data explorer modal
             create_data_explorer_modal(),
             # Main application layout with conditional display
@@ -138,6 +168,7 @@ def create_dashboard_layout(
                                                         create_capacity_tab(),
                                                         create_capex_totals_tab(),
                                                         create_opex_totals_tab(),
+                                                        create_comparison_tab(),
                                                         create_network_map_tab(),
                                                     ],
                                                 ),
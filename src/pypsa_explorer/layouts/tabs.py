@@ -99,6 +99,81 @@ def create_opex_totals_tab() -> dcc.Tab:
     )
 
 
+def create_comparison_tab() -> dcc.Tab:
+    """Create the Scenario Comparison tab."""
+    return dcc.Tab(
+        label="🔀 Scenario Comparison",
+        value="comparison",
+        style=TAB_STYLE,
+        selected_style=TAB_SELECTED_STYLE,
+        children=[
+            dbc.Card(
+                dbc.CardBody(
+                    [
+                        dbc.Row(
+                            [
+                                dbc.Col(
+                                    [
+                                        html.Label("Scenarios", className="fw-bold mb-2"),
+                                        dcc.Dropdown(
+                                            id="comparison-scenario-selector",
+                                            multi=True,
+                                            placeholder="Select networks to compare...",
+                                        ),
+                                    ],
+                                    width=5,
+                                ),
+                                dbc.Col(
+                                    [
+                                        html.Label("Metric", className="fw-bold mb-2"),
+                                        dcc.RadioItems(
+                                            id="comparison-metric",
+                                            options=[  # type: ignore[arg-type]
+                                                {"label": " Capacity", "value": "capacity"},
+                                                {"label": " CAPEX", "value": "capex"},
+                                                {"label": " OPEX", "value": "opex"},
+                                                {"label": " Energy Balance", "value": "energy-balance"},
+                                            ],
+                                            value="capacity",
+                                            labelStyle={"display": "block", "marginLeft": "5px"},
+                                        ),
+                                    ],
+                                    width=3,
+                                ),
+                                dbc.Col(
+                                    [
+                                        html.Label("Show", className="fw-bold mb-2"),
+                                        dcc.RadioItems(
+                                            id="comparison-mode",
+                                            options=[  # type: ignore[arg-type]
+                                                {"label": " Totals", "value": "totals"},
+                                                {"label": " Difference to", "value": "delta"},
+                                            ],
+                                            value="totals",
+                                            labelStyle={"display": "block", "marginLeft": "5px"},
+                                        ),
+                                        dcc.Dropdown(
+                                            id="comparison-reference",
+                                            placeholder="Reference scenario",
+                                            clearable=False,
+                                            className="mt-2",
+                                        ),
+                                    ],
+                                    width=4,
+                                ),
+                            ],
+                            className="mb-3",
+                        ),
+                        html.Div(id="comparison-chart-container"),
+                    ],
+                    className="chart-card-body",
+                ),
+                className="mt-3",
+            )
+        ],
+    )
+
+
 def create_network_map_tab() -> dcc.Tab:
     """Create the Network Configuration tab with map and metadata."""
     return dcc.Tab(
@@ -0,0 +1,136 @@
+"""Headless precomputation of a persistent result cache for the dashboard."""
+
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from pypsa_explorer.callbacks.network import build_filter_options, build_network_map
+from pypsa_explorer.callbacks.visualizations import warm_chart_cache
+from pypsa_explorer.config import setup_plotly_theme
+from pypsa_explorer.utils.cache import ResultCache, create_cache_backend
+from pypsa_explorer.utils.network_loader import load_network_file
+
+# Backends that do not outlive the precompute process
+_TRANSIENT_BACKENDS = (None, "", "memory")
+
+
+@dataclass
+class PrecomputeResult:
+    """What was precomputed for one network."""
+
+    label: str
+    path: str
+    charts: int = 0
+    map: bool = False
+    seconds: float = 0.0
+    error: str | None = None
+
+
+def precompute_network(label: str, path: str, cache_spec: str, themes: tuple[bool, ...] = (False, True)) -> PrecomputeResult:
+    """
+    Fill a cache with every view of one network that the dashboard can serve warm.
+
+    The filter options, the network map and the statistics and figures of every
+    chart tab (for all countries, in each theme) are stored. This runs in the
+    worker processes of :func:`precompute_cache`; errors are returned rather than raised.
+
+    Parameters
+    ----------
+    label : str
+        Network label
+    path : str
+        Path to the network file
+    cache_spec : str
+        Cache backend specification (see :func:`~pypsa_explorer.utils.cache.create_cache_backend`)
+    themes : tuple[bool, ...]
+        Dark mode flags to render figures for
+
+    Returns
+    -------
+    PrecomputeResult
+        Summary of the precomputed views
+    """
+    result = PrecomputeResult(label, path)
+    started = time.perf_counter()
+    try:
+        setup_plotly_theme()
+        cache = ResultCache(create_cache_backend(cache_spec))
+        n = load_network_file(path)
+        build_filter_options(n, label, cache)
+        result.charts = warm_chart_cache(n, label, cache, themes=themes)
+        try:
+            build_network_map(n, label, cache)
+            result.map = True
+        except Exception:  # noqa: BLE001 - the dashboard reports map errors when the map is viewed
+            pass
+    except Exception as e:  # noqa: BLE001 - reported per network instead
+        result.error = str(e) or type(e).__name__
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def precompute_cache(
+    networks: dict[str, str],
+    cache_spec: str | Path,
+    *,
+    themes: tuple[bool, ...] = (False, True),
+    workers: int | None = None,
+    progress: Callable[[PrecomputeResult], None] | None = None,
+) -> list[PrecomputeResult]:
+    """
+    Precompute the dashboard views of several networks into a persistent cache.
+
+    Networks are processed in parallel worker processes that write to the same
+    cache. Cache keys are derived from the network content, so a dashboard started
+    with ``--cache`` pointing to the same location serves these views without
+    computing them, also on another host and under other labels.
+
+    Parameters
+    ----------
+    networks : dict
+        Mapping of network labels to network file paths
+    cache_spec : str or Path
+        Cache directory, or any persistent backend specification such as ``diskcache:DIR``
+    themes : tuple[bool, ...]
+        Dark mode flags to render figures for; both themes by default
+    workers : int, optional
+        Number of worker processes; defaults to the number of CPUs. ``1`` works
+        in the current process.
+    progress : callable, optional
+        Called with the result of every finished network
+
+    Returns
+    -------
+    list[PrecomputeResult]
+        One result per network, in input order
+
+    Raises
+    ------
+    ValueError
+        If ``cache_spec`` selects the in-process memory cache
+    """
+    spec = str(cache_spec)
+    if spec in _TRANSIENT_BACKENDS:
+        raise ValueError("Precomputing requires a persistent cache such as a directory")
+    # Create the cache in this process so that workers do not race to set it up
+    create_cache_backend(spec)
+
+    results = []
+    for result in _precompute_all(networks, spec, themes, workers):
+        results.append(result)
+        if progress is not None:
+            progress(result)
+    return results
+
+
+def _precompute_all(
+    networks: dict[str, str], spec: str, themes: tuple[bool, ...], workers: int | None
+) -> Iterator[PrecomputeResult]:
+    labels, paths = list(networks), list(networks.values())
+    if workers == 1 or len(networks) <= 1:
+        yield from (precompute_network(label, path, spec, themes) for label, path in networks.items())
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(precompute_network, labels, paths, [spec] * len(labels), [themes] * len(labels))
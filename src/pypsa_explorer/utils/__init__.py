@@ -1,12 +1,24 @@
 """Utility functions for PyPSA Explorer."""
 
-from pypsa_explorer.utils.helpers import (
-    convert_latex_to_html,
-    get_bus_carrier_options,
-    get_carrier_nice_name,
-    title_except_multi_caps,
-)
-from pypsa_explorer.utils.network_loader import load_networks
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pypsa_explorer.utils.helpers import (
+        convert_latex_to_html,
+        get_bus_carrier_options,
+        get_carrier_nice_name,
+        title_except_multi_caps,
+    )
+    from pypsa_explorer.utils.network_loader import load_networks
+
+# Names re-exported from submodules, imported on first access to keep startup cheap
+_LAZY_ATTRIBUTES = {
+    "convert_latex_to_html": "pypsa_explorer.utils.helpers",
+    "get_bus_carrier_options": "pypsa_explorer.utils.helpers",
+    "get_carrier_nice_name": "pypsa_explorer.utils.helpers",
+    "title_except_multi_caps": "pypsa_explorer.utils.helpers",
+    "load_networks": "pypsa_explorer.utils.network_loader",
+}
 
 __all__ = [
     "convert_latex_to_html",
@@ -15,3 +27,13 @@ __all__ = [
     "title_except_multi_caps",
     "load_networks",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
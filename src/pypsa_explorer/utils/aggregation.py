@@ -0,0 +1,195 @@
+"""Incremental totals of statistics over a changing selection of countries."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Delta updates applied to a running total before it is summed afresh, bounding floating point drift
+MAX_DELTA_UPDATES = 64
+
+
+@dataclass
+class PartialSums:
+    """
+    Partial sums of a statistics result per group (e.g. country) and carrier.
+
+    Attributes
+    ----------
+    groups : pd.Index
+        Group of every row of ``values``
+    carriers : pd.Index
+        Carrier of every column of ``values``
+    values : np.ndarray
+        Sum per group and carrier
+    counts : np.ndarray
+        Number of summed entries per group and carrier, telling absent carriers from zero totals
+    """
+
+    groups: pd.Index
+    carriers: pd.Index
+    values: np.ndarray
+    counts: np.ndarray
+
+    @classmethod
+    def from_series(cls, data: pd.Series, level: str = "country", by: str = "carrier") -> "PartialSums":
+        """
+        Sum a statistics result indexed by (at least) ``level`` and ``by``.
+
+        Parameters
+        ----------
+        data : pd.Series
+            Statistics result, e.g. grouped by ``["country", "carrier"]``
+        level : str
+            Index level whose values are selected later
+        by : str
+            Index level kept in the totals
+
+        Returns
+        -------
+        PartialSums
+            The partial sums
+        """
+        group_codes, groups = pd.factorize(data.index.get_level_values(level), sort=True)
+        carrier_codes, carriers = pd.factorize(data.index.get_level_values(by), sort=True)
+        values = data.to_numpy(dtype=float)
+        valid = (group_codes >= 0) & (carrier_codes >= 0) & ~np.isnan(values)
+        flat = group_codes[valid] * len(carriers) + carrier_codes[valid]
+        size = len(groups) * len(carriers)
+        shape = (len(groups), len(carriers))
+        return cls(
+            groups=pd.Index(groups, name=level),
+            carriers=pd.Index(carriers, name=by),
+            values=np.bincount(flat, weights=values[valid], minlength=size).reshape(shape),
+            counts=np.bincount(flat, minlength=size).reshape(shape),
+        )
+
+    def positions(self, groups: Iterable[Hashable]) -> np.ndarray:
+        """Row positions of the known ones among ``groups``."""
+        positions = self.groups.get_indexer(pd.Index(list(dict.fromkeys(groups))))
+        return positions[positions >= 0]
+
+    def _series(self, values: np.ndarray, counts: np.ndarray) -> pd.Series:
+        present = counts > 0
+        return pd.Series(values[present], index=self.carriers[present])
+
+    def total(self, groups: Iterable[Hashable]) -> pd.Series:
+        """
+        Sum the partial sums of some groups.
+
+        Parameters
+        ----------
+        groups : iterable
+            Groups to include; unknown groups are ignored
+
+        Returns
+        -------
+        pd.Series
+            Totals per carrier, for the carriers present in these groups
+        """
+        rows = self.positions(groups)
+        return self._series(self.values[rows].sum(axis=0), self.counts[rows].sum(axis=0))
+
+
+class IncrementalTotal:
+    """
+    Running total of :class:`PartialSums` over a selection of groups.
+
+    Every :meth:`update` adds the rows of newly selected groups and subtracts
+    those of deselected ones, so extending a selection of many countries by one
+    costs one row instead of the whole selection. Selections that changed more
+    than they kept are summed afresh.
+    """
+
+    def __init__(self, partials: PartialSums) -> None:
+        self.partials = partials
+        self.selected = np.zeros(len(partials.groups), dtype=bool)
+        self.values = np.zeros(len(partials.carriers))
+        self.counts = np.zeros(len(partials.carriers), dtype=np.int64)
+        self.delta_updates = 0
+
+    def update(self, groups: Iterable[Hashable]) -> pd.Series:
+        """
+        Move the selection to ``groups`` and return its totals.
+
+        Parameters
+        ----------
+        groups : iterable
+            Groups to include; unknown groups are ignored
+
+        Returns
+        -------
+        pd.Series
+            Totals per carrier, equal to ``partials.total(groups)``
+        """
+        partials = self.partials
+        selected = np.zeros(len(partials.groups), dtype=bool)
+        selected[partials.positions(groups)] = True
+        added = np.flatnonzero(selected & ~self.selected)
+        removed = np.flatnonzero(self.selected & ~selected)
+        kept = np.count_nonzero(selected & self.selected)
+
+        if len(added) + len(removed) > kept or self.delta_updates >= MAX_DELTA_UPDATES:
+            rows = np.flatnonzero(selected)
+            self.values = partials.values[rows].sum(axis=0)
+            self.counts = partials.counts[rows].sum(axis=0)
+            self.delta_updates = 0
+        elif len(added) or len(removed):
+            self.values = self.values + partials.values[added].sum(axis=0) - partials.values[removed].sum(axis=0)
+            self.counts = self.counts + partials.counts[added].sum(axis=0) - partials.counts[removed].sum(axis=0)
+            self.delta_updates += 1
+        self.selected = selected
+        return partials._series(self.values, self.counts)
+
+
+class SelectionAggregator:
+    """
+    Keep an :class:`IncrementalTotal` per statistics result across callback invocations.
+
+    Totals are addressed by a key identifying the partial sums, which must
+    include the network version; the least recently used totals are dropped
+    beyond ``max_entries``. Concurrent updates of the same key are serialized.
+
+    Parameters
+    ----------
+    max_entries : int
+        Number of running totals kept
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._totals: OrderedDict[Hashable, IncrementalTotal] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def total(self, key: Hashable, partials: PartialSums, groups: Iterable[Hashable]) -> pd.Series:
+        """
+        Return the totals of ``groups``, updating the running total of ``key``.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identity of ``partials``
+        partials : PartialSums
+            Partial sums to aggregate
+        groups : iterable
+            Groups to include
+
+        Returns
+        -------
+        pd.Series
+            Totals per carrier
+        """
+        with self._lock:
+            running = self._totals.pop(key, None)
+            if running is None:
+                running = IncrementalTotal(partials)
+            self._totals[key] = running
+            while len(self._totals) > self.max_entries:
+                self._totals.popitem(last=False)
+            return running.update(groups)
@@ -0,0 +1,496 @@
+"""Result cache for per-network statistics, figures and maps with pluggable storage backends."""
+
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any
+
+import pypsa
+
+from pypsa_explorer.utils.concurrency import SingleFlight
+from pypsa_explorer.utils.fingerprint import network_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Namespaces used by the dashboard; each entry belongs to exactly one network
+CACHE_NAMESPACES = ("statistics", "figures", "maps", "options")
+
+# Directory used by the shared-memory backend when available (a RAM-backed tmpfs on Linux)
+SHARED_MEMORY_DIR = Path("/dev/shm")
+
+# Returned by CacheBackend.get for unknown keys, so that stored ``None`` values are cache hits
+MISSING: Any = object()
+
+
+class CacheBackend(ABC):
+    """Storage for cache entries addressed by string keys."""
+
+    @abstractmethod
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the stored value or ``default`` when the key is unknown."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Store a value."""
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete all entries whose key starts with ``prefix`` and return their number."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete all entries."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+
+
+class MemoryBackend(CacheBackend):
+    """
+    In-process LRU storage; values are kept as Python objects without serialization.
+
+    Parameters
+    ----------
+    max_entries : int
+        Maximum number of entries kept before the least recently used ones are evicted
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            stale = [key for key in self._entries if key.startswith(prefix)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    Pickled entries in a SQLite database that several processes can share.
+
+    The database runs in WAL mode so that workers read concurrently while one of them
+    writes. Reads do not write: the access times used for least-recently-used
+    eviction are collected in memory and written in one transaction at most every
+    ``touch_interval`` seconds. Every ``evict_interval`` inserts of a process, the
+    least recently used entries beyond ``max_entries`` are evicted.
+
+    Parameters
+    ----------
+    path : str or Path
+        Database file; parent directories are created as needed
+    max_entries : int
+        Maximum number of stored entries
+    touch_interval : float
+        Minimum number of seconds between two writes of access times
+    evict_interval : int
+        Number of inserts between two evictions
+    """
+
+    def __init__(
+        self, path: str | Path, max_entries: int = 10_000, touch_interval: float = 5.0, evict_interval: int = 100
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+        self.evict_interval = evict_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._touched: dict[str, float] = {}
+        self._last_touch = time.monotonic()
+        self._inserts = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _touch(self, key: str | None = None, force: bool = False) -> None:
+        """Record an access of ``key`` and write the recorded access times when they are due."""
+        with self._lock:
+            if key is not None:
+                self._touched[key] = time.time()
+            if not self._touched or not (force or time.monotonic() - self._last_touch >= self.touch_interval):
+                return
+            touched, self._touched = self._touched, {}
+            self._last_touch = time.monotonic()
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "UPDATE entries SET accessed = max(accessed, ?) WHERE key = ?",
+                [(accessed, touched_key) for touched_key, accessed in touched.items()],
+            )
+        finally:
+            conn.execute("COMMIT")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        row = self._connect().execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        self._touch(key)
+        return pickle.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO entries (key, value, accessed) VALUES (?, ?, ?)",
+            (key, payload, time.time()),
+        )
+        with self._lock:
+            self._inserts += 1
+            evict = self._inserts % self.evict_interval == 0
+        if evict:
+            self.evict()
+        else:
+            self._touch()
+
+    def evict(self) -> int:
+        """Delete the least recently used entries beyond ``max_entries`` and return their number."""
+        self._touch(force=True)
+        conn = self._connect()
+        excess = len(self) - self.max_entries
+        if excess <= 0:
+            return 0
+        cursor = conn.execute(
+            "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed LIMIT ?)",
+            (excess,),
+        )
+        return cursor.rowcount
+
+    def delete_prefix(self, prefix: str) -> int:
+        # Compared literally: labels in label-versioned keys may contain LIKE wildcards
+        cursor = self._connect().execute(
+            "DELETE FROM entries WHERE substr(key, 1, ?) = ?",
+            (len(prefix), prefix),
+        )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        return int(self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+
+def private_directory(parent: Path, name: str) -> Path:
+    """
+    Create (or reuse) a directory only the current user can access, e.g. within ``/dev/shm``.
+
+    Cache entries are unpickled when read, so a database that another user could
+    create or replace would let that user run code in the dashboard. The directory
+    name contains the user id and it is created with mode 0700; an existing
+    directory that belongs to another user or is accessible to others, or holding
+    entries that belong to another user or are writable by others, is refused.
+
+    Parameters
+    ----------
+    parent : Path
+        Shared parent directory
+    name : str
+        Prefix of the directory name
+
+    Returns
+    -------
+    Path
+        The private directory
+
+    Raises
+    ------
+    PermissionError
+        When the directory or its entries belong to another user or are not private to the current one
+    """
+    if not hasattr(os, "getuid"):
+        # Without POSIX ownership, fall back to the per-user temporary directory
+        directory = Path(tempfile.gettempdir()) / name
+        directory.mkdir(exist_ok=True)
+        return directory
+
+    uid = os.getuid()
+    directory = parent / f"{name}-{uid}"
+    directory.mkdir(mode=0o700, exist_ok=True)
+    for path, forbidden in [(directory, 0o077)] + [(entry, 0o022) for entry in directory.iterdir()]:
+        info = path.lstat()
+        if path.is_symlink() or info.st_uid != uid or info.st_mode & forbidden:
+            raise PermissionError(f"Refusing to use {path}: it must belong to uid {uid} and be private to it")
+    return directory
+
+
+class SharedMemoryBackend(SQLiteBackend):
+    """
+    SQLite storage placed on a RAM-backed filesystem shared by all processes of a host.
+
+    Uses a private directory of the current user (see :func:`private_directory`) in
+    ``/dev/shm`` when it exists and in the temporary directory otherwise.
+
+    Parameters
+    ----------
+    name : str
+        File name of the database within the shared-memory directory
+    max_entries : int
+        Maximum number of stored entries
+    """
+
+    def __init__(self, name: str = "pypsa-explorer-cache.sqlite", max_entries: int = 10_000) -> None:
+        parent = SHARED_MEMORY_DIR if SHARED_MEMORY_DIR.is_dir() else Path(tempfile.gettempdir())
+        if parent != SHARED_MEMORY_DIR:
+            logger.warning("%s not available, placing the shared cache in %s", SHARED_MEMORY_DIR, parent)
+        super().__init__(private_directory(parent, "pypsa-explorer") / name, max_entries=max_entries)
+
+
+class DiskCacheBackend(CacheBackend):
+    """
+    Storage backed by the optional ``diskcache`` package.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Cache directory
+    size_limit : int
+        Maximum size of the cache in bytes
+    """
+
+    def __init__(self, directory: str | Path, size_limit: int = 2**30) -> None:
+        try:
+            import diskcache
+        except ImportError as e:
+            raise ImportError("The diskcache backend requires the 'diskcache' package: pip install diskcache") from e
+        self._cache = diskcache.Cache(str(directory), size_limit=size_limit)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._cache.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        self._cache.set(key, value)
+
+    def delete_prefix(self, prefix: str) -> int:
+        stale = [key for key in self._cache.iterkeys() if isinstance(key, str) and key.startswith(prefix)]
+        for key in stale:
+            self._cache.delete(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+def create_cache_backend(spec: str | None = None) -> CacheBackend:
+    """
+    Create a cache backend from a short specification.
+
+    Parameters
+    ----------
+    spec : str, optional
+        One of:
+        - ``None`` or ``"memory"``: in-process cache (default)
+        - ``"shm"`` or ``"shared-memory"``: SQLite database in ``/dev/shm`` shared by all workers
+        - ``"diskcache:<directory>"``: ``diskcache`` store in the given directory
+        - any other value: directory holding a shared SQLite cache
+
+    Returns
+    -------
+    CacheBackend
+        The configured backend
+    """
+    if spec is None or spec == "memory":
+        return MemoryBackend()
+    if spec in ("shm", "shared-memory"):
+        return SharedMemoryBackend()
+    if spec.startswith("diskcache:"):
+        return DiskCacheBackend(spec.split(":", 1)[1])
+    return SQLiteBackend(Path(spec) / "results.sqlite")
+
+
+class ResultCache:
+    """
+    Cache for results derived from a single network.
+
+    Entries are addressed by namespace, network and key parts. When the network
+    object is passed, its content fingerprint versions the key, so any process
+    holding the same network can serve a result computed by another one through a
+    shared backend. The label a network is shown under does not affect the key,
+    and such content-addressed entries are never invalidated: a changed network
+    has another fingerprint, and the entries of old versions are reclaimed by the
+    backend's eviction. Without the network object, entries are keyed by label
+    and dropped by :meth:`invalidate`. Concurrent misses for the same key are coalesced: one thread computes the
+    value while the others wait for it.
+
+    Parameters
+    ----------
+    backend : CacheBackend, optional
+        Storage backend (default: in-process memory)
+    max_entries : int
+        Size of the default in-process backend; ignored when ``backend`` is given
+    """
+
+    def __init__(self, backend: CacheBackend | None = None, max_entries: int = 512) -> None:
+        self.backend = backend if backend is not None else MemoryBackend(max_entries)
+        self._flights = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+    @staticmethod
+    def _version(label: str, network: pypsa.Network | None) -> str:
+        return network_fingerprint(network) if network is not None else f"label-{label}"
+
+    @staticmethod
+    def _key(namespace: str, version: str, parts: tuple[Hashable, ...]) -> str:
+        digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+        return f"{namespace}:{version}:{digest}"
+
+    def get(
+        self,
+        namespace: str,
+        label: str,
+        parts: tuple[Hashable, ...] = (),
+        *,
+        network: pypsa.Network | None = None,
+    ) -> Any | None:
+        """Return a cached value or ``None`` when the key is unknown."""
+        return self.backend.get(self._key(namespace, self._version(label, network), parts))
+
+    def set(
+        self,
+        namespace: str,
+        label: str,
+        parts: tuple[Hashable, ...],
+        value: Any,
+        *,
+        network: pypsa.Network | None = None,
+    ) -> None:
+        """Store a value."""
+        self.backend.set(self._key(namespace, self._version(label, network), parts), value)
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        label: str,
+        parts: tuple[Hashable, ...],
+        compute: Callable[[], Any],
+        *,
+        network: pypsa.Network | None = None,
+    ) -> Any:
+        """
+        Return the cached value for a key, computing and storing it on a miss.
+
+        Requests arriving while the same key is being computed wait for that
+        computation instead of starting their own. Exceptions raised by ``compute``
+        propagate to all of them and nothing is cached.
+        """
+        key = self._key(namespace, self._version(label, network), parts)
+        value = self.backend.get(key, MISSING)
+        if value is not MISSING:
+            return value
+
+        def compute_and_store() -> Any:
+            # Another leader may have stored the value between our lookup and now
+            value = self.backend.get(key, MISSING)
+            if value is MISSING:
+                value = compute()
+                self.backend.set(key, value)
+            return value
+
+        return self._flights.do(key, compute_and_store)
+
+    def discard(
+        self,
+        namespace: str,
+        label: str,
+        parts: tuple[Hashable, ...] = (),
+        *,
+        network: pypsa.Network | None = None,
+    ) -> None:
+        """Remove a single entry if present."""
+        self.backend.delete_prefix(self._key(namespace, self._version(label, network), parts))
+
+    def invalidate(self, label: str, namespaces: tuple[str, ...] = CACHE_NAMESPACES) -> int:
+        """
+        Drop the cached entries stored under a network label.
+
+        Entries keyed by network fingerprint are kept: they may be shared with
+        other labels, processes or hosts holding the same network content, and
+        those of a network that changed are no longer looked up and are evicted
+        in time.
+
+        Parameters
+        ----------
+        label : str
+            Network label whose entries should be removed
+        namespaces : tuple[str, ...]
+            Namespaces to clear (default: all)
+
+        Returns
+        -------
+        int
+            Number of removed entries
+        """
+        version = self._version(label, None)
+        return sum(self.backend.delete_prefix(f"{namespace}:{version}:") for namespace in namespaces)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.backend.clear()
+
+
+def freeze_kwargs(kwargs: dict[str, Any]) -> tuple[tuple[str, Hashable], ...]:
+    """Convert keyword arguments into a hashable, order-independent cache key part."""
+
+    def _freeze(value: Any) -> Hashable:
+        if isinstance(value, list | tuple):
+            return tuple(_freeze(item) for item in value)
+        if isinstance(value, dict):
+            return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+        return value
+
+    return tuple(sorted((key, _freeze(value)) for key, value in kwargs.items()))
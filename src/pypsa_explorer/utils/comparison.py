@@ -0,0 +1,175 @@
+"""Batched statistics across scenarios for the comparison tab."""
+
+import os
+from collections.abc import Hashable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pandas as pd
+import pypsa
+
+from pypsa_explorer.utils.aggregation import SelectionAggregator
+from pypsa_explorer.utils.cache import ResultCache, freeze_kwargs
+from pypsa_explorer.utils.fingerprint import network_fingerprint
+from pypsa_explorer.utils.statistics import cached_partial_sums, cached_statistic
+
+# Metrics of the comparison tab: statistics method, chart title and whether the bus carrier filter applies
+COMPARISON_METRICS: dict[str, tuple[str, str, bool]] = {
+    "capacity": ("optimal_capacity", "Optimal Capacity", True),
+    "capex": ("capex", "Capital Expenditure", False),
+    "opex": ("opex", "Operational Expenditure", False),
+    "energy-balance": ("energy_balance", "Energy Balance Totals", True),
+}
+
+
+def scenario_totals(
+    n: pypsa.Network,
+    label: str,
+    metric: str,
+    *,
+    bus_carriers: list[str] | None = None,
+    countries: list[str] | None = None,
+    cache: ResultCache,
+    aggregator: SelectionAggregator | None = None,
+    session: Hashable = None,
+) -> pd.Series:
+    """
+    Compute (or fetch from cache) the totals of one comparison metric per carrier.
+
+    Parameters
+    ----------
+    n : pypsa.Network
+        The PyPSA network object
+    label : str
+        Network label, used to scope the cache entries
+    metric : str
+        Key of :data:`COMPARISON_METRICS`
+    bus_carriers : list[str], optional
+        Bus carriers to include for metrics that support it; all when omitted
+    countries : list[str], optional
+        Countries to include; all when omitted
+    cache : ResultCache
+        Cache holding the statistics results
+    aggregator : SelectionAggregator, optional
+        Running totals updated by the countries added to or removed from the
+        previous selection; summed afresh when omitted
+    session : Hashable, optional
+        Browser session whose selection the running totals follow; sessions keep
+        separate running totals, so their selections do not overwrite each other
+
+    Returns
+    -------
+    pd.Series
+        Totals indexed by carrier nice name
+    """
+    statistic, _, per_bus_carrier = COMPARISON_METRICS[metric]
+    kwargs: dict[str, Any] = {"nice_names": True, "aggregate_across_components": True}
+    if per_bus_carrier and bus_carriers:
+        kwargs["bus_carrier"] = sorted(bus_carriers)
+
+    if countries:
+        kwargs["groupby"] = ["country", "carrier"]
+        partials = cached_partial_sums(n, label, statistic, cache, **kwargs)
+        if aggregator is None:
+            totals = partials.total(countries)
+        else:
+            key = (session, network_fingerprint(n), statistic, freeze_kwargs(kwargs))
+            totals = aggregator.total(key, partials, countries)
+    else:
+        totals = cached_statistic(n, label, statistic, cache, groupby="carrier", **kwargs)
+    return totals.rename(label)
+
+
+def compare_scenarios(
+    networks: Mapping[str, pypsa.Network],
+    labels: list[str],
+    metric: str,
+    *,
+    bus_carriers: list[str] | None = None,
+    countries: list[str] | None = None,
+    cache: ResultCache,
+    aggregator: SelectionAggregator | None = None,
+    session: Hashable = None,
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """
+    Compute one comparison metric for many scenarios in a single parallel pass.
+
+    The statistics of the scenarios are computed concurrently (and cached per
+    network, so repeating a comparison or opening a scenario's own tabs reuses
+    them) and aligned into one scenario × carrier matrix.
+
+    Parameters
+    ----------
+    networks : Mapping
+        Networks by label
+    labels : list[str]
+        Scenarios to compare, in display order
+    metric : str
+        Key of :data:`COMPARISON_METRICS`
+    bus_carriers : list[str], optional
+        Bus carriers to include for metrics that support it
+    countries : list[str], optional
+        Countries to include; all when omitted
+    cache : ResultCache
+        Cache holding the statistics results
+    aggregator : SelectionAggregator, optional
+        Running totals of the country selections, see :func:`scenario_totals`
+    session : Hashable, optional
+        Browser session the running totals belong to
+    max_workers : int, optional
+        Number of threads; defaults to one per scenario, at most the number of CPUs
+
+    Returns
+    -------
+    pd.DataFrame
+        Totals with one row per scenario and one column per carrier; carriers
+        missing from a scenario are 0
+    """
+    if not labels:
+        return pd.DataFrame()
+
+    def totals(label: str) -> pd.Series:
+        return scenario_totals(
+            networks[label],
+            label,
+            metric,
+            bus_carriers=bus_carriers,
+            countries=countries,
+            cache=cache,
+            aggregator=aggregator,
+            session=session,
+        )
+
+    workers = max_workers or min(len(labels), os.cpu_count() or 1)
+    if workers == 1:
+        columns = [totals(label) for label in labels]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pypsa-explorer-compare") as pool:
+            columns = list(pool.map(totals, labels))
+
+    matrix = pd.concat(columns, axis=1).T.fillna(0.0)
+    matrix.index.name = "scenario"
+    matrix.columns.name = "carrier"
+    # Largest carriers first, so the chart legend starts with what matters
+    order = matrix.abs().sum().sort_values(ascending=False).index
+    return matrix[order].reindex(labels)
+
+
+def scenario_deltas(matrix: pd.DataFrame, reference: str) -> pd.DataFrame:
+    """
+    Subtract the reference scenario from every other scenario of a comparison matrix.
+
+    Parameters
+    ----------
+    matrix : pd.DataFrame
+        Scenario × carrier matrix of :func:`compare_scenarios`
+    reference : str
+        Scenario to compare against
+
+    Returns
+    -------
+    pd.DataFrame
+        Differences of the other scenarios to the reference
+    """
+    return matrix.drop(index=reference).sub(matrix.loc[reference], axis=1)
@@ -0,0 +1,256 @@
+"""Concurrency helpers for serving expensive callbacks to many simultaneous users."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Number of sessions whose latest request is remembered by default
+MAX_TRACKED_SESSIONS = 10_000
+
+# Seconds between two cancellation checks of a caller waiting for another thread's computation
+WAIT_CHECK_INTERVAL = 0.05
+
+
+class Cancelled(BaseException):
+    """
+    Raised at a :func:`checkpoint` when the work of a request was superseded.
+
+    Like :class:`asyncio.CancelledError` it derives from ``BaseException``, so the
+    ``except Exception`` handlers that turn a failed chart into an error message
+    let it pass.
+    """
+
+
+class DeadlineExceeded(Cancelled):
+    """Raised at a :func:`checkpoint` once the deadline of a request passed."""
+
+
+class CancelToken:
+    """
+    Flag set when the request a computation serves no longer needs its result.
+
+    Parameters
+    ----------
+    timeout : float, optional
+        Seconds after which the work is stopped at its next checkpoint with
+        :class:`DeadlineExceeded`; no deadline when omitted
+    """
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self._event = threading.Event()
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the work was cancelled."""
+        return self._event.is_set()
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline passed."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def cancel(self) -> None:
+        """Cancel the work at its next checkpoint."""
+        self._event.set()
+
+    def check(self) -> None:
+        """Raise :class:`Cancelled` if the work was cancelled, or :class:`DeadlineExceeded` if its deadline passed."""
+        if self._event.is_set():
+            raise Cancelled
+        if self.expired:
+            raise DeadlineExceeded
+
+
+_current_token: ContextVar[CancelToken | None] = ContextVar("pypsa_explorer_cancel_token", default=None)
+
+
+def checkpoint() -> None:
+    """
+    Stop the running request here if it was superseded.
+
+    Long computations call this at chunk boundaries, e.g. between the charts of
+    two carriers or between two statistics calls. Outside of a
+    :func:`cancellation_scope` it does nothing.
+    """
+    token = _current_token.get()
+    if token is not None:
+        token.check()
+
+
+@contextmanager
+def cancellation_scope(token: CancelToken) -> Iterator[CancelToken]:
+    """
+    Run a block with :func:`checkpoint` honoring the cancellation and deadline of ``token``.
+
+    Raises
+    ------
+    Cancelled
+        On entry once ``token`` is cancelled, or at a checkpoint of the block once
+        it is cancelled or expired
+    """
+    if token.cancelled:
+        raise Cancelled
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+class LatestWins:
+    """
+    Cancel the in-flight work of a session when a newer request of it arrives.
+
+    Requests carry a session identifier and a sequence number increasing with
+    every request of that session. Starting a request cancels the older request
+    of the same session at its next :func:`checkpoint`, freeing the worker for
+    other users; a request arriving after a newer one was started is cancelled
+    right away. The latest request of each of the ``max_sessions`` most recently
+    active sessions is remembered.
+    """
+
+    def __init__(self, max_sessions: int = MAX_TRACKED_SESSIONS) -> None:
+        self.max_sessions = max_sessions
+        self._latest: OrderedDict[Hashable, tuple[int, CancelToken]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of remembered sessions."""
+        with self._lock:
+            return len(self._latest)
+
+    def begin(self, session: Hashable, sequence: int, timeout: float | None = None) -> CancelToken:
+        """
+        Register a request and cancel the older one of the same session.
+
+        Parameters
+        ----------
+        session : Hashable
+            Identifier of the browser session
+        sequence : int
+            Number of the request within the session
+        timeout : float, optional
+            Deadline of the request in seconds, see :class:`CancelToken`
+
+        Returns
+        -------
+        CancelToken
+            Token of the request; already cancelled when a newer request of the session started
+        """
+        token = CancelToken(timeout)
+        with self._lock:
+            latest = self._latest.get(session)
+            if latest is not None and latest[0] > sequence:
+                token.cancel()
+                return token
+            if latest is not None:
+                latest[1].cancel()
+            self._latest[session] = (sequence, token)
+            self._latest.move_to_end(session)
+            while len(self._latest) > self.max_sessions:
+                self._latest.popitem(last=False)
+        return token
+
+    @contextmanager
+    def run(self, session: Hashable, sequence: int, timeout: float | None = None) -> Iterator[CancelToken]:
+        """
+        Run a block as the latest request of a session, with :func:`checkpoint` honoring its cancellation.
+
+        Raises
+        ------
+        Cancelled
+            At a checkpoint of the block once a newer request of the session started
+        DeadlineExceeded
+            At a checkpoint of the block once ``timeout`` seconds passed
+        """
+        with cancellation_scope(self.begin(session, sequence, timeout)) as token:
+            yield token
+
+
+class _Call:
+    """State of one in-flight computation."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key into a single computation.
+
+    The first caller of a key runs the computation; callers arriving while it is
+    in flight block until it finishes and receive the same result, or the same
+    exception. When the computation was :class:`Cancelled` because the request of
+    the first caller was superseded or ran out of time, a waiting caller runs it
+    afresh. Waiting callers inside a :func:`cancellation_scope` stop waiting once
+    their own request is cancelled or expired. Once finished, the key is forgotten,
+    so later calls compute again (usually they are answered by a cache in front of
+    this layer).
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of computations currently in flight."""
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Run ``compute`` unless a computation for ``key`` is already in flight.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identity of the computation; equal keys must produce equal results
+        compute : callable
+            Function without arguments producing the result
+
+        Returns
+        -------
+        T
+            The result of ``compute``, possibly computed by another thread
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if call is None:
+                    call = self._calls[key] = _Call()
+            if leader:
+                break
+
+            token = _current_token.get()
+            if token is None:
+                call.done.wait()
+            else:
+                while not call.done.wait(WAIT_CHECK_INTERVAL):
+                    token.check()
+            # The leader's request was superseded, which says nothing about ours
+            if isinstance(call.error, Cancelled):
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = compute()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,173 @@
+"""Compact encodings of the data arrays of figure dictionaries sent to the browser."""
+
+import base64
+from typing import Any
+
+import numpy as np
+
+# Trace attributes holding one value per point
+DATA_ARRAY_KEYS = ("x", "y", "z", "base")
+
+# Dtypes of Plotly.js typed arrays, by NumPy dtype
+TYPED_ARRAY_DTYPES: dict[np.dtype, str] = {
+    np.dtype("int8"): "i1",
+    np.dtype("uint8"): "u1",
+    np.dtype("int16"): "i2",
+    np.dtype("uint16"): "u2",
+    np.dtype("int32"): "i4",
+    np.dtype("uint32"): "u4",
+    np.dtype("float32"): "f4",
+    np.dtype("float64"): "f8",
+}
+
+_FLOAT32_MAX = float(np.finfo(np.float32).max)
+
+
+def typed_array(values: np.ndarray) -> dict[str, Any]:
+    """
+    Encode a numeric array as a Plotly.js base64 typed array (``{"dtype", "bdata"}``).
+
+    Integers that do not fit 32 bits are encoded as ``f8``.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == "b":
+        values = values.astype(np.uint8)
+    elif values.dtype not in TYPED_ARRAY_DTYPES:
+        int32 = np.iinfo(np.int32)
+        if values.dtype.kind in "iu" and values.size and int32.min <= values.min() and values.max() <= int32.max:
+            values = values.astype(np.int32)
+        else:
+            values = values.astype(np.float64)
+    data = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+    spec: dict[str, Any] = {"dtype": TYPED_ARRAY_DTYPES[values.dtype], "bdata": base64.b64encode(data.data).decode("ascii")}
+    if values.ndim > 1:
+        spec["shape"] = ", ".join(map(str, values.shape))
+    return spec
+
+
+def decode_typed_array(spec: dict[str, Any]) -> np.ndarray:
+    """Decode a Plotly.js base64 typed array back into a NumPy array."""
+    dtype = next(dtype for dtype, code in TYPED_ARRAY_DTYPES.items() if code == spec["dtype"])
+    values = np.frombuffer(base64.b64decode(spec["bdata"]), dtype=dtype.newbyteorder("<"))
+    if "shape" in spec:
+        values = values.reshape([int(size) for size in str(spec["shape"]).split(",")])
+    return values
+
+
+def _is_typed_array(value: Any) -> bool:
+    return isinstance(value, dict) and "bdata" in value and "dtype" in value
+
+
+def _float32_acceptable(values: np.ndarray) -> bool:
+    """Whether ``values`` fit float32; its 7 significant digits are ample for plotted values."""
+    finite = values[np.isfinite(values)]
+    return not finite.size or float(np.abs(finite).max()) <= _FLOAT32_MAX
+
+
+def encode_numbers(values: Any, float32: bool = True) -> Any:
+    """
+    Encode the numeric values of a trace attribute as a typed array.
+
+    Parameters
+    ----------
+    values : array-like or dict
+        Values of the attribute; typed arrays produced by Plotly are re-encoded
+    float32 : bool
+        Whether to store floating point values in single precision when they fit
+
+    Returns
+    -------
+    Any
+        A typed array, or ``values`` unchanged when they are not numeric
+    """
+    if _is_typed_array(values):
+        array = decode_typed_array(values)
+    elif isinstance(values, np.ndarray) and values.dtype.kind in "biuf":
+        array = values
+    else:
+        return values
+    if float32 and array.dtype.kind == "f" and array.dtype.itemsize > 4 and _float32_acceptable(array):
+        array = array.astype(np.float32)
+    return typed_array(array)
+
+
+def encode_dates(values: np.ndarray, key: str = "x") -> dict[str, Any]:
+    """
+    Encode a datetime64 coordinate array compactly.
+
+    Evenly spaced dates (e.g. hourly snapshots) become a start date ``x0`` and a
+    step ``dx`` in milliseconds, so the coordinate is not sent at all; other
+    dates become a ``f8`` typed array of milliseconds since the epoch, which a
+    date axis reads as UTC timestamps.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Dates with a ``datetime64`` dtype
+    key : str
+        Trace attribute holding the dates, ``"x"`` or ``"y"``
+
+    Returns
+    -------
+    dict
+        Trace attributes replacing ``key``: either ``{"x0": start, "dx": step}``
+        or ``{"x": typed array}``
+    """
+    milliseconds = values.astype("datetime64[ms]")
+    if len(values) > 1 and (milliseconds == values).all():
+        steps = np.diff(milliseconds.astype(np.int64))
+        if steps[0] > 0 and (steps == steps[0]).all():
+            return {f"{key}0": np.datetime_as_string(milliseconds[0], unit="ms"), f"d{key}": int(steps[0])}
+    return {key: typed_array(milliseconds.astype(np.int64).astype(np.float64))}
+
+
+def _axis_name(reference: str) -> str:
+    """Layout key of a trace's axis reference, e.g. ``"x2"`` -> ``"xaxis2"``."""
+    return f"{reference[0]}axis{reference[1:]}"
+
+
+def encode_figure(figure: dict[str, Any], float32: bool = True) -> dict[str, Any]:
+    """
+    Encode the data arrays of a figure dictionary compactly for the browser.
+
+    Numeric arrays become base64 typed arrays, in single precision where the
+    values fit, and date coordinates are replaced as described in
+    :func:`encode_dates`; the axes of encoded date coordinates are declared
+    date axes. Typed arrays take a fraction of the size of JSON number lists and
+    are decoded by Plotly.js without parsing. The figure is not modified.
+
+    Parameters
+    ----------
+    figure : dict
+        Figure dictionary, e.g. from ``go.Figure.to_dict()``
+    float32 : bool
+        Whether to store floating point values in single precision when they fit
+
+    Returns
+    -------
+    dict
+        The encoded figure dictionary
+    """
+    traces = []
+    date_axes: set[str] = set()
+    for trace in figure.get("data", []):
+        trace = dict(trace)
+        for key in DATA_ARRAY_KEYS:
+            values = trace.get(key)
+            if values is None:
+                continue
+            if key in ("x", "y") and isinstance(values, np.ndarray) and values.dtype.kind == "M":
+                del trace[key]
+                trace.update(encode_dates(values, key))
+                date_axes.add(_axis_name(trace.get(f"{key}axis", key)))
+            else:
+                trace[key] = encode_numbers(values, float32=float32)
+        traces.append(trace)
+
+    encoded = {**figure, "data": traces}
+    if date_axes:
+        layout = dict(figure.get("layout", {}))
+        for axis in date_axes:
+            layout[axis] = {**layout.get(axis, {}), "type": "date"}
+        encoded["layout"] = layout
+    return encoded
@@ -0,0 +1,357 @@
+"""Plain figure dictionaries for the dashboard charts, assembled without Plotly's property validation."""
+
+import copy
+from collections.abc import Hashable, Mapping
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+# Horizontal gap between facet columns, as a fraction of the plot width
+FACET_SPACING = 0.02
+
+# Margins of charts whose callers do not set their own
+DEFAULT_MARGIN = {"l": 50, "r": 50, "t": 50, "b": 50}
+
+# Color of the single-color horizontal bar charts
+BAR_COLOR = "#1F77B4"
+
+# Every category of a bar chart is labelled while its rows fit this many pixels, at 20 pixels per row
+LABEL_EVERY_ROW_HEIGHT = 2000
+
+# Carriers without a color of their own
+DEFAULT_CARRIER_COLORS = {"-": "gray", "": "gray"}
+
+_templates: dict[str, dict[str, Any]] = {}
+
+
+def template_data(name: str) -> dict[str, Any]:
+    """
+    Return a registered Plotly template (see :func:`~pypsa_explorer.config.setup_plotly_theme`) as a plain dict.
+
+    Every call returns a fresh copy, so figures can be modified independently.
+    """
+    if name not in _templates:
+        _templates[name] = pio.templates[name].to_plotly_json()
+    return copy.deepcopy(_templates[name])
+
+
+def value_label(data: pd.DataFrame | pd.Series) -> str:
+    """Axis label of a statistics result, e.g. ``"Optimal Capacity [MW]"``."""
+    label = data.attrs.get("name", "Value")
+    unit = data.attrs.get("unit", "")
+    if unit != "carrier dependent":
+        label += f" [{unit}]"
+    return label
+
+
+def carrier_color_map(n: Any) -> dict[str, str]:
+    """Map carrier nice names (or names, where a carrier has no nice name) to their colors."""
+    carriers = n.carriers
+    if "color" not in carriers:
+        return dict(DEFAULT_CARRIER_COLORS)
+    names = carriers.index.to_series()
+    if "nice_name" in carriers:
+        names = carriers["nice_name"].where(carriers["nice_name"].fillna("").ne(""), names)
+    colors = {
+        str(name): color for name, color in zip(names, carriers["color"], strict=True) if isinstance(color, str) and color
+    }
+    return {**DEFAULT_CARRIER_COLORS, **colors}
+
+
+def _axis_suffix(position: int) -> str:
+    return "" if position == 0 else str(position + 1)
+
+
+def _facets(index: pd.Index, facet_col: str | None) -> list[tuple[Hashable | None, np.ndarray]]:
+    """Row positions of every facet, in order of appearance; a single facet of all rows without ``facet_col``."""
+    if facet_col is None:
+        return [(None, np.arange(len(index)))]
+    codes, uniques = pd.factorize(index.get_level_values(facet_col))
+    return [(facet, np.flatnonzero(codes == code)) for code, facet in enumerate(uniques)]
+
+
+def facet_layout(
+    facets: list[Hashable | None],
+    facet_col: str | None,
+    *,
+    x_title: str,
+    y_title: str,
+    category_axis: bool = False,
+) -> dict[str, Any]:
+    """
+    Lay out one subplot per facet in a single row, as Plotly Express does for ``facet_col``.
+
+    All subplots share the ranges of the first one; only the first y axis is
+    titled and labelled, and every subplot is titled ``"<facet_col>=<facet>"``.
+
+    Parameters
+    ----------
+    facets : list
+        Facet values, one subplot each; ``[None]`` for an unfaceted chart
+    facet_col : str, optional
+        Name of the faceting dimension
+    x_title, y_title : str
+        Axis titles
+    category_axis : bool
+        Whether the y axes are categorical and every category should be labelled
+
+    Returns
+    -------
+    dict
+        Layout entries of the axes and subplot titles
+    """
+    width = (1.0 - FACET_SPACING * (len(facets) - 1)) / len(facets)
+    layout: dict[str, Any] = {}
+    annotations = []
+    for position, facet in enumerate(facets):
+        suffix = _axis_suffix(position)
+        start = position * (width + FACET_SPACING)
+        domain = [start, 1.0 if position == len(facets) - 1 else start + width]
+        xaxis: dict[str, Any] = {"anchor": f"y{suffix}", "domain": domain, "title": {"text": x_title}}
+        yaxis: dict[str, Any] = {"anchor": f"x{suffix}", "domain": [0.0, 1.0]}
+        if position == 0:
+            yaxis["title"] = {"text": y_title}
+        else:
+            xaxis["matches"] = "x"
+            yaxis.update(matches="y", showticklabels=False)
+        if category_axis:
+            yaxis["dtick"] = 1
+        layout[f"xaxis{suffix}"] = xaxis
+        layout[f"yaxis{suffix}"] = yaxis
+        if facet_col is not None:
+            annotations.append(
+                {
+                    "font": {},
+                    "showarrow": False,
+                    "text": f"{facet_col}={facet}",
+                    "x": domain[0] + (domain[1] - domain[0]) / 2,
+                    "xanchor": "center",
+                    "xref": "paper",
+                    "y": 1.0,
+                    "yanchor": "bottom",
+                    "yref": "paper",
+                }
+            )
+    if annotations:
+        layout["annotations"] = annotations
+    return layout
+
+
+def stacked_area_figure(
+    data: pd.DataFrame,
+    *,
+    colors: Mapping[str, str] | None = None,
+    facet_col: str | None = None,
+    template: str,
+    height: int = 500,
+) -> dict[str, Any]:
+    """
+    Build a stacked area chart of time series per carrier, with positive and negative values stacked apart.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Statistics result with one row per carrier (index level ``"carrier"``,
+        and ``facet_col`` when given) and one column per snapshot
+    colors : Mapping, optional
+        Colors by carrier
+    facet_col : str, optional
+        Index level to draw one subplot per value of
+    template : str
+        Name of the registered Plotly template
+    height : int
+        Chart height in pixels
+
+    Returns
+    -------
+    dict
+        Figure dictionary
+    """
+    colors = colors or {}
+    label = value_label(data)
+    snapshots = data.columns.get_level_values(-1).to_numpy()
+    values = data.to_numpy(dtype=float, na_value=0.0)
+    carriers = data.index.get_level_values("carrier")
+    facets = _facets(data.index, facet_col)
+
+    traces = []
+    in_legend: set[str] = set()
+    # Positive and negative parts are stacked separately, above and below zero
+    for stackgroup, clipped in (("positive", np.maximum(values, 0.0)), ("negative", np.minimum(values, 0.0))):
+        for carrier in carriers.unique():
+            name = str(carrier)
+            for position, (facet, rows) in enumerate(facets):
+                carrier_rows = rows[carriers[rows] == carrier]
+                series = clipped[carrier_rows].sum(axis=0)
+                if not np.any(series):
+                    continue
+                suffix = _axis_suffix(position)
+                facet_hover = f"<br>{facet_col}={facet}" if facet_col is not None else ""
+                trace: dict[str, Any] = {
+                    "type": "scatter",
+                    "mode": "lines",
+                    "name": name,
+                    "legendgroup": name,
+                    "showlegend": name not in in_legend,
+                    "stackgroup": stackgroup,
+                    "line": {"width": 0},
+                    "x": snapshots,
+                    "y": series,
+                    "xaxis": f"x{suffix}",
+                    "yaxis": f"y{suffix}",
+                    "hovertemplate": f"carrier={name}{facet_hover}<br>snapshot=%{{x}}<br>{label}=%{{y}}<extra></extra>",
+                }
+                if name in colors:
+                    trace["line"]["color"] = colors[name]
+                in_legend.add(name)
+                traces.append(trace)
+
+    # Carriers that are zero throughout still get a legend entry
+    for carrier in carriers.unique():
+        name = str(carrier)
+        if name not in in_legend:
+            line = {"width": 0, **({"color": colors[name]} if name in colors else {})}
+            traces.append(
+                {"type": "scatter", "mode": "lines", "name": name, "legendgroup": name, "x": [], "y": [], "line": line}
+            )
+
+    layout = {
+        "template": template_data(template),
+        **facet_layout([facet for facet, _ in facets], facet_col, x_title="snapshot", y_title=label),
+        "legend": {"title": {"text": "carrier"}, "tracegroupgap": 0},
+        "height": height,
+        "hovermode": "x",
+        "margin": dict(DEFAULT_MARGIN),
+    }
+    return {"data": traces, "layout": layout}
+
+
+def horizontal_bar_figure(
+    data: pd.Series,
+    *,
+    facet_col: str | None = None,
+    template: str,
+    category_title: str = "carrier",
+    height: int = 500,
+) -> dict[str, Any]:
+    """
+    Build a horizontal bar chart of totals per carrier, optionally with one subplot per facet.
+
+    Parameters
+    ----------
+    data : pd.Series
+        Statistics result indexed by ``"carrier"`` (and ``facet_col`` when given)
+    facet_col : str, optional
+        Index level to draw one subplot per value of
+    template : str
+        Name of the registered Plotly template
+    category_title : str
+        Title of the carrier axis
+    height : int
+        Smallest chart height in pixels; grows with the number of carriers
+
+    Returns
+    -------
+    dict
+        Figure dictionary
+    """
+    label = value_label(data)
+    values = data.to_numpy(dtype=float)
+    carriers = data.index.get_level_values("carrier").astype(str)
+    facets = _facets(data.index, facet_col)
+
+    traces = []
+    for position, (facet, rows) in enumerate(facets):
+        suffix = _axis_suffix(position)
+        facet_hover = f"{facet_col}={facet}<br>" if facet_col is not None else ""
+        traces.append(
+            {
+                "type": "bar",
+                "orientation": "h",
+                "name": "",
+                "showlegend": False,
+                "marker": {"color": BAR_COLOR},
+                "x": values[rows],
+                "y": carriers[rows].to_numpy(dtype=object),
+                "xaxis": f"x{suffix}",
+                "yaxis": f"y{suffix}",
+                "hovertemplate": f"{facet_hover}{label}=%{{x}}<br>carrier=%{{y}}<extra></extra>",
+            }
+        )
+
+    category_height = 20 * carriers.nunique() + 100
+    layout = {
+        "template": template_data(template),
+        **facet_layout(
+            [facet for facet, _ in facets],
+            facet_col,
+            x_title=label,
+            y_title=category_title,
+            category_axis=category_height <= LABEL_EVERY_ROW_HEIGHT,
+        ),
+        "legend": {"tracegroupgap": 0},
+        "barmode": "group",
+        "height": max(height, min(category_height, LABEL_EVERY_ROW_HEIGHT)),
+        "margin": dict(DEFAULT_MARGIN),
+    }
+    return {"data": traces, "layout": layout}
+
+
+def grouped_bar_figure(
+    data: pd.DataFrame,
+    *,
+    colors: Mapping[str, str] | None = None,
+    template: str,
+    legend_title: str = "carrier",
+    zero_line: bool = False,
+    height: int = 500,
+) -> dict[str, Any]:
+    """
+    Build a vertical bar chart with one group of bars per row and one trace per column.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Values with one row per group (e.g. scenario) and one column per trace (e.g. carrier)
+    colors : Mapping, optional
+        Colors by column
+    template : str
+        Name of the registered Plotly template
+    legend_title : str
+        Title of the legend listing the columns
+    zero_line : bool
+        Whether to draw a horizontal line at zero, e.g. for differences
+    height : int
+        Chart height in pixels
+
+    Returns
+    -------
+    dict
+        Figure dictionary
+    """
+    colors = colors or {}
+    groups = data.index.astype(str).to_numpy(dtype=object)
+    values = data.to_numpy(dtype=float)
+
+    traces = []
+    for position, column in enumerate(data.columns):
+        name = str(column)
+        trace: dict[str, Any] = {"type": "bar", "name": name, "x": groups, "y": values[:, position]}
+        if name in colors:
+            trace["marker"] = {"color": colors[name]}
+        traces.append(trace)
+
+    layout: dict[str, Any] = {
+        "template": template_data(template),
+        "legend": {"title": {"text": legend_title}},
+        "barmode": "group",
+        "height": height,
+        "margin": dict(DEFAULT_MARGIN),
+    }
+    if zero_line:
+        layout["shapes"] = [
+            {"type": "line", "xref": "x domain", "x0": 0, "x1": 1, "yref": "y", "y0": 0, "y1": 0, "line": {"width": 1}}
+        ]
+    return {"data": traces, "layout": layout}
@@ -0,0 +1,92 @@
+"""Deterministic content fingerprints for PyPSA networks."""
+
+import hashlib
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+import pypsa
+
+# Memoized fingerprints by object id; networks are unhashable, so entries are
+# dropped by a finalizer when the network is garbage collected
+_fingerprints: dict[int, str] = {}
+_lock = threading.Lock()
+
+
+def _hash_values(h: "hashlib._Hash", values: np.ndarray) -> None:
+    """Feed an array to the hash, through its buffer where it has one."""
+    h.update(values.dtype.str.encode())
+    if values.dtype.kind in "biufcmM":
+        # A view on the array's memory; only non-contiguous arrays are copied
+        h.update(np.ascontiguousarray(values).view(np.uint8).data)
+    else:
+        h.update("\x1f".join(map(str, values.ravel())).encode())
+
+
+def _hash_index(h: "hashlib._Hash", index: pd.Index) -> None:
+    for level in range(index.nlevels):
+        _hash_values(h, np.asarray(index.get_level_values(level)))
+
+
+def _hash_frame(h: "hashlib._Hash", name: str, df: pd.DataFrame) -> None:
+    h.update(name.encode())
+    h.update(repr(df.shape).encode())
+    if df.empty:
+        return
+    h.update("\x1f".join(map(str, df.columns)).encode())
+    _hash_index(h, df.index)
+    dtypes = set(df.dtypes)
+    if len(dtypes) == 1 and isinstance(next(iter(dtypes)), np.dtype):
+        # Time series frames hold one block; its transpose is the block's memory
+        _hash_values(h, df.to_numpy().T)
+        return
+    for _, column in df.items():
+        _hash_values(h, column.to_numpy())
+
+
+def compute_network_fingerprint(n: pypsa.Network) -> str:
+    """
+    Hash the snapshots, component tables and time series of a network.
+
+    Numeric columns and time series are hashed through their underlying array
+    buffers without copying them; only text columns are encoded. The result only
+    depends on the network's content, so every process that loads the same file
+    computes the same fingerprint.
+
+    Parameters
+    ----------
+    n : pypsa.Network
+        The PyPSA network object
+
+    Returns
+    -------
+    str
+        Hexadecimal fingerprint
+    """
+    h = hashlib.sha256()
+    _hash_index(h, n.snapshots)
+    for c in n.c.values():
+        _hash_frame(h, c.list_name, c.static)
+        for attr, df in sorted(c.dynamic.items()):
+            _hash_frame(h, f"{c.list_name}_t.{attr}", df)
+    return h.hexdigest()[:32]
+
+
+def network_fingerprint(n: pypsa.Network) -> str:
+    """
+    Return the fingerprint of a network, computing it on first use.
+
+    The fingerprint is memoized per network object; networks are not expected to be
+    modified once they are served by the dashboard.
+    """
+    key = id(n)
+    with _lock:
+        fingerprint = _fingerprints.get(key)
+    if fingerprint is None:
+        fingerprint = compute_network_fingerprint(n)
+        with _lock:
+            if key not in _fingerprints:
+                weakref.finalize(n, _fingerprints.pop, key, None)
+            _fingerprints[key] = fingerprint
+    return fingerprint
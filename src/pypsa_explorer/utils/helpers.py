@@ -135,10 +135,41 @@ def get_country_options(n: pypsa.Network) -> list[dict[str, str]]:
     return sorted(options, key=lambda x: x["label"])
 
 
+def get_country_selection(
+    country_mode: str, selected_countries: list[str]
+) -> tuple[list[str] | None, str | None, html.Div | None]:
+    """
+    Determine the countries to show and the facet column based on country selection.
+
+    Parameters
+    ----------
+    country_mode : str
+        Either "All" or "Specific" to indicate filtering mode
+    selected_countries : list[str]
+        List of selected country codes
+
+    Returns
+    -------
+    tuple
+        (countries or None for all, facet_col, error_message_component | None)
+    """
+    from pypsa_explorer.layouts.components import PLEASE_SELECT_COUNTRY_MSG
+
+    if country_mode == "Specific":
+        if not selected_countries:
+            return None, None, PLEASE_SELECT_COUNTRY_MSG
+        return list(selected_countries), "country", None
+    # Default is "All" countries
+    return None, None, None
+
+
 def get_country_filter(country_mode: str, selected_countries: list[str]) -> tuple[str | None, str | None, html.Div | None]:
     """
     Determine the query string and facet column based on country selection.
 
+    The dashboard charts use :func:`get_country_selection`, which selects the
+    countries through a positional index instead of a query.
+
     Parameters
     ----------
     country_mode : str
@@ -174,6 +205,15 @@ def summarize_network(n: pypsa.Network) -> dict[str, int | str]:
     }
 
 
+def describe_network(n: pypsa.Network) -> dict[str, int | str]:
+    """Summarize a network for the network registry, including its content fingerprint."""
+    from pypsa_explorer.utils.fingerprint import network_fingerprint
+
+    summary = summarize_network(n)
+    summary["fingerprint"] = network_fingerprint(n)
+    return summary
+
+
 def resolve_default_network_path(default_path: str | None = "demo-network.nc") -> Path | None:
     """Locate the bundled demo network if available."""
 
@@ -0,0 +1,234 @@
+"""Response compression and immutable static assets for the dashboard server."""
+
+import gzip
+import hashlib
+import mimetypes
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import flask
+
+# Responses smaller than this many bytes are sent uncompressed
+COMPRESSION_MIN_SIZE = 1024
+
+# Media types worth compressing; images and fonts are compressed formats already
+COMPRESSIBLE_MIMETYPES = frozenset(
+    {
+        "application/json",
+        "application/javascript",
+        "image/svg+xml",
+        "text/css",
+        "text/html",
+        "text/javascript",
+        "text/plain",
+    }
+)
+
+# Fast levels: callback payloads are compressed on every request
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+# Number of compressed bodies kept for long-lived responses such as Dash's component bundles
+COMPRESSED_CACHE_ENTRIES = 64
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+STATIC_URL_PATH = "_pypsa-explorer/static"
+
+# Stylesheets of the dashboard page, relative to STATIC_DIR
+STYLESHEETS = ("css/bootstrap.min.css", "css/fontawesome.min.css", "css/solid.min.css", "css/dashboard.css")
+
+
+def _brotli() -> ModuleType | None:
+    """Return the optional ``brotli`` module, or ``None`` when it is not installed."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """
+    Pick the content encoding for a response from an ``Accept-Encoding`` header.
+
+    Brotli is preferred when the ``brotli`` package is installed, then gzip.
+
+    Parameters
+    ----------
+    accept_encoding : str
+        Value of the request's ``Accept-Encoding`` header
+
+    Returns
+    -------
+    str or None
+        ``"br"``, ``"gzip"`` or ``None`` when the client accepts neither
+    """
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    if "br" in accepted and _brotli() is not None:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress ``data`` with ``"br"`` or ``"gzip"``."""
+    if encoding == "br":
+        brotli = _brotli()
+        if brotli is None:
+            raise ImportError("Brotli compression requires the 'brotli' package: pip install brotli")
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def _is_long_lived(response: flask.Response) -> bool:
+    return bool(response.cache_control.immutable or (response.cache_control.max_age or 0) >= 86400)
+
+
+def install_compression(server: flask.Flask, min_size: int = COMPRESSION_MIN_SIZE) -> None:
+    """
+    Compress text responses of a Flask server (layout, callbacks, scripts) with brotli or gzip.
+
+    Install this before :meth:`~pypsa_explorer.utils.metrics.CallbackMetrics.install`,
+    so that callback metrics report uncompressed payload sizes and exclude the
+    compression time. Bodies of long-lived responses, such as Dash's fingerprinted
+    component bundles, are compressed once and reused.
+
+    Parameters
+    ----------
+    server : flask.Flask
+        Flask server of the Dash app
+    min_size : int
+        Smallest body size in bytes that is compressed
+    """
+    compressed_bodies: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+    lock = threading.Lock()
+
+    @server.after_request
+    def _compress(response: flask.Response) -> flask.Response:
+        if (
+            response.direct_passthrough
+            or response.is_streamed
+            # Partial (206) and other non-200 bodies are sent as they are, e.g. byte ranges refer to the plain body
+            or response.status_code != 200
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        ):
+            return response
+        response.vary.add("Accept-Encoding")
+        encoding = negotiate_encoding(flask.request.headers.get("Accept-Encoding", ""))
+        if encoding is None:
+            return response
+
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+        if _is_long_lived(response):
+            key = (flask.request.full_path, encoding)
+            with lock:
+                body = compressed_bodies.get(key)
+            if body is None:
+                body = compress(data, encoding)
+                with lock:
+                    compressed_bodies[key] = body
+                    while len(compressed_bodies) > COMPRESSED_CACHE_ENTRIES:
+                        compressed_bodies.popitem(last=False)
+        else:
+            body = compress(data, encoding)
+        response.set_data(body)
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+
+class StaticAssets:
+    """
+    The dashboard's stylesheets (Bootstrap, Font Awesome and its own) and icon font.
+
+    They are served by the dashboard itself, under a content-hashed URL.
+
+    Every file of ``directory`` is read once. The URLs contain a hash of all files,
+    so responses can be cached by browsers and proxies forever: a release that
+    changes any file also changes the URLs. Text files are kept precompressed.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory holding the assets
+    """
+
+    def __init__(self, directory: Path = STATIC_DIR) -> None:
+        self.files: dict[str, bytes] = {
+            path.relative_to(directory).as_posix(): path.read_bytes()
+            for path in sorted(directory.rglob("*"))
+            if path.is_file()
+        }
+        digest = hashlib.sha256()
+        for name, data in self.files.items():
+            digest.update(name.encode())
+            digest.update(data)
+        self.version = digest.hexdigest()[:16]
+        self._compressed: dict[tuple[str, str], bytes] = {}
+
+    def path(self, name: str) -> str:
+        """Return the URL path of an asset, relative to the app's root."""
+        return f"/{STATIC_URL_PATH}/{self.version}/{name}"
+
+    def _encoded(self, name: str, encoding: str) -> bytes:
+        key = (name, encoding)
+        if key not in self._compressed:
+            self._compressed[key] = compress(self.files[name], encoding)
+        return self._compressed[key]
+
+    def response(self, version: str, name: str) -> flask.Response:
+        """Serve one asset with immutable cache headers."""
+        if version != self.version or name not in self.files:
+            flask.abort(404)
+        mimetype = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        headers: dict[str, Any] = {"Cache-Control": IMMUTABLE_CACHE_CONTROL}
+        data = self.files[name]
+        if mimetype in COMPRESSIBLE_MIMETYPES:
+            headers["Vary"] = "Accept-Encoding"
+            encoding = negotiate_encoding(flask.request.headers.get("Accept-Encoding", ""))
+            if encoding is not None and len(data) >= COMPRESSION_MIN_SIZE:
+                data = self._encoded(name, encoding)
+                headers["Content-Encoding"] = encoding
+        return flask.Response(data, mimetype=mimetype, headers=headers)
+
+    def install(self, app: Any) -> list[str]:
+        """
+        Serve the assets from the server of a Dash app.
+
+        Parameters
+        ----------
+        app : dash.Dash
+            The Dash application
+
+        Returns
+        -------
+        list[str]
+            URLs of the dashboard stylesheets, for :func:`~pypsa_explorer.config.get_html_template`
+        """
+        prefix = app.config.routes_pathname_prefix.rstrip("/")
+        app.server.add_url_rule(
+            f"{prefix}/{STATIC_URL_PATH}/<version>/<path:name>",
+            "pypsa_explorer_static",
+            self.response,
+        )
+        return [app.get_relative_path(self.path(name)) for name in STYLESHEETS]
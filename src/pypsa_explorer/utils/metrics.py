@@ -0,0 +1,289 @@
+"""Callback latency instrumentation and a Prometheus text exposition of the results."""
+
+import functools
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import ContextDecorator, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+import dash
+import flask
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the callback duration histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Phases reported per callback; serialization is measured around Dash's response encoding
+PHASES = ("statistics", "figure", "serialization")
+
+# Attribute of flask.g holding the record of the callback served by the current request
+_G_RECORD = "pypsa_explorer_callback_record"
+_G_STARTED = "pypsa_explorer_request_started"
+
+
+@dataclass
+class CallbackRecord:
+    """Timings of a single callback invocation."""
+
+    callback: str
+    wall: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    payload_bytes: int | None = None
+    error: bool = False
+    # Stack of [phase, start, time spent in nested phases] for exclusive phase accounting
+    _stack: list[list[Any]] = field(default_factory=list, repr=False)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a JSON-serializable dictionary."""
+        return {
+            "callback": self.callback,
+            "wall_ms": round(self.wall * 1000, 3),
+            **{f"{name}_ms": round(self.phases.get(name, 0.0) * 1000, 3) for name in PHASES},
+            "payload_bytes": self.payload_bytes,
+            "error": self.error,
+        }
+
+
+_current_record: ContextVar[CallbackRecord | None] = ContextVar("pypsa_explorer_callback_record", default=None)
+
+
+class phase(ContextDecorator):
+    """
+    Attribute the time spent in a block or function to a named phase of the running callback.
+
+    Nested phases are exclusive: time spent computing statistics while building a
+    figure counts as statistics time only. Outside an instrumented callback this is
+    a no-op.
+
+    Parameters
+    ----------
+    name : str
+        Phase name, e.g. ``"statistics"`` or ``"figure"``
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> "phase":
+        record = _current_record.get()
+        if record is not None:
+            record._stack.append([self.name, time.perf_counter(), 0.0])
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        record = _current_record.get()
+        if record is None or not record._stack:
+            return
+        name, start, nested = record._stack.pop()
+        elapsed = time.perf_counter() - start
+        record.phases[name] = record.phases.get(name, 0.0) + elapsed - nested
+        if record._stack:
+            record._stack[-1][2] += elapsed
+
+
+@dataclass
+class _CallbackStats:
+    calls: int = 0
+    errors: int = 0
+    wall_sum: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(DURATION_BUCKETS))
+    phases: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    payload_bytes: int = 0
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class CallbackMetrics:
+    """
+    Aggregated per-callback latency metrics of a dashboard.
+
+    Parameters
+    ----------
+    log_requests : bool
+        Emit one structured (JSON) log line per instrumented callback request on the
+        ``pypsa_explorer.utils.metrics`` logger
+    """
+
+    def __init__(self, log_requests: bool = False) -> None:
+        self.log_requests = log_requests
+        self._stats: dict[str, _CallbackStats] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, record: CallbackRecord) -> None:
+        """Add a finished callback record to the aggregates."""
+        with self._lock:
+            stats = self._stats.setdefault(record.callback, _CallbackStats())
+            stats.calls += 1
+            stats.errors += record.error
+            stats.wall_sum += record.wall
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if record.wall <= bound:
+                    stats.buckets[i] += 1
+            for name, seconds in record.phases.items():
+                stats.phases[name] = stats.phases.get(name, 0.0) + seconds
+            stats.payload_bytes += record.payload_bytes or 0
+        if self.log_requests:
+            logger.info(json.dumps(record.as_dict()))
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return the current aggregates per callback."""
+        with self._lock:
+            return {
+                name: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "wall_seconds": stats.wall_sum,
+                    "phase_seconds": dict(stats.phases),
+                    "payload_bytes": stats.payload_bytes,
+                }
+                for name, stats in self._stats.items()
+            }
+
+    def wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``func`` wrapped so that each invocation is timed."""
+        name = func.__name__
+
+        @functools.wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            record = CallbackRecord(name)
+            token = _current_record.set(record)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except dash.exceptions.PreventUpdate:
+                raise
+            except Exception:
+                record.error = True
+                raise
+            finally:
+                record.wall = time.perf_counter() - start
+                _current_record.reset(token)
+                if flask.has_request_context():
+                    # Completed in after_request, once the response is serialized
+                    setattr(flask.g, _G_RECORD, record)
+                else:
+                    self.observe(record)
+
+        return timed
+
+    @contextmanager
+    def instrument(
+        self,
+        app: dash.Dash,
+        wrappers: Sequence[Callable[[Callable[..., Any]], Callable[..., Any]]] = (),
+    ) -> Iterator[None]:
+        """
+        Time every callback registered with ``app.callback`` inside the block.
+
+        The wrapped functions keep their ``__wrapped__`` attribute chain, so
+        ``callback_map[...]["callback"].__wrapped__`` still calls the decorated
+        function.
+
+        Parameters
+        ----------
+        app : dash.Dash
+            The Dash application instance
+        wrappers : sequence of callables
+            Further decorators (e.g. a profiler) applied inside the timing layer
+        """
+        original = app.callback
+
+        def callback(*args: Any, **kwargs: Any) -> Callable[[Callable[..., Any]], Any]:
+            decorator = original(*args, **kwargs)
+
+            def register(func: Callable[..., Any]) -> Any:
+                for wrapper in wrappers:
+                    func = wrapper(func)
+                return decorator(self.wrap(func))
+
+            return register
+
+        app.callback = callback  # type: ignore[method-assign]
+        try:
+            yield
+        finally:
+            del app.callback
+
+    def install(self, server: flask.Flask, path: str = "/metrics") -> None:
+        """
+        Complete callback records with serialization data and expose the metrics.
+
+        Parameters
+        ----------
+        server : flask.Flask
+            Flask server of the Dash app
+        path : str
+            Route serving the Prometheus text format
+        """
+
+        @server.before_request
+        def _start_timer() -> None:
+            setattr(flask.g, _G_STARTED, time.perf_counter())
+
+        @server.after_request
+        def _finish_record(response: flask.Response) -> flask.Response:
+            record: CallbackRecord | None = flask.g.pop(_G_RECORD, None)
+            if record is not None:
+                total = time.perf_counter() - flask.g.get(_G_STARTED, time.perf_counter())
+                # Time spent by Dash outside the callback, dominated by JSON encoding
+                record.phases["serialization"] = max(total - record.wall, 0.0)
+                record.payload_bytes = response.calculate_content_length() or 0
+                self.observe(record)
+            return response
+
+        def _metrics() -> flask.Response:
+            return flask.Response(self.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+        server.add_url_rule(path, "pypsa_explorer_metrics", _metrics)
+
+    def render_prometheus(self) -> str:
+        """Render the aggregates in the Prometheus text exposition format."""
+        lines = [
+            "# HELP pypsa_explorer_callback_duration_seconds Wall time of dashboard callbacks.",
+            "# TYPE pypsa_explorer_callback_duration_seconds histogram",
+        ]
+        with self._lock:
+            stats_items = sorted(self._stats.items())
+            for name, stats in stats_items:
+                label = f'callback="{_escape_label(name)}"'
+                for bound, count in zip(DURATION_BUCKETS, stats.buckets, strict=True):
+                    lines.append(f'pypsa_explorer_callback_duration_seconds_bucket{{{label},le="{bound}"}} {count}')
+                lines.append(f'pypsa_explorer_callback_duration_seconds_bucket{{{label},le="+Inf"}} {stats.calls}')
+                lines.append(f"pypsa_explorer_callback_duration_seconds_sum{{{label}}} {stats.wall_sum}")
+                lines.append(f"pypsa_explorer_callback_duration_seconds_count{{{label}}} {stats.calls}")
+
+            lines += [
+                "# HELP pypsa_explorer_callback_phase_seconds_total Time spent per callback phase.",
+                "# TYPE pypsa_explorer_callback_phase_seconds_total counter",
+            ]
+            for name, stats in stats_items:
+                for phase_name, seconds in sorted(stats.phases.items()):
+                    lines.append(
+                        f'pypsa_explorer_callback_phase_seconds_total{{callback="{_escape_label(name)}",'
+                        f'phase="{phase_name}"}} {seconds}'
+                    )
+
+            lines += [
+                "# HELP pypsa_explorer_callback_payload_bytes_total Bytes of serialized callback responses.",
+                "# TYPE pypsa_explorer_callback_payload_bytes_total counter",
+            ]
+            for name, stats in stats_items:
+                lines.append(
+                    f'pypsa_explorer_callback_payload_bytes_total{{callback="{_escape_label(name)}"}} {stats.payload_bytes}'
+                )
+
+            lines += [
+                "# HELP pypsa_explorer_callback_errors_total Callback invocations that raised an exception.",
+                "# TYPE pypsa_explorer_callback_errors_total counter",
+            ]
+            for name, stats in stats_items:
+                lines.append(f'pypsa_explorer_callback_errors_total{{callback="{_escape_label(name)}"}} {stats.errors}')
+        return "\n".join(lines) + "\n"
@@ -2,11 +2,14 @@
 
 import logging
 import os
+import threading
+from collections.abc import Callable
 
-import matplotlib.pyplot as plt
 import pandas as pd
 import pypsa
 
+from pypsa_explorer.utils.fingerprint import network_fingerprint
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,9 +83,79 @@ def load_networks(
     if not networks:
         raise ValueError("No valid networks were loaded")
 
+    # Fingerprint while loading, so the first cache lookup of each network does not pay for it
+    for n in networks.values():
+        network_fingerprint(n)
     return networks
 
 
+class LazyNetworks(dict[str, pypsa.Network]):
+    """
+    Dictionary of networks that can hold entries which are only loaded on first access.
+
+    Loaded networks are stored as regular dictionary items. Lazy entries are visible
+    through ``in`` and item access, which loads and stores the network on demand,
+    but not through iteration until they have been loaded.
+    """
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self._loaders: dict[str, Callable[[], pypsa.Network]] = {}
+        self._lock = threading.Lock()
+
+    def __missing__(self, label: str) -> pypsa.Network:
+        loader = self._loaders.get(label)
+        if loader is None:
+            raise KeyError(label)
+        with self._lock:
+            # Another thread may have loaded the network while we waited
+            if dict.__contains__(self, label):
+                return dict.__getitem__(self, label)
+            n = loader()
+            self[label] = n
+            return n
+
+    def __contains__(self, label: object) -> bool:
+        return dict.__contains__(self, label) or label in self._loaders
+
+    def register_lazy(self, label: str, loader: Callable[[], pypsa.Network]) -> None:
+        """Register a network that is loaded by ``loader`` when first accessed."""
+        self._loaders[label] = loader
+
+    def is_loaded(self, label: str) -> bool:
+        """Return whether the network behind ``label`` is currently in memory."""
+        return dict.__contains__(self, label)
+
+    def unload(self, label: str) -> None:
+        """Drop the loaded network so the next access reloads it through its loader."""
+        self.pop(label, None)
+
+    def remove(self, label: str) -> None:
+        """Forget a network entirely, including its lazy loader."""
+        self.pop(label, None)
+        self._loaders.pop(label, None)
+
+
+def load_network_file(path: str) -> pypsa.Network:
+    """
+    Load a single network file, make sure all its carriers are defined and fingerprint it.
+
+    Parameters
+    ----------
+    path : str
+        Path to a PyPSA network file
+
+    Returns
+    -------
+    pypsa.Network
+        The loaded network
+    """
+    n = pypsa.Network(path)
+    ensure_carriers_defined(n)
+    network_fingerprint(n)
+    return n
+
+
 def parse_cli_network_args(args: list[str]) -> dict[str, str]:
     """
     Parse command line arguments for network loading.
@@ -156,7 +229,10 @@ def generate_colors(n_colors: int, palette: str = "tab10") -> list[str]:
     list[str]
         List of hex color strings
     """
-    cmap = plt.colormaps.get_cmap(palette)
+    # matplotlib is only needed when a network has carriers without colors
+    import matplotlib
+
+    cmap = matplotlib.colormaps.get_cmap(palette)
     colors = []
     for i in range(n_colors):
         rgba = cmap(i % cmap.N)
@@ -0,0 +1,195 @@
+"""Directory watching for PyPSA Explorer: index, lazily register and reload network files."""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import netCDF4
+
+from pypsa_explorer.utils.cache import ResultCache
+from pypsa_explorer.utils.network_loader import LazyNetworks, load_network_file
+
+logger = logging.getLogger(__name__)
+
+# File suffixes picked up by the watcher
+NETWORK_FILE_SUFFIXES = (".nc",)
+
+# Component counts shown in the network registry, mapped to their netCDF dimension
+HEADER_DIMENSIONS = {
+    "buses": "buses_i",
+    "links": "links_i",
+    "lines": "lines_i",
+}
+
+
+def read_network_header(path: str | Path) -> dict[str, int]:
+    """
+    Summarize a network file from its netCDF header without loading the network.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to a PyPSA netCDF file
+
+    Returns
+    -------
+    dict[str, int]
+        Component counts in the same format as ``summarize_network``
+    """
+    with netCDF4.Dataset(path) as ds:
+        dimensions = ds.dimensions
+        return {key: len(dimensions[dim]) if dim in dimensions else 0 for key, dim in HEADER_DIMENSIONS.items()}
+
+
+@dataclass
+class WatchedFile:
+    """State of a single network file known to the watcher."""
+
+    label: str
+    path: Path
+    mtime_ns: int
+    size: int
+    summary: dict[str, Any]
+
+
+class NetworkWatcher:
+    """
+    Keep a network collection in sync with the ``.nc`` files of a directory.
+
+    New files are indexed from their netCDF header and registered as lazy entries,
+    so they are only loaded when first viewed. Modified files are unloaded and their
+    cached statistics, figures and maps dropped; the next access reloads just that
+    file. Deleted files are removed from the collection. Files named like a network
+    that was added otherwise, e.g. from the command line, are ignored.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory to watch (not recursive)
+    networks : LazyNetworks
+        Network collection shared with the dashboard callbacks
+    cache : ResultCache, optional
+        Result cache whose entries are invalidated when a file changes
+    poll_interval : float
+        Minimum number of seconds between two directory scans
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        networks: LazyNetworks,
+        *,
+        cache: ResultCache | None = None,
+        poll_interval: float = 2.0,
+    ) -> None:
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise NotADirectoryError(f"Watch directory not found: {self.directory}")
+        self.networks = networks
+        self.cache = cache
+        self.poll_interval = poll_interval
+        self._files: dict[str, WatchedFile] = {}
+        # Labels of files skipped because another network holds the label, warned about once
+        self._conflicts: set[str] = set()
+        self._last_scan = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def summaries(self) -> dict[str, dict[str, Any]]:
+        """Registry info for every watched network, keyed by label."""
+        # Scans of other threads update the files
+        with self._lock:
+            files = list(self._files.values())
+        return {entry.label: dict(entry.summary) for entry in files}
+
+    def _label_for(self, path: Path) -> str:
+        return os.path.splitext(path.name)[0]
+
+    def _list_files(self) -> dict[str, Path]:
+        files: dict[str, Path] = {}
+        for path in sorted(self.directory.iterdir()):
+            if path.is_file() and path.suffix in NETWORK_FILE_SUFFIXES:
+                files[self._label_for(path)] = path
+        return files
+
+    def _index(self, label: str, path: Path, stat: os.stat_result) -> WatchedFile | None:
+        try:
+            summary: dict[str, Any] = dict(read_network_header(path))
+        except Exception as e:
+            # Most likely a file that is still being written; retry on the next scan
+            logger.debug("Skipping unreadable network file '%s': %s", path, e)
+            return None
+        summary.update({"source": str(path), "origin": "watch", "mtime": stat.st_mtime})
+        return WatchedFile(label, path, stat.st_mtime_ns, stat.st_size, summary)
+
+    def scan(self, force: bool = False) -> bool:
+        """
+        Scan the directory and apply additions, modifications and removals.
+
+        Parameters
+        ----------
+        force : bool
+            Scan even if the last scan happened less than ``poll_interval`` seconds ago
+
+        Returns
+        -------
+        bool
+            Whether the set of networks or any of their summaries changed
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_scan < self.poll_interval:
+                return False
+            self._last_scan = now
+
+            changed = False
+            current = self._list_files()
+            self._conflicts.intersection_update(current)
+
+            for label in list(self._files):
+                if label not in current:
+                    logger.info("Network file for '%s' removed", label)
+                    del self._files[label]
+                    self.networks.remove(label)
+                    if self.cache is not None:
+                        self.cache.invalidate(label)
+                    changed = True
+
+            for label, path in current.items():
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+
+                known = self._files.get(label)
+                if known is None and label in self.networks:
+                    if label not in self._conflicts:
+                        logger.warning("Ignoring %s: a network labelled '%s' is loaded already", path, label)
+                        self._conflicts.add(label)
+                    continue
+                if known is not None and (known.mtime_ns, known.size) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+
+                entry = self._index(label, path, stat)
+                if entry is None:
+                    continue
+
+                if known is None:
+                    logger.info("Registered network '%s' from %s", label, path)
+                else:
+                    # Reload only this network on next access and drop only its cached results
+                    logger.info("Network file for '%s' modified, scheduling reload", label)
+                    self.networks.unload(label)
+                    if self.cache is not None:
+                        self.cache.invalidate(label)
+
+                self._files[label] = entry
+                self.networks.register_lazy(label, partial(load_network_file, str(path)))
+                changed = True
+
+            return changed
@@ -0,0 +1,134 @@
+"""Profiling of dashboard callbacks under real usage."""
+
+import cProfile
+import functools
+import logging
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from itertools import count
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Interval (seconds) between two stack samples of a running callback
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+
+def _frame_label(frame: FrameType) -> str:
+    """Label a frame as ``module:qualified.name`` so flamegraphs group by library."""
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_qualname}"
+
+
+class _StackSampler(threading.Thread):
+    """Background thread sampling the stacks of threads running profiled callbacks."""
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(name="pypsa-explorer-sampler", daemon=True)
+        self.interval = interval
+        self._targets: dict[int, tuple[CodeType, Counter[str]]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+    def add(self, thread_id: int, stop_code: CodeType, stacks: Counter[str]) -> None:
+        """Sample ``thread_id`` into ``stacks``; frames from ``stop_code`` upwards are skipped."""
+        with self._lock:
+            self._targets[thread_id] = (stop_code, stacks)
+        self._wakeup.set()
+
+    def remove(self, thread_id: int) -> None:
+        with self._lock:
+            self._targets.pop(thread_id, None)
+
+    def run(self) -> None:
+        while True:
+            # Sample under the lock so that removed targets are never updated afterwards
+            with self._lock:
+                if not self._targets:
+                    self._wakeup.clear()
+                frames = sys._current_frames()
+                for thread_id, (stop_code, stacks) in self._targets.items():
+                    frame: FrameType | None = frames.get(thread_id)
+                    stack = []
+                    while frame is not None and frame.f_code is not stop_code:
+                        stack.append(_frame_label(frame))
+                        frame = frame.f_back
+                    if stack:
+                        stacks[";".join(reversed(stack))] += 1
+                del frames
+            if not self._wakeup.is_set():
+                self._wakeup.wait()
+                continue
+            time.sleep(self.interval)
+
+
+class CallbackProfiler:
+    """
+    Profile every invocation of the wrapped dashboard callbacks.
+
+    Each invocation writes a deterministic ``cProfile`` profile to
+    ``<output_dir>/<callback>/<n>.prof`` (readable with ``pstats`` or snakeviz)
+    and appends sampled stacks to ``<output_dir>/<callback>.folded``. The folded
+    files are the input format of ``flamegraph.pl``, speedscope and inferno; stack
+    frames are labelled ``module:function`` so that time spent in pandas, PyPSA
+    statistics or Plotly is easy to spot.
+
+    Parameters
+    ----------
+    output_dir : str or Path
+        Directory receiving the profiles; created if missing
+    sample_interval : float
+        Seconds between two stack samples
+    """
+
+    def __init__(self, output_dir: str | Path, sample_interval: float = DEFAULT_SAMPLE_INTERVAL) -> None:
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._sampler = _StackSampler(sample_interval)
+        self._sampler.start()
+        # Only one deterministic profiler can be active per process at a time
+        self._cprofile_lock = threading.Lock()
+        self._counter = count(1)
+        self._file_lock = threading.Lock()
+
+    def wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``func`` wrapped so that each invocation is profiled."""
+        name = re.sub(r"[^\w.-]", "_", func.__name__)
+
+        def profiled(*args: Any, **kwargs: Any) -> Any:
+            stacks: Counter[str] = Counter()
+            thread_id = threading.get_ident()
+            profile = cProfile.Profile() if self._cprofile_lock.acquire(blocking=False) else None
+            self._sampler.add(thread_id, code, stacks)
+            if profile is not None:
+                profile.enable()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._sampler.remove(thread_id)
+                if profile is not None:
+                    profile.disable()
+                    self._cprofile_lock.release()
+                self._write(name, profile, stacks)
+
+        # Sampled stacks start at the frame of the undecorated wrapper
+        code = profiled.__code__
+        return functools.wraps(func)(profiled)
+
+    def _write(self, name: str, profile: cProfile.Profile | None, stacks: Counter[str]) -> None:
+        try:
+            if profile is not None:
+                callback_dir = self.output_dir / name
+                callback_dir.mkdir(exist_ok=True)
+                profile.dump_stats(callback_dir / f"{next(self._counter):05d}.prof")
+            if stacks:
+                with self._file_lock, open(self.output_dir / f"{name}.folded", "a") as f:
+                    f.writelines(f"{stack} {samples}\n" for stack, samples in stacks.items())
+        except OSError as e:
+            logger.warning("Could not write profile of %s: %s", name, e)
@@ -0,0 +1,285 @@
+"""Vectorized differences between two scenarios, per asset and per carrier."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import pypsa
+
+from pypsa_explorer.utils.cache import ResultCache
+from pypsa_explorer.utils.statistics import cached_statistic
+
+# Components compared asset by asset: optimal capacity attribute and dispatch time series
+DIFF_COMPONENTS: dict[str, tuple[str, str]] = {
+    "Generator": ("p_nom_opt", "p"),
+    "StorageUnit": ("p_nom_opt", "p"),
+    "Store": ("e_nom_opt", "p"),
+    "Link": ("p_nom_opt", "p0"),
+    "Line": ("s_nom_opt", "p0"),
+}
+
+# Number of snapshots whose differences are held in memory at once
+DIFF_CHUNK_SIZE = 512
+
+
+@dataclass
+class ScenarioDiff:
+    """
+    Differences of one scenario (``b``) to a reference scenario (``a``).
+
+    Attributes
+    ----------
+    assets : pd.DataFrame
+        One row per ``(component, asset)`` of either scenario with its carrier,
+        ``status`` (``"added"``, ``"removed"`` or ``"common"``), optimal capacity,
+        weighted dispatch energy and their deltas, and the largest absolute
+        difference of the dispatch time series
+    carriers : pd.DataFrame
+        Optimal capacity and energy balance per carrier (nice names) of both
+        scenarios and their deltas
+    """
+
+    assets: pd.DataFrame
+    carriers: pd.DataFrame
+
+    def top_assets(self, k: int = 10, by: str = "capacity_delta") -> pd.DataFrame:
+        """Return the ``k`` assets with the largest absolute value of column ``by``."""
+        return _top(self.assets, k, by)
+
+    def top_carriers(self, k: int = 10, by: str = "capacity_delta") -> pd.DataFrame:
+        """Return the ``k`` carriers with the largest absolute value of column ``by``."""
+        return _top(self.carriers, k, by)
+
+
+def _top(frame: pd.DataFrame, k: int, by: str) -> pd.DataFrame:
+    order = np.argsort(-np.abs(frame[by].to_numpy()), kind="stable")[:k]
+    return frame.iloc[order]
+
+
+def _positions(index: pd.Index, labels: pd.Index) -> np.ndarray:
+    """Positions of ``labels`` in ``index``, -1 where missing."""
+    if index.equals(labels):
+        return np.arange(len(labels))
+    return index.get_indexer(labels)
+
+
+def _column_map(columns: pd.Index, assets: pd.Index) -> tuple[np.ndarray, np.ndarray] | None:
+    """Asset positions and the matching column positions, or ``None`` when the columns are the assets."""
+    positions = _positions(columns, assets)
+    if len(positions) == len(columns) and (positions == np.arange(len(positions))).all():
+        return None
+    present = positions >= 0
+    return np.flatnonzero(present), positions[present]
+
+
+def _aligned_rows(
+    values: np.ndarray, column_map: tuple[np.ndarray, np.ndarray] | None, rows: slice, out: np.ndarray
+) -> np.ndarray:
+    """Rows of ``values`` with one column per asset, written to ``out``; missing assets are zero."""
+    if column_map is None:
+        return values[rows]
+    block = out[: rows.stop - rows.start]
+    block.fill(0.0)
+    targets, sources = column_map
+    block[:, targets] = values[rows, sources]
+    return block
+
+
+def diff_time_series(
+    a: pd.DataFrame,
+    b: pd.DataFrame,
+    assets: pd.Index,
+    weights: np.ndarray,
+    chunk_size: int = DIFF_CHUNK_SIZE,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compare two snapshot × asset time series frames over the given assets.
+
+    Both frames must be indexed by the same snapshots; assets missing from one
+    frame are treated as all-zero series. The frames are processed in blocks of
+    snapshots, which are aligned to the assets one block at a time.
+
+    Parameters
+    ----------
+    a, b : pd.DataFrame
+        Time series of the reference and the other scenario
+    assets : pd.Index
+        Assets (columns) to compare
+    weights : np.ndarray
+        Snapshot weightings used to turn the series into energies
+    chunk_size : int
+        Number of snapshots differenced at once
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        Weighted energy in ``a``, weighted energy in ``b`` and the largest absolute
+        difference between the series, per asset
+    """
+    values_a = a.to_numpy(dtype=float, copy=False)
+    values_b = b.to_numpy(dtype=float, copy=False)
+    columns_a = _column_map(a.columns, assets)
+    columns_b = _column_map(b.columns, assets)
+
+    energy_a = np.zeros(len(assets))
+    energy_b = np.zeros(len(assets))
+    max_delta = np.zeros(len(assets))
+    # Rows are contiguous, so aligning and differencing blocks of snapshots streams through memory
+    block_shape = (min(chunk_size, len(weights)), len(assets))
+    block_a = np.empty(block_shape) if columns_a is not None else np.empty((0, 0))
+    block_b = np.empty(block_shape) if columns_b is not None else np.empty((0, 0))
+    delta = np.empty(block_shape)
+    for start in range(0, len(weights), chunk_size):
+        rows = slice(start, min(start + chunk_size, len(weights)))
+        chunk_a = _aligned_rows(values_a, columns_a, rows, block_a)
+        chunk_b = _aligned_rows(values_b, columns_b, rows, block_b)
+        energy_a += weights[rows] @ chunk_a
+        energy_b += weights[rows] @ chunk_b
+        block = delta[: len(chunk_a)]
+        np.subtract(chunk_b, chunk_a, out=block)
+        np.abs(block, out=block)
+        np.maximum(max_delta, block.max(axis=0), out=max_delta)
+    return energy_a, energy_b, max_delta
+
+
+def _component_diff(n_a: pypsa.Network, n_b: pypsa.Network, component: str, snapshots: pd.Index) -> pd.DataFrame:
+    capacity_attr, series_attr = DIFF_COMPONENTS[component]
+    static_a = n_a.components[component].static
+    static_b = n_b.components[component].static
+    assets = static_a.index.union(static_b.index, sort=False)
+    if assets.empty:
+        return pd.DataFrame()
+
+    in_a = assets.isin(static_a.index)
+    in_b = assets.isin(static_b.index)
+    status = np.where(in_a & in_b, "common", np.where(in_a, "removed", "added"))
+
+    def static_values(static: pd.DataFrame, attr: str) -> np.ndarray:
+        if attr not in static:
+            return np.zeros(len(assets))
+        return static[attr].reindex(assets).fillna(0.0).to_numpy(dtype=float)
+
+    carrier = (
+        static_b["carrier"].reindex(assets).fillna(static_a["carrier"].reindex(assets)) if "carrier" in static_b else ""
+    )
+
+    dynamic_a = n_a.components[component].dynamic.get(series_attr, pd.DataFrame())
+    dynamic_b = n_b.components[component].dynamic.get(series_attr, pd.DataFrame())
+    weights = n_a.snapshot_weightings.generators.reindex(snapshots).to_numpy(dtype=float)
+    energy_a, energy_b, max_delta = diff_time_series(
+        dynamic_a.reindex(snapshots) if not dynamic_a.index.equals(snapshots) else dynamic_a,
+        dynamic_b.reindex(snapshots) if not dynamic_b.index.equals(snapshots) else dynamic_b,
+        assets,
+        weights,
+    )
+
+    capacity_a = static_values(static_a, capacity_attr)
+    capacity_b = static_values(static_b, capacity_attr)
+    frame = pd.DataFrame(
+        {
+            "carrier": carrier,
+            "status": status,
+            "capacity_a": capacity_a,
+            "capacity_b": capacity_b,
+            "capacity_delta": capacity_b - capacity_a,
+            "energy_a": energy_a,
+            "energy_b": energy_b,
+            "energy_delta": energy_b - energy_a,
+            "max_dispatch_delta": max_delta,
+        },
+        index=assets,
+    )
+    frame.index.name = "asset"
+    return frame
+
+
+def _carrier_diff(n_a: pypsa.Network, n_b: pypsa.Network, label_a: str, label_b: str, cache: ResultCache) -> pd.DataFrame:
+    columns = {}
+    for name, statistic in (("capacity", "optimal_capacity"), ("energy", "energy_balance")):
+        kwargs = {"groupby": "carrier", "nice_names": True, "aggregate_across_components": True}
+        totals_a = cached_statistic(n_a, label_a, statistic, cache, **kwargs)
+        totals_b = cached_statistic(n_b, label_b, statistic, cache, **kwargs)
+        aligned_a, aligned_b = totals_a.align(totals_b, fill_value=0.0)
+        columns[f"{name}_a"] = aligned_a
+        columns[f"{name}_b"] = aligned_b
+        columns[f"{name}_delta"] = aligned_b - aligned_a
+    carriers = pd.DataFrame(columns).fillna(0.0)
+    carriers.index.name = "carrier"
+    return carriers
+
+
+def diff_networks(
+    n_a: pypsa.Network,
+    n_b: pypsa.Network,
+    *,
+    label_a: str = "a",
+    label_b: str = "b",
+    components: tuple[str, ...] = tuple(DIFF_COMPONENTS),
+    cache: ResultCache | None = None,
+) -> ScenarioDiff:
+    """
+    Compute the differences of network ``n_b`` to the reference network ``n_a``.
+
+    Component tables are aligned by asset name and time series by snapshot (only
+    snapshots present in both networks are compared); all deltas are computed on
+    NumPy arrays, in blocks of snapshots whose columns are aligned one block at a
+    time, so that large networks need little extra memory.
+
+    Parameters
+    ----------
+    n_a : pypsa.Network
+        Reference network
+    n_b : pypsa.Network
+        Network compared to the reference
+    label_a, label_b : str
+        Labels of the networks, used to scope the cached statistics
+    components : tuple[str, ...]
+        Components compared asset by asset (keys of :data:`DIFF_COMPONENTS`)
+    cache : ResultCache, optional
+        Cache holding the per-carrier statistics; a private cache is used when omitted
+
+    Returns
+    -------
+    ScenarioDiff
+        Per-asset and per-carrier differences
+    """
+    cache = cache if cache is not None else ResultCache()
+    snapshots = n_a.snapshots if n_a.snapshots.equals(n_b.snapshots) else n_a.snapshots.intersection(n_b.snapshots)
+
+    frames = {component: _component_diff(n_a, n_b, component, snapshots) for component in components}
+    frames = {component: frame for component, frame in frames.items() if not frame.empty}
+    if frames:
+        assets = pd.concat(frames, names=["component", "asset"])
+    else:
+        assets = pd.DataFrame(index=pd.MultiIndex.from_arrays([[], []], names=["component", "asset"]))
+    return ScenarioDiff(assets=assets, carriers=_carrier_diff(n_a, n_b, label_a, label_b, cache))
+
+
+def diff_scenarios(
+    networks: Mapping[str, pypsa.Network],
+    reference: str,
+    other: str,
+    *,
+    cache: ResultCache | None = None,
+) -> ScenarioDiff:
+    """
+    Compute the differences of scenario ``other`` to scenario ``reference``.
+
+    Parameters
+    ----------
+    networks : Mapping
+        Networks by label
+    reference : str
+        Label of the reference scenario
+    other : str
+        Label of the scenario compared to the reference
+    cache : ResultCache, optional
+        Cache holding the per-carrier statistics, e.g. the dashboard's cache
+
+    Returns
+    -------
+    ScenarioDiff
+        Per-asset and per-carrier differences
+    """
+    return diff_networks(networks[reference], networks[other], label_a=reference, label_b=other, cache=cache)
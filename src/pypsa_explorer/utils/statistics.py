@@ -0,0 +1,192 @@
+"""Cached access to PyPSA statistics for the dashboard charts."""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pypsa
+
+from pypsa_explorer.utils.aggregation import PartialSums
+from pypsa_explorer.utils.cache import ResultCache, freeze_kwargs
+from pypsa_explorer.utils.concurrency import checkpoint
+from pypsa_explorer.utils.metrics import phase
+
+
+def cached_statistic(
+    n: pypsa.Network,
+    label: str,
+    statistic: str,
+    cache: ResultCache,
+    **kwargs: Any,
+) -> pd.DataFrame | pd.Series:
+    """
+    Compute (or fetch from cache) ``n.statistics.<statistic>(**kwargs)``.
+
+    Parameters
+    ----------
+    n : pypsa.Network
+        The PyPSA network object
+    label : str
+        Label of the network, used to scope invalidation of the cache entries
+    statistic : str
+        Name of the statistics method (e.g. ``"energy_balance"``)
+    cache : ResultCache
+        Cache holding the statistics results
+    **kwargs
+        Arguments of the statistics method
+
+    Returns
+    -------
+    pd.DataFrame or pd.Series
+        Result of the statistics method
+    """
+    handler = getattr(n.statistics, statistic)
+
+    def compute() -> pd.DataFrame | pd.Series:
+        # Statistics computations are the chunks at which superseded or late chart requests stop;
+        # cached results are returned without a checkpoint
+        checkpoint()
+        return phase("statistics")(handler)(**kwargs)
+
+    return cache.get_or_compute("statistics", label, (statistic, freeze_kwargs(kwargs)), compute, network=n)
+
+
+def partition_positions(index: pd.Index, level: str = "country") -> dict[Any, np.ndarray]:
+    """
+    Map every value of an index level to the (sorted) positions of its rows.
+
+    Parameters
+    ----------
+    index : pd.Index
+        Index of a statistics result
+    level : str
+        Name of the level to partition by
+
+    Returns
+    -------
+    dict
+        Positional row index per level value
+    """
+    codes, uniques = pd.factorize(index.get_level_values(level))
+    if not len(uniques):
+        return {}
+    order = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(np.bincount(codes[codes >= 0], minlength=len(uniques)))
+    return dict(zip(uniques, np.split(order[codes[order] >= 0], bounds[:-1]), strict=True))
+
+
+def cached_country_partitions(
+    n: pypsa.Network,
+    label: str,
+    statistic: str,
+    cache: ResultCache,
+    **kwargs: Any,
+) -> dict[Any, np.ndarray]:
+    """
+    Return (or build once) the country → row positions index of a cached statistics result.
+
+    Parameters are the same as for :func:`cached_statistic`; ``kwargs`` must group by country.
+    """
+    return cache.get_or_compute(
+        "statistics",
+        label,
+        (statistic, freeze_kwargs(kwargs), "country-partitions"),
+        lambda: partition_positions(cached_statistic(n, label, statistic, cache, **kwargs).index),
+        network=n,
+    )
+
+
+def select_countries(
+    n: pypsa.Network,
+    label: str,
+    statistic: str,
+    cache: ResultCache,
+    countries: list[str],
+    **kwargs: Any,
+) -> pd.DataFrame | pd.Series:
+    """
+    Restrict a cached statistics result grouped by country to some countries.
+
+    Rows are picked by integer positions from :func:`cached_country_partitions`
+    instead of evaluating a query, so each additional country only adds its own
+    partition.
+
+    Parameters
+    ----------
+    countries : list[str]
+        Countries to keep; the remaining parameters are the same as for :func:`cached_statistic`
+
+    Returns
+    -------
+    pd.DataFrame or pd.Series
+        Rows of the selected countries, in the order of the full result
+    """
+    data = cached_statistic(n, label, statistic, cache, **kwargs)
+    partitions = cached_country_partitions(n, label, statistic, cache, **kwargs)
+    selected = [partitions[country] for country in dict.fromkeys(countries) if country in partitions]
+    positions = np.sort(np.concatenate(selected)) if selected else np.empty(0, dtype=np.intp)
+    return data.iloc[positions]
+
+
+def cached_partial_sums(
+    n: pypsa.Network,
+    label: str,
+    statistic: str,
+    cache: ResultCache,
+    **kwargs: Any,
+) -> PartialSums:
+    """
+    Return (or build once) the per-country and per-carrier partial sums of a cached statistics result.
+
+    Parameters are the same as for :func:`cached_statistic`; ``kwargs`` must group by country and carrier.
+    """
+    return cache.get_or_compute(
+        "statistics",
+        label,
+        (statistic, freeze_kwargs(kwargs), "partial-sums"),
+        lambda: PartialSums.from_series(cached_statistic(n, label, statistic, cache, **kwargs)),
+        network=n,
+    )
+
+
+def chart_statistic(
+    n: pypsa.Network,
+    label: str,
+    statistic: str,
+    cache: ResultCache,
+    countries: list[str] | None = None,
+    **kwargs: Any,
+) -> pd.DataFrame | pd.Series:
+    """
+    Compute (or fetch from cache) a statistics result per carrier, as the dashboard charts plot it.
+
+    Results use nice names and are aggregated across components. With
+    ``countries``, they are also grouped by country and restricted to these
+    countries (see :func:`select_countries`).
+
+    Parameters
+    ----------
+    countries : list[str], optional
+        Countries to restrict the statistics result to
+    **kwargs
+        Further arguments of the statistics method, e.g. ``bus_carrier``; the
+        remaining parameters are the same as for :func:`cached_statistic`
+
+    Returns
+    -------
+    pd.DataFrame or pd.Series
+        Result of the statistics method
+
+    Raises
+    ------
+    ValueError
+        If the result is empty
+    """
+    kwargs = {"nice_names": True, "aggregate_across_components": True, **kwargs}
+    if countries is not None:
+        data = select_countries(n, label, statistic, cache, countries, groupby=["country", "carrier"], **kwargs)
+    else:
+        data = cached_statistic(n, label, statistic, cache, groupby="carrier", **kwargs)
+    if data.empty:
+        raise ValueError(f"The statistics function '{statistic}' returned an empty result.")
+    return data
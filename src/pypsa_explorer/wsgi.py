@@ -0,0 +1,109 @@
+"""
+WSGI entry point for serving PyPSA Explorer with a production server.
+
+The development server started by ``pypsa-explorer`` runs a single process. For
+multi-user deployments, serve the Flask application returned by
+:func:`create_server` with gunicorn in preload mode::
+
+    PYPSA_EXPLORER_NETWORKS="base.nc:Base high_res.nc:HighRES" \\
+        gunicorn --preload --workers 4 --bind 0.0.0.0:8050 "pypsa_explorer.wsgi:create_server()"
+
+With ``--preload`` the factory runs once in the gunicorn master: networks are
+loaded and the statistics and figures of every tab are computed before the
+workers are forked. The workers then share these objects copy-on-write instead
+of each holding a full copy of every scenario. Arguments can also be passed
+directly, e.g. ``"pypsa_explorer.wsgi:create_server('base.nc')"``.
+
+Results computed after the fork are private to the worker that computed them
+unless a shared cache is configured, e.g. ``PYPSA_EXPLORER_CACHE=shm`` for a
+SQLite cache in ``/dev/shm`` or a directory path for a persistent one.
+"""
+
+import gc
+import os
+import shlex
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    import flask
+    import pypsa
+
+from pypsa_explorer.app import create_app
+from pypsa_explorer.utils.network_loader import parse_cli_network_args
+
+# Environment variables read when the corresponding argument is not given
+ENV_NETWORKS = "PYPSA_EXPLORER_NETWORKS"
+ENV_WATCH_DIR = "PYPSA_EXPLORER_WATCH_DIR"
+ENV_TITLE = "PYPSA_EXPLORER_TITLE"
+ENV_CACHE = "PYPSA_EXPLORER_CACHE"
+ENV_CHART_DEADLINE = "PYPSA_EXPLORER_CHART_DEADLINE"
+
+
+def create_server(
+    networks: str | list[str] | None = None,
+    *,
+    title: str | None = None,
+    watch_dir: str | None = None,
+    cache: str | None = None,
+    chart_deadline: float | None = None,
+    preload: bool = True,
+) -> "flask.Flask":
+    """
+    Create the Flask server of a PyPSA Explorer dashboard for a WSGI server.
+
+    Parameters
+    ----------
+    networks : str, list[str], or None
+        Network files in the CLI format ``path`` or ``path:label``. A string may hold
+        several space-separated entries. Defaults to ``$PYPSA_EXPLORER_NETWORKS``.
+    title : str, optional
+        Dashboard title. Defaults to ``$PYPSA_EXPLORER_TITLE`` or "PyPSA Explorer".
+    watch_dir : str, optional
+        Directory to watch for network files. Defaults to ``$PYPSA_EXPLORER_WATCH_DIR``.
+    cache : str, optional
+        Result cache backend shared by the workers, e.g. ``"shm"`` or a directory.
+        Defaults to ``$PYPSA_EXPLORER_CACHE`` or a per-process memory cache.
+    chart_deadline : float, optional
+        Seconds after which chart requests return placeholders for the charts that
+        are not done. Defaults to ``$PYPSA_EXPLORER_CHART_DEADLINE`` or no deadline.
+    preload : bool
+        Precompute statistics and figures of all networks and freeze the loaded
+        objects so forked workers share them copy-on-write (default: True)
+
+    Returns
+    -------
+    flask.Flask
+        The WSGI application
+    """
+    if networks is None:
+        networks = os.environ.get(ENV_NETWORKS)
+    if isinstance(networks, str):
+        networks = shlex.split(networks)
+    watch_dir = watch_dir or os.environ.get(ENV_WATCH_DIR) or None
+    title = title or os.environ.get(ENV_TITLE) or "PyPSA Explorer"
+    cache = cache or os.environ.get(ENV_CACHE) or None
+    if chart_deadline is None and os.environ.get(ENV_CHART_DEADLINE):
+        chart_deadline = float(os.environ[ENV_CHART_DEADLINE])
+
+    networks_input = None
+    if networks:
+        networks_input = cast("dict[str, pypsa.Network | str]", parse_cli_network_args(networks))
+
+    app = create_app(
+        networks_input,
+        title=title,
+        load_default_on_start=networks_input is not None,
+        watch_dir=watch_dir,
+        warm_cache=preload,
+        cache_backend=cache,
+        chart_deadline=chart_deadline,
+    )
+
+    if preload:
+        # Move everything allocated so far into the permanent generation. The garbage
+        # collector then never touches these objects in the workers, so their memory
+        # pages are not copied after the fork.
+        gc.collect()
+        gc.freeze()
+
+    return app.server
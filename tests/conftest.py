@@ -1,9 +1,22 @@
 """Pytest configuration and fixtures for PyPSA Explorer tests."""
 
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
 import pytest
+from dash import no_update
+
+from pypsa_explorer.config import CLIENTSIDE_NAMESPACE
 
 pypsa = pytest.importorskip("pypsa")
 
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "src" / "pypsa_explorer" / "assets"
+
+# Stand-in for ``window.dash_clientside.no_update`` of the Dash renderer
+_NO_UPDATE_MARKER = {"__no_update__": True}
+
 
 @pytest.fixture
 def demo_network():
@@ -45,3 +58,39 @@ def demo_network_path(tmp_path, demo_network):
     network_file = tmp_path / "demo_network.nc"
     demo_network.export_to_netcdf(network_file)
     return str(network_file)
+
+
+@pytest.fixture
+def clientside():
+    """
+    Call a clientside function of ``assets/*.js`` with Node.js.
+
+    Returns a function taking the JavaScript function name (dotted for nested
+    helpers, e.g. ``"figureCache.evictionOrder"``) and its arguments; promises
+    are awaited, lists are returned as tuples and ``no_update`` as
+    ``dash.no_update``, like the results of server-side callbacks. The assets
+    are loaded in name order, as Dash serves them, without IndexedDB.
+    """
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("Node.js is required to run the clientside callbacks")
+    source = "\n".join(path.read_text() for path in sorted(ASSETS_DIR.glob("*.js")))
+
+    def call(function_name, *args):
+        *namespaces, name = [CLIENTSIDE_NAMESPACE, *function_name.split(".")]
+        target = "window.dash_clientside" + "".join(f"[{json.dumps(key)}]" for key in namespaces)
+        script = (
+            f"globalThis.window = {{dash_clientside: {{no_update: {json.dumps(_NO_UPDATE_MARKER)}}}}};\n"
+            f"{source}\n"
+            f"Promise.resolve({target}[{json.dumps(name)}](...{json.dumps(args)}))"
+            ".then((result) => process.stdout.write(JSON.stringify(result === undefined ? null : result)));\n"
+        )
+        completed = subprocess.run([node, "-"], input=script, capture_output=True, text=True, check=True, timeout=30)
+        result = json.loads(completed.stdout)
+        if result == _NO_UPDATE_MARKER:
+            return no_update
+        if isinstance(result, list):
+            return tuple(no_update if value == _NO_UPDATE_MARKER else value for value in result)
+        return result
+
+    return call
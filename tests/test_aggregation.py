@@ -0,0 +1,86 @@
+"""Tests for the incremental country totals."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pypsa_explorer.utils.aggregation import MAX_DELTA_UPDATES, IncrementalTotal, PartialSums, SelectionAggregator
+
+
+@pytest.fixture
+def partials():
+    """Partial sums of a small country × carrier statistics result."""
+    index = pd.MultiIndex.from_tuples(
+        [
+            ("DE", "Wind"),
+            ("DE", "Solar"),
+            ("FR", "Wind"),
+            ("FR", "Nuclear"),
+            ("PL", "Coal"),
+            ("PL", "Wind"),
+            ("PL", "Wind"),
+            (np.nan, "Gas"),
+        ],
+        names=["country", "carrier"],
+    )
+    return PartialSums.from_series(pd.Series([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 0.5, 9.0], index=index))
+
+
+def _expected(partials, countries):
+    return partials.total(countries).sort_index()
+
+
+class TestPartialSums:
+    """Test summing the partial sums of a selection."""
+
+    def test_total(self, partials):
+        """Rows of the same country and carrier are summed, rows without a country are dropped."""
+        assert partials.total(["DE", "PL"]).to_dict() == {"Coal": 5.0, "Solar": 2.0, "Wind": 7.5}
+        assert partials.total(["FR", "XX"]).to_dict() == {"Nuclear": 4.0, "Wind": 3.0}
+        assert partials.total([]).empty
+
+    def test_zero_totals_are_kept(self):
+        """Carriers present in the selection are listed even when they sum to zero."""
+        index = pd.MultiIndex.from_tuples([("DE", "Wind"), ("DE", "Solar")], names=["country", "carrier"])
+        partials = PartialSums.from_series(pd.Series([0.0, 1.0], index=index))
+        assert partials.total(["DE"]).to_dict() == {"Solar": 1.0, "Wind": 0.0}
+
+
+class TestIncrementalTotal:
+    """Test the running totals."""
+
+    def test_updates_match_fresh_totals(self, partials):
+        """Adding and removing countries gives the same totals as summing the selection."""
+        running = IncrementalTotal(partials)
+        for countries in (["DE", "FR"], ["DE", "FR", "PL"], ["DE", "PL"], ["PL"], ["PL", "DE"], [], ["FR"]):
+            pd.testing.assert_series_equal(running.update(countries).sort_index(), _expected(partials, countries))
+
+    def test_small_changes_apply_deltas(self, partials):
+        """Extending a selection by one country updates the total instead of summing afresh."""
+        running = IncrementalTotal(partials)
+        running.update(["DE", "FR"])
+        running.update(["DE", "FR", "PL"])
+        assert running.delta_updates == 1
+        running.update(["PL"])
+        assert running.delta_updates == 0
+
+    def test_totals_are_refreshed_periodically(self, partials):
+        """Running totals are summed afresh after a bounded number of deltas."""
+        running = IncrementalTotal(partials)
+        running.update(["DE", "FR"])
+        for i in range(MAX_DELTA_UPDATES + 1):
+            running.update(["DE", "FR", "PL"] if i % 2 == 0 else ["DE", "FR"])
+        assert running.delta_updates < MAX_DELTA_UPDATES
+
+
+class TestSelectionAggregator:
+    """Test the running totals kept across callbacks."""
+
+    def test_totals_are_kept_per_key(self, partials):
+        """Each key has its own running total and the oldest are dropped."""
+        aggregator = SelectionAggregator(max_entries=2)
+        aggregator.total("a", partials, ["DE"])
+        aggregator.total("b", partials, ["FR"])
+        assert aggregator.total("a", partials, ["DE", "PL"]).to_dict() == {"Coal": 5.0, "Solar": 2.0, "Wind": 7.5}
+        aggregator.total("c", partials, ["PL"])
+        assert len(aggregator) == 2
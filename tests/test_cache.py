@@ -0,0 +1,213 @@
+"""Tests for result cache backends and network fingerprints."""
+
+import os
+import stat
+
+import pypsa
+import pytest
+
+from pypsa_explorer.utils import cache as cache_module
+from pypsa_explorer.utils.cache import (
+    MISSING,
+    DiskCacheBackend,
+    MemoryBackend,
+    ResultCache,
+    SharedMemoryBackend,
+    SQLiteBackend,
+    create_cache_backend,
+)
+from pypsa_explorer.utils.fingerprint import compute_network_fingerprint, network_fingerprint
+
+
+class TestNetworkFingerprint:
+    """Test deterministic network fingerprints."""
+
+    def test_same_file_same_fingerprint(self, demo_network_path):
+        """Loading the same file twice yields the same fingerprint."""
+        first = pypsa.Network(demo_network_path)
+        second = pypsa.Network(demo_network_path)
+        assert first is not second
+        assert network_fingerprint(first) == network_fingerprint(second)
+
+    def test_content_change_changes_fingerprint(self, demo_network):
+        """Modifying component data yields a different fingerprint."""
+        before = compute_network_fingerprint(demo_network)
+        demo_network.generators.loc[demo_network.generators.index[0], "p_nom"] += 1
+        assert compute_network_fingerprint(demo_network) != before
+
+    def test_time_series_change_changes_fingerprint(self, demo_network):
+        """Modifying a time series yields a different fingerprint."""
+        demo_network.generators_t.p_max_pu["gen1"] = 0.5
+        before = compute_network_fingerprint(demo_network)
+        demo_network.generators_t.p_max_pu.iloc[0, 0] = 0.6
+        assert compute_network_fingerprint(demo_network) != before
+
+    def test_registry_exposes_fingerprint(self, demo_network):
+        """The network registry lists the fingerprint of every loaded network."""
+        from dash import dcc
+
+        from pypsa_explorer.app import create_app
+
+        app = create_app({"Test": demo_network})
+        store = next(
+            component
+            for component in app.layout._traverse()
+            if isinstance(component, dcc.Store) and component.id == "network-registry"
+        )
+        assert store.data["info"]["Test"]["fingerprint"] == network_fingerprint(demo_network)
+
+
+class TestCacheBackends:
+    """Test the storage backends."""
+
+    @pytest.fixture(params=["memory", "sqlite"])
+    def backend(self, request, tmp_path):
+        """Memory and SQLite backends."""
+        if request.param == "memory":
+            return MemoryBackend()
+        return SQLiteBackend(tmp_path / "cache.sqlite")
+
+    def test_roundtrip_and_delete_prefix(self, backend):
+        """Values can be stored, read back and deleted by prefix."""
+        backend.set("figures:a:1", {"data": [1, 2]})
+        backend.set("figures:a:2", "two")
+        backend.set("figures:b:1", "other")
+
+        assert backend.get("figures:a:1") == {"data": [1, 2]}
+        assert backend.get("missing") is None
+        assert backend.delete_prefix("figures:a:") == 2
+        assert len(backend) == 1
+
+    def test_delete_prefix_is_literal(self, backend):
+        """Wildcard characters of labels in prefixes match only themselves."""
+        backend.set("figures:label-a_b:1", 1)
+        backend.set("figures:label-axb:1", 2)
+        backend.set("figures:label-a%:1", 3)
+        assert backend.delete_prefix("figures:label-a_b:") == 1
+        assert backend.delete_prefix("figures:label-a%:") == 1
+        assert backend.get("figures:label-axb:1") == 2
+
+    def test_stored_none_is_a_hit(self, backend):
+        """A stored ``None`` is distinguished from an unknown key."""
+        backend.set("statistics:a:1", None)
+        assert backend.get("statistics:a:1", MISSING) is None
+        assert backend.get("statistics:a:2", MISSING) is MISSING
+
+    def test_sqlite_eviction(self, tmp_path):
+        """The SQLite backend evicts the least recently used entries beyond ``max_entries``."""
+        backend = SQLiteBackend(tmp_path / "cache.sqlite", max_entries=2, touch_interval=0, evict_interval=1)
+        backend.set("k0", 0)
+        backend.set("k1", 1)
+        assert backend.get("k0") == 0
+        backend.set("k2", 2)
+        assert len(backend) == 2
+        assert backend.get("k1") is None
+        assert backend.get("k0") == 0
+
+    def test_sqlite_eviction_is_periodic(self, tmp_path):
+        """Entries are counted and evicted every ``evict_interval`` inserts, not on every insert."""
+        backend = SQLiteBackend(tmp_path / "cache.sqlite", max_entries=2, evict_interval=4)
+        for i in range(3):
+            backend.set(f"k{i}", i)
+        assert len(backend) == 3
+        backend.set("k3", 3)
+        assert len(backend) == 2
+
+    def test_sqlite_reads_do_not_write(self, tmp_path):
+        """Access times are collected in memory instead of being written on every read."""
+        backend = SQLiteBackend(tmp_path / "cache.sqlite")
+        backend.set("k", 1)
+        conn = backend._connect()
+        changes = conn.total_changes
+        for _ in range(10):
+            assert backend.get("k") == 1
+        assert conn.total_changes == changes
+
+    def test_diskcache_backend(self, tmp_path):
+        """The diskcache backend stores values when the package is installed."""
+        pytest.importorskip("diskcache")
+        backend = DiskCacheBackend(tmp_path / "dc")
+        backend.set("maps:a:1", "<html>")
+        assert backend.get("maps:a:1") == "<html>"
+        assert backend.delete_prefix("maps:a:") == 1
+
+    def test_create_cache_backend(self, tmp_path):
+        """Specifications map to the matching backend."""
+        assert isinstance(create_cache_backend(None), MemoryBackend)
+        assert isinstance(create_cache_backend("memory"), MemoryBackend)
+        backend = create_cache_backend(str(tmp_path / "cache"))
+        assert isinstance(backend, SQLiteBackend)
+        assert backend.path == tmp_path / "cache" / "results.sqlite"
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership is required")
+class TestSharedMemoryBackend:
+    """Test the placement of the shared-memory database."""
+
+    def test_private_directory(self, tmp_path, monkeypatch):
+        """The database lives in a directory of the current user that others cannot access."""
+        monkeypatch.setattr(cache_module, "SHARED_MEMORY_DIR", tmp_path)
+        backend = SharedMemoryBackend()
+        directory = backend.path.parent
+        assert directory == tmp_path / f"pypsa-explorer-{os.getuid()}"
+        assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+        backend.set("k", 1)
+        assert SharedMemoryBackend().get("k") == 1
+
+    def test_refuses_accessible_directory(self, tmp_path, monkeypatch):
+        """A directory others can write to, e.g. created by another user beforehand, is refused."""
+        monkeypatch.setattr(cache_module, "SHARED_MEMORY_DIR", tmp_path)
+        directory = tmp_path / f"pypsa-explorer-{os.getuid()}"
+        directory.mkdir()
+        directory.chmod(0o777)
+        with pytest.raises(PermissionError):
+            SharedMemoryBackend()
+
+    def test_refuses_writable_database(self, tmp_path, monkeypatch):
+        """A database file others can write to is refused."""
+        monkeypatch.setattr(cache_module, "SHARED_MEMORY_DIR", tmp_path)
+        database = SharedMemoryBackend().path
+        database.chmod(0o666)
+        with pytest.raises(PermissionError):
+            SharedMemoryBackend()
+
+
+class TestSharedResultCache:
+    """Test sharing results between processes through a common backend."""
+
+    def test_results_shared_across_caches(self, tmp_path, demo_network_path):
+        """A result computed by one worker is served to another holding the same network."""
+        worker_a = ResultCache(SQLiteBackend(tmp_path / "cache.sqlite"))
+        worker_b = ResultCache(SQLiteBackend(tmp_path / "cache.sqlite"))
+        network_a = pypsa.Network(demo_network_path)
+        network_b = pypsa.Network(demo_network_path)
+
+        worker_a.set("figures", "Base", ("chart",), {"data": []}, network=network_a)
+
+        def fail():
+            raise AssertionError("should be served from the shared cache")
+
+        # Keys depend on the network content, not on the label it is shown under
+        assert worker_b.get_or_compute("figures", "Renamed", ("chart",), fail, network=network_b) == {"data": []}
+
+    def test_cached_none_is_not_recomputed(self):
+        """Results that are ``None`` are served from the cache like any other value."""
+        cache = ResultCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+
+        assert cache.get_or_compute("statistics", "A", ("empty",), compute) is None
+        assert cache.get_or_compute("statistics", "A", ("empty",), compute) is None
+        assert len(calls) == 1
+
+    def test_invalidate_keeps_content_addressed_entries(self, demo_network):
+        """Invalidating a label keeps fingerprinted entries, which other labels of the same network share."""
+        cache = ResultCache()
+        cache.set("figures", "A", ("chart",), 1, network=demo_network)
+        cache.set("figures", "A", ("label",), 2)
+
+        assert cache.invalidate("A") == 1
+        assert cache.get("figures", "A", ("label",)) is None
+        assert cache.get("figures", "B", ("chart",), network=demo_network) == 1
@@ -1,5 +1,7 @@
 """Tests for command-line interface."""
 
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -230,3 +232,51 @@ def test_cli_wrapper():
     with patch("pypsa_explorer.cli.app") as mock_app:
         cli()
         mock_app.assert_called_once()
+
+
+@patch("pypsa_explorer.cli.run_dashboard")
+def test_cli_profile_dir(mock_run, tmp_path):
+    """Test CLI with a profiling output directory."""
+    result = runner.invoke(app, ["--profile", str(tmp_path)])
+
+    assert mock_run.call_args.kwargs["profile_dir"] == str(tmp_path)
+    assert result.exit_code == 0
+
+
+@patch("pypsa_explorer.cli.run_dashboard")
+def test_cli_chart_deadline(mock_run):
+    """Test CLI with a chart deadline."""
+    result = runner.invoke(app, ["--chart-deadline", "2.5"])
+
+    assert mock_run.call_args.kwargs["chart_deadline"] == 2.5
+    assert result.exit_code == 0
+
+
+@patch("pypsa_explorer.cli.run_dashboard")
+def test_cli_network_named_like_command(mock_run):
+    """Network files named like a command are opened through the explicit ``serve`` command."""
+    result = runner.invoke(app, ["serve", "export", "--no-debug"])
+
+    assert result.exit_code == 0
+    assert mock_run.call_args.kwargs["networks_input"] == {"export": "export"}
+    assert mock_run.call_args.kwargs["debug"] is False
+
+
+def test_cli_import_is_lightweight():
+    """Importing the CLI does not load the dashboard stack."""
+    code = (
+        "import sys, pypsa_explorer.cli; "
+        "print(sorted(m for m in ('dash', 'pypsa', 'matplotlib', 'folium', 'pandas') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_package_attributes_load_lazily():
+    """Public names of the package are still importable."""
+    import pypsa_explorer
+
+    assert callable(pypsa_explorer.create_app)
+    assert callable(pypsa_explorer.load_networks)
+    with pytest.raises(AttributeError):
+        pypsa_explorer.missing_attribute  # noqa: B018
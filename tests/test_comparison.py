@@ -0,0 +1,149 @@
+"""Tests for the scenario comparison tab."""
+
+from unittest.mock import patch
+
+import dash
+import pytest
+
+from pypsa_explorer.app import create_app
+from pypsa_explorer.callbacks.comparison import build_comparison_figure
+from pypsa_explorer.config import setup_plotly_theme
+from pypsa_explorer.utils.aggregation import SelectionAggregator
+from pypsa_explorer.utils.cache import ResultCache
+from pypsa_explorer.utils.comparison import compare_scenarios, scenario_deltas
+
+
+@pytest.fixture
+def scenarios(demo_network):
+    """Three scenarios of the demo network with different optimal capacities."""
+    networks = {}
+    for i, label in enumerate(["Base", "High", "Low"]):
+        n = demo_network.copy()
+        n.generators["p_nom_opt"] = n.generators.p_nom * (1 + i)
+        networks[label] = n
+    return networks
+
+
+def _callback(app, name):
+    return next(
+        entry["callback"].__wrapped__
+        for entry in app.callback_map.values()
+        if "callback" in entry and entry["callback"].__wrapped__.__name__ == name
+    )
+
+
+class TestCompareScenarios:
+    """Test the batched scenario × carrier matrix."""
+
+    def test_matrix_is_aligned(self, scenarios):
+        """Rows follow the requested scenarios and columns cover the carriers of all of them."""
+        matrix = compare_scenarios(scenarios, ["Low", "Base", "High"], "capacity", cache=ResultCache())
+        assert matrix.index.tolist() == ["Low", "Base", "High"]
+        assert matrix.loc["Base", "Wind"] == pytest.approx(100)
+        assert matrix.loc["High", "Solar"] == pytest.approx(100)
+        assert matrix.loc["Low", "Wind"] == pytest.approx(300)
+
+    def test_country_filter(self, scenarios):
+        """Only the selected countries are summed."""
+        matrix = compare_scenarios(scenarios, ["Base", "High"], "capacity", countries=["DE"], cache=ResultCache())
+        assert matrix.loc["Base"].to_dict() == {"Wind": pytest.approx(100)}
+
+    def test_country_selection_changes(self, scenarios):
+        """Running totals follow countries being added and removed."""
+        cache, aggregator = ResultCache(), SelectionAggregator()
+        for countries in (["DE"], ["DE", "FR"], ["FR"], ["DE"]):
+            running = compare_scenarios(
+                scenarios, ["Base", "High"], "capacity", countries=countries, cache=cache, aggregator=aggregator
+            )
+            fresh = compare_scenarios(scenarios, ["Base", "High"], "capacity", countries=countries, cache=ResultCache())
+            assert running.equals(fresh)
+
+    def test_sessions_keep_their_own_running_totals(self, scenarios):
+        """Sessions alternating between selections update their own running totals instead of one shared total."""
+        cache, aggregator = ResultCache(), SelectionAggregator()
+        for countries, session in ((["DE"], "a"), (["FR"], "b"), (["DE", "FR"], "a"), (["FR", "DE"], "b")):
+            running = compare_scenarios(
+                scenarios, ["Base"], "capacity", countries=countries, cache=cache, aggregator=aggregator, session=session
+            )
+            fresh = compare_scenarios(scenarios, ["Base"], "capacity", countries=countries, cache=ResultCache())
+            assert running.equals(fresh)
+        assert len(aggregator) == 2
+        # Each session extended its own selection by one country, a delta update
+        assert all(running.delta_updates == 1 for running in aggregator._totals.values())
+
+    def test_statistics_are_cached(self, scenarios):
+        """A repeated comparison reuses the statistics computed per network."""
+        cache = ResultCache()
+        compare_scenarios(scenarios, list(scenarios), "capacity", cache=cache)
+        entries = len(cache)
+        compare_scenarios(scenarios, list(scenarios), "capacity", cache=cache, max_workers=1)
+        assert len(cache) == entries == len(scenarios)
+
+    def test_deltas(self, scenarios):
+        """Deltas subtract the reference row and drop it."""
+        matrix = compare_scenarios(scenarios, list(scenarios), "capacity", cache=ResultCache())
+        deltas = scenario_deltas(matrix, "Base")
+        assert deltas.index.tolist() == ["High", "Low"]
+        assert deltas.loc["Low", "Wind"] == pytest.approx(200)
+
+    def test_figure_has_one_trace_per_carrier(self, scenarios):
+        """Grouped bars show one trace per carrier with the carrier colors."""
+        setup_plotly_theme()
+        matrix = compare_scenarios(scenarios, list(scenarios), "capacity", cache=ResultCache())
+        figure = build_comparison_figure(matrix, "capacity", reference="Base", colors={"Wind": "#74c6f2"})
+        assert {trace["name"] for trace in figure["data"]} == {"Wind", "Solar"}
+        assert figure["layout"]["barmode"] == "group"
+        assert "Difference to Base" in figure["layout"]["title"]["text"]
+
+
+class TestComparisonCallbacks:
+    """Test the comparison tab callbacks."""
+
+    def test_scenarios_follow_registry(self, scenarios):
+        """Every registered network is offered and selected by default."""
+        app = create_app(scenarios)
+        sync = _callback(app, "sync_comparison_scenarios")
+        assert sync({"order": ["Base", "High"]}, None) == (["Base", "High"], ["Base", "High"])
+        assert sync({"order": ["Base", "High"]}, ["High", "Removed"]) == (["Base", "High"], ["High"])
+
+    def test_chart_is_rendered(self, scenarios):
+        """The active comparison tab renders one chart; fewer than two scenarios ask for a selection."""
+        app = create_app(scenarios)
+        update = _callback(app, "update_comparison_chart")
+        args = ("capacity", "totals", None, ["AC"], "All", [], "comparison", False)
+
+        (graph,) = update(list(scenarios), *args)
+        assert len(graph.figure["data"]) == 2
+
+        (message,) = update(["Base"], *args)
+        assert "Select Scenarios" in str(message)
+
+    def test_inactive_tab_computes_nothing(self, scenarios):
+        """Switching to another tab leaves the comparison chart alone instead of computing it."""
+        app = create_app(scenarios)
+        update = _callback(app, "update_comparison_chart")
+
+        with patch("pypsa_explorer.callbacks.comparison.compare_scenarios") as compare:
+            result = update(list(scenarios), "capacity", "totals", None, ["AC"], "All", [], "capacity", False)
+        assert result is dash.no_update
+        compare.assert_not_called()
+
+    def test_running_totals_follow_the_browser_session(self, scenarios):
+        """The session of the page's chart requests scopes the running country totals."""
+        app = create_app(scenarios)
+        update = _callback(app, "update_comparison_chart")
+        args = ("capacity", "totals", None, ["AC"], "Specific", ["DE"], "comparison", False)
+
+        with patch("pypsa_explorer.callbacks.comparison.compare_scenarios", wraps=compare_scenarios) as compare:
+            update(list(scenarios), *args, {"session": "page", "sequence": 3})
+            update(list(scenarios), *args, None)
+        assert [call.kwargs["session"] for call in compare.call_args_list] == ["page", None]
+
+    def test_two_scenario_difference_lists_asset_changes(self, scenarios):
+        """The difference of two scenarios is followed by a table of the largest asset changes."""
+        app = create_app(scenarios)
+        update = _callback(app, "update_comparison_chart")
+
+        graph, table = update(["Base", "Low"], "capacity", "delta", "Base", ["AC"], "All", [], "comparison", False)
+        assert "Largest Asset Changes: Low vs. Base" in str(table)
+        assert "gen1" in str(table)
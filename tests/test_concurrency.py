@@ -0,0 +1,192 @@
+"""Tests for request coalescing and other concurrency helpers."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pypsa_explorer.utils.cache import ResultCache
+from pypsa_explorer.utils.concurrency import (
+    Cancelled,
+    CancelToken,
+    DeadlineExceeded,
+    LatestWins,
+    SingleFlight,
+    cancellation_scope,
+    checkpoint,
+)
+from pypsa_explorer.utils.statistics import cached_statistic
+
+
+def _run_concurrently(fn, n_threads=8):
+    """Start ``fn`` in several threads at the same moment and collect the results."""
+    barrier = threading.Barrier(n_threads)
+
+    def task():
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(n_threads) as pool:
+        futures = [pool.submit(task) for _ in range(n_threads)]
+        return [future.result() for future in futures]
+
+
+class TestSingleFlight:
+    """Test coalescing of identical concurrent computations."""
+
+    def test_concurrent_calls_share_one_computation(self):
+        """Simultaneous calls with the same key run the computation once."""
+        flights = SingleFlight()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return object()
+
+        results = _run_concurrently(lambda: flights.do("key", compute))
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert len(flights) == 0
+
+    def test_errors_propagate_to_waiters(self):
+        """All coalesced callers see the exception of the shared computation."""
+        flights = SingleFlight()
+
+        def compute():
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        def call():
+            with pytest.raises(ValueError, match="boom"):
+                flights.do("key", compute)
+            return True
+
+        assert all(_run_concurrently(call, n_threads=4))
+
+    def test_waiters_retry_cancelled_computation(self):
+        """A computation cancelled for the first caller's superseded request is run again for a waiting one."""
+        flights = SingleFlight()
+        started = threading.Event()
+        calls = []
+
+        def cancelled():
+            calls.append("cancelled")
+            started.set()
+            time.sleep(0.1)
+            raise Cancelled
+
+        def leader():
+            with pytest.raises(Cancelled):
+                flights.do("key", cancelled)
+
+        with ThreadPoolExecutor(2) as pool:
+            first = pool.submit(leader)
+            started.wait()
+            second = pool.submit(flights.do, "key", lambda: calls.append("computed") or 42)
+            first.result()
+            assert second.result() == 42
+        assert calls == ["cancelled", "computed"]
+
+    def test_waiters_stop_at_their_deadline(self):
+        """A caller with a deadline does not wait past it for a computation of another thread."""
+        flights = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def slow():
+            started.set()
+            release.wait()
+            return 1
+
+        with ThreadPoolExecutor(1) as pool:
+            leader = pool.submit(flights.do, "key", slow)
+            started.wait()
+            with pytest.raises(DeadlineExceeded), cancellation_scope(CancelToken(timeout=0.1)):
+                flights.do("key", slow)
+            release.set()
+            assert leader.result() == 1
+
+    def test_different_keys_run_independently(self):
+        """Calls with different keys are not coalesced."""
+        flights = SingleFlight()
+        assert flights.do("a", lambda: 1) == 1
+        assert flights.do("b", lambda: 2) == 2
+
+
+class TestLatestWins:
+    """Test cancellation of superseded requests of a session."""
+
+    def test_newer_request_cancels_older_at_checkpoint(self):
+        """Work of an older request stops at its next checkpoint once a newer request of the session starts."""
+        latest = LatestWins()
+        with latest.run("session", 1) as token:
+            checkpoint()
+            latest.begin("other", 5)
+            checkpoint()
+            latest.begin("session", 2)
+            assert token.cancelled
+            with pytest.raises(Cancelled):
+                checkpoint()
+
+    def test_late_request_is_cancelled_right_away(self):
+        """A request arriving after a newer one of its session started does not run."""
+        latest = LatestWins()
+        latest.begin("session", 3)
+        with pytest.raises(Cancelled), latest.run("session", 2):
+            pytest.fail("superseded request ran")
+
+    def test_checkpoint_outside_requests_is_noop(self):
+        """Without a running request, checkpoints never raise."""
+        latest = LatestWins()
+        with latest.run("session", 1):
+            pass
+        latest.begin("session", 2)
+        checkpoint()
+
+    def test_deadline_stops_work_at_checkpoint(self):
+        """Past the deadline, checkpoints raise; entering the scope does not."""
+        with cancellation_scope(CancelToken(timeout=0)) as token:
+            assert token.expired
+            with pytest.raises(DeadlineExceeded):
+                checkpoint()
+        with LatestWins().run("session", 1, timeout=60):
+            checkpoint()
+
+    def test_sessions_are_bounded(self):
+        """Only the most recently active sessions are remembered."""
+        latest = LatestWins(max_sessions=2)
+        for session in ("a", "b", "c"):
+            latest.begin(session, 1)
+        assert len(latest) == 2
+        # The forgotten session starts afresh
+        assert not latest.begin("a", 0).cancelled
+
+
+def test_result_cache_coalesces_misses(demo_network):
+    """Concurrent cache misses for the same chart compute it once."""
+    cache = ResultCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"data": []}
+
+    results = _run_concurrently(
+        lambda: cache.get_or_compute("figures", "Base", ("energy_balance",), compute, network=demo_network)
+    )
+    assert len(calls) == 1
+    assert results == [{"data": []}] * len(results)
+
+
+def test_cached_statistics_are_served_past_the_deadline(demo_network):
+    """Past the deadline, cached statistics are still returned; only computations stop."""
+    cache = ResultCache()
+    expected = cached_statistic(demo_network, "Demo", "installed_capacity", cache, groupby="carrier")
+
+    with cancellation_scope(CancelToken(timeout=0)):
+        result = cached_statistic(demo_network, "Demo", "installed_capacity", cache, groupby="carrier")
+        with pytest.raises(DeadlineExceeded):
+            cached_statistic(demo_network, "Demo", "supply", cache, groupby="carrier")
+    assert result is expected
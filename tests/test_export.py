@@ -0,0 +1,121 @@
+"""Tests for the static report export."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from pypsa_explorer.export import RenderJob, bundle_map_assets, export_report, plan_jobs, render_job
+
+
+@pytest.fixture(autouse=True)
+def offline_map_assets(monkeypatch):
+    """Keep the tests from downloading the map libraries."""
+
+    def fetch(url):
+        raise OSError("offline")
+
+    monkeypatch.setattr("pypsa_explorer.export._fetch_asset", fetch)
+
+
+class TestExportReport:
+    """Test rendering networks into a report bundle."""
+
+    def test_plan_covers_every_tab(self, demo_network_path):
+        """Every tab is planned, per bus carrier where the dashboard has a carrier filter."""
+        jobs = plan_jobs({"Demo": demo_network_path})
+        assert [(job.tab, job.carrier) for job in jobs] == [
+            ("energy-balance", "AC"),
+            ("energy-balance-aggregated", "AC"),
+            ("capacity", "AC"),
+            ("capex", None),
+            ("opex", None),
+            ("map", None),
+        ]
+
+    def test_bundle_contents(self, demo_network_path, tmp_path):
+        """The bundle holds an index, one page per network, figure JSON and a manifest."""
+        index = export_report({"Demo": demo_network_path}, tmp_path / "report", workers=1)
+
+        report = tmp_path / "report"
+        assert index == report / "index.html"
+        assert 'href="Demo/index.html"' in index.read_text()
+        assert (report / "plotly.min.js").stat().st_size > 0
+
+        manifest = json.loads((report / "report.json").read_text())
+        charts = manifest["networks"]["Demo"]["charts"]
+        assert len(charts) == 6
+        for chart in charts:
+            if "error" not in chart:
+                assert (report / chart["file"]).is_file()
+
+        figure = json.loads((report / "Demo" / "figures" / "energy-balance-AC.json").read_text())
+        assert "data" in figure and "layout" in figure
+        page = (report / "Demo" / "index.html").read_text()
+        assert '<script src="../plotly.min.js"></script>' in page
+        assert "Energy Balance Timeseries" in page
+
+    def test_errors_are_reported_not_raised(self, demo_network_path, tmp_path):
+        """A chart that cannot be built carries its error instead of aborting the export."""
+        # The demo network is not solved, so it has no optimal capacities
+        result = render_job(RenderJob("Demo", demo_network_path, "capacity", carrier="AC"))
+        assert result.error is not None
+        assert result.figure_json is None
+
+        export_report({"Demo": demo_network_path}, tmp_path, carriers=["AC"], workers=1)
+        manifest = json.loads((tmp_path / "report.json").read_text())
+        assert "error" in next(c for c in manifest["networks"]["Demo"]["charts"] if c["tab"] == "capacity")
+        assert 'class="error"' in (tmp_path / "Demo" / "index.html").read_text()
+        assert "charts failed" in (tmp_path / "index.html").read_text()
+
+    def test_colliding_labels_get_their_own_directory(self, demo_network_path, tmp_path):
+        """Labels with the same slug are exported to numbered directories instead of overwriting each other."""
+        export_report({"Base run": demo_network_path, "Base/run": demo_network_path}, tmp_path, carriers=["AC"], workers=1)
+
+        manifest = json.loads((tmp_path / "report.json").read_text())
+        assert manifest["networks"]["Base run"]["page"] == "Base_run/index.html"
+        assert manifest["networks"]["Base/run"]["page"] == "Base_run-2/index.html"
+        assert "<h1>Base/run</h1>" in (tmp_path / "Base_run-2" / "index.html").read_text()
+
+    @patch("pypsa_explorer.export._fetch_asset")
+    def test_map_assets_are_bundled(self, mock_fetch, tmp_path):
+        """The map document is unwrapped and its remote scripts and stylesheets are downloaded once."""
+        mock_fetch.return_value = b"/* asset */"
+        fragment = (
+            '<div><iframe srcdoc="&lt;script src=&quot;https://cdn.example.com/lib/leaflet.js&quot;&gt;&lt;/script&gt;'
+            '&lt;link rel=&quot;stylesheet&quot; href=&quot;https://cdn.example.com/lib/leaflet.css&quot;/&gt;"></iframe></div>'
+        )
+        assets: dict[str, str | None] = {}
+        page = bundle_map_assets(fragment, tmp_path, assets)
+        bundle_map_assets(fragment, tmp_path, assets)
+
+        assert "https://" not in page and "iframe" not in page
+        assert mock_fetch.call_count == 2
+        for path in assets.values():
+            assert path is not None
+            assert f'"../{path}"' in page
+            assert (tmp_path / path).read_bytes() == b"/* asset */"
+
+    @patch("pypsa_explorer.export._fetch_asset", side_effect=OSError("offline"))
+    def test_map_assets_fall_back_to_remote(self, mock_fetch, tmp_path):
+        """Assets that cannot be downloaded are still loaded from their remote URL."""
+        page = bundle_map_assets('<script src="https://cdn.example.com/leaflet.js"></script>', tmp_path, {})
+        assert page == '<script src="https://cdn.example.com/leaflet.js"></script>'
+
+
+@patch("pypsa_explorer.export.export_report")
+def test_cli_export_subcommand(mock_export, tmp_path, monkeypatch):
+    """``pypsa-explorer export`` is dispatched to the export command."""
+    from pypsa_explorer.cli import cli
+
+    mock_export.return_value = tmp_path / "index.html"
+    monkeypatch.setattr("sys.argv", ["pypsa-explorer", "export", "a.nc:A", "--out", str(tmp_path), "-c", "AC", "-j", "2"])
+    with patch("pypsa_explorer.cli.run_dashboard") as mock_run, pytest.raises(SystemExit) as exit_info:
+        cli()
+    assert exit_info.value.code == 0
+    mock_run.assert_not_called()
+
+    args, kwargs = mock_export.call_args
+    assert args == ({"A": "a.nc"}, str(tmp_path))
+    assert kwargs["carriers"] == ["AC"]
+    assert kwargs["workers"] == 2
@@ -0,0 +1,146 @@
+"""Tests for the browser cache of rendered chart tabs (``assets/figure_cache.js``)."""
+
+import pytest
+from dash import no_update
+
+from pypsa_explorer import __version__
+from pypsa_explorer.config import CARRIER_CHART_TABS, CHART_TAB_CONTAINERS
+
+CONFIG = {
+    "version": __version__,
+    "maxBytes": 1024,
+    "tabs": list(CHART_TAB_CONTAINERS),
+    "carrierTabs": list(CARRIER_CHART_TABS),
+}
+
+REGISTRY = {
+    "order": ["Base", "Watched"],
+    "info": {"Base": {"fingerprint": "abc"}, "Watched": {"source": "/data/watched.nc", "mtime": 1.5}},
+}
+
+
+def _request(tab="capacity", network="Base", carriers=("AC", "H2"), country_mode="All", countries=(), dark=False):
+    return {
+        "tab": tab,
+        "network": network,
+        "carriers": list(carriers),
+        "country_mode": country_mode,
+        "countries": list(countries),
+        "dark": dark,
+    }
+
+
+def test_cache_key_identifies_network_version_view_filters_and_theme(clientside):
+    """Keys ignore the carrier order and change with the network version, view, filters and theme."""
+    key = clientside("figureCache.chartCacheKey", _request(), REGISTRY, CONFIG)
+    assert key == clientside("figureCache.chartCacheKey", _request(carriers=["H2", "AC", "AC"]), REGISTRY, CONFIG)
+    others = [
+        _request(tab="energy-balance"),
+        _request(dark=True),
+        _request(carriers=["AC"]),
+        _request(country_mode="Specific", countries=["DE"]),
+    ]
+    keys = {clientside("figureCache.chartCacheKey", request, REGISTRY, CONFIG) for request in others}
+    assert len(keys | {key}) == 5
+
+    modified = {**REGISTRY, "info": {"Base": {"fingerprint": "def"}}}
+    assert clientside("figureCache.chartCacheKey", _request(), modified, CONFIG) != key
+    # Watched networks are versioned by their file until they are fingerprinted
+    assert "/data/watched.nc@1.5" in clientside("figureCache.chartCacheKey", _request(network="Watched"), REGISTRY, CONFIG)
+    # Expenditure charts do not depend on the carriers
+    assert clientside("figureCache.chartCacheKey", _request(tab="capex"), REGISTRY, CONFIG) == clientside(
+        "figureCache.chartCacheKey", _request(tab="capex", carriers=[]), REGISTRY, CONFIG
+    )
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        _request(network="Unknown"),
+        _request(carriers=[]),
+        _request(country_mode="Specific", countries=[]),
+    ],
+    ids=["unknown-network", "no-carriers", "no-countries"],
+)
+def test_messages_are_not_cached(clientside, request_):
+    """Requests the server answers with a message have no cache key."""
+    assert clientside("figureCache.chartCacheKey", request_, REGISTRY, CONFIG) is None
+
+
+def test_renders_request(clientside):
+    """A render state matches requests for the same network, filters, theme and set of carriers."""
+    state = {"key": ["Base", "abc", "All", None, False], "carriers": ["H2", "AC"]}
+    assert clientside("figureCache.rendersRequest", state, _request(), CONFIG) is True
+    assert clientside("figureCache.rendersRequest", state, _request(carriers=["AC"]), CONFIG) is False
+    assert clientside("figureCache.rendersRequest", state, _request(dark=True), CONFIG) is False
+    assert clientside("figureCache.rendersRequest", {**state, "partial": True}, _request(), CONFIG) is False
+    assert clientside("figureCache.rendersRequest", None, _request(), CONFIG) is False
+
+
+def test_eviction_is_least_recently_used_within_budget(clientside):
+    """The least recently used entries are evicted until the rest fits the budget."""
+    entries = [
+        {"key": "new", "size": 400, "accessed": 3},
+        {"key": "old", "size": 400, "accessed": 1},
+        {"key": "mid", "size": 400, "accessed": 2},
+    ]
+    assert clientside("figureCache.evictionOrder", entries, 1000) == ("old",)
+    assert clientside("figureCache.evictionOrder", entries, 400) == ("old", "mid")
+    assert clientside("figureCache.evictionOrder", entries, 1200) == ()
+
+
+def test_estimated_size_grows_with_payload(clientside):
+    """Sizes are estimated from the stored structure."""
+    small = clientside("figureCache.estimateSize", {"children": [{"props": {"figure": {"data": []}}}]})
+    large = clientside("figureCache.estimateSize", {"children": [{"props": {"figure": {"data": ["x" * 1000]}}}]})
+    assert large - small >= 2000
+
+
+class TestLookupCharts:
+    """Test the lookup run before a chart tab is requested from the server."""
+
+    def _lookup(self, clientside, request, rendered=None, config=CONFIG):
+        return clientside(
+            "lookupCharts",
+            request["carriers"],
+            request["country_mode"],
+            request["countries"],
+            request["network"],
+            request["tab"],
+            request["dark"],
+            REGISTRY,
+            rendered or {},
+            config,
+        )
+
+    def _sent(self, outputs):
+        """The server request of the outputs, without the session and sequence number."""
+        return {key: value for key, value in outputs[-1].items() if key not in ("session", "sequence")}
+
+    def test_miss_requests_charts_from_server(self, clientside):
+        """Without a cached entry (or IndexedDB), the server is asked to render the tab."""
+        outputs = self._lookup(clientside, _request())
+        assert outputs[:-1] == (no_update,) * (len(CHART_TAB_CONTAINERS) + 1)
+        assert self._sent(outputs) == _request()
+        # Requests are numbered per page, so the server renders only the latest one
+        assert isinstance(outputs[-1]["session"], str) and outputs[-1]["session"]
+        assert outputs[-1]["sequence"] == 1
+
+    def test_current_tab_is_left_alone(self, clientside):
+        """Activating a tab that shows the requested charts of the current network version sends nothing."""
+        rendered = {"capacity": {"key": ["Base", "abc", "All", None, False], "carriers": ["AC", "H2"]}}
+        assert self._lookup(clientside, _request(), rendered) == (no_update,) * (len(CHART_TAB_CONTAINERS) + 2)
+
+        stale = {"capacity": {"key": ["Base", "old", "All", None, False], "carriers": ["AC", "H2"]}}
+        assert self._sent(self._lookup(clientside, _request(), stale)) == _request()
+
+    def test_other_tabs_are_ignored(self, clientside):
+        """Tabs without charts neither look up nor request anything."""
+        outputs = self._lookup(clientside, _request(tab="network-config"))
+        assert outputs == (no_update,) * (len(CHART_TAB_CONTAINERS) + 2)
+
+
+def test_store_without_request_is_noop(clientside):
+    """Render state changes without a pending request store nothing."""
+    children = [None] * len(CHART_TAB_CONTAINERS)
+    assert clientside("storeCharts", {}, None, REGISTRY, CONFIG, *children) is no_update
@@ -0,0 +1,127 @@
+"""Tests for the plain figure dictionaries of the dashboard charts."""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from pypsa_explorer.config import PLOTLY_TEMPLATE_NAME, setup_plotly_theme
+from pypsa_explorer.utils.figures import (
+    carrier_color_map,
+    facet_layout,
+    grouped_bar_figure,
+    horizontal_bar_figure,
+    stacked_area_figure,
+    template_data,
+)
+
+
+@pytest.fixture(autouse=True)
+def plotly_theme():
+    """Register the dashboard's Plotly templates."""
+    setup_plotly_theme()
+
+
+@pytest.fixture
+def balance():
+    """Energy balance time series per country and carrier."""
+    index = pd.MultiIndex.from_tuples(
+        [("DE", "Wind"), ("DE", "Load"), ("DE", "Storage"), ("FR", "Wind"), ("FR", "Zero")], names=["country", "carrier"]
+    )
+    snapshots = pd.date_range("2030-01-01", periods=3, freq="h")
+    data = pd.DataFrame(
+        [[1.0, 2.0, 3.0], [-1.0, -2.0, -2.0], [0.5, -0.5, np.nan], [4.0, 0.0, 1.0], [0.0, 0.0, 0.0]],
+        index=index,
+        columns=snapshots,
+    )
+    data.attrs = {"name": "Energy Balance", "unit": "MWh"}
+    return data
+
+
+def test_figures_are_valid_plotly_figures(balance):
+    """The figure dictionaries pass Plotly's validation unchanged."""
+    totals = balance.sum(axis=1)
+    totals.attrs = balance.attrs
+    for figure in (
+        stacked_area_figure(balance, facet_col="country", template=PLOTLY_TEMPLATE_NAME),
+        horizontal_bar_figure(totals, facet_col="country", template=PLOTLY_TEMPLATE_NAME),
+        horizontal_bar_figure(totals.groupby(level="carrier").sum(), template=PLOTLY_TEMPLATE_NAME),
+        grouped_bar_figure(totals.unstack(fill_value=0.0), template=PLOTLY_TEMPLATE_NAME, zero_line=True),
+    ):
+        go.Figure(figure)
+
+
+def test_stacked_area_splits_signs(balance):
+    """Positive and negative parts are stacked apart; every carrier appears once in the legend."""
+    figure = stacked_area_figure(balance, colors={"Wind": "#74c6f2"}, facet_col="country", template=PLOTLY_TEMPLATE_NAME)
+    traces = {(trace["name"], trace.get("stackgroup"), trace.get("xaxis")): trace for trace in figure["data"]}
+
+    assert set(traces) - {("Zero", None, None)} == {
+        ("Wind", "positive", "x"),
+        ("Wind", "positive", "x2"),
+        ("Storage", "positive", "x"),
+        ("Load", "negative", "x"),
+        ("Storage", "negative", "x"),
+    }
+    np.testing.assert_array_equal(traces[("Storage", "positive", "x")]["y"], [0.5, 0.0, 0.0])
+    np.testing.assert_array_equal(traces[("Storage", "negative", "x")]["y"], [0.0, -0.5, 0.0])
+    assert traces[("Wind", "positive", "x2")]["line"]["color"] == "#74c6f2"
+    legend = [trace["name"] for trace in figure["data"] if trace.get("showlegend", True)]
+    assert sorted(legend) == ["Load", "Storage", "Wind", "Zero"]
+    assert figure["layout"]["yaxis"]["title"]["text"] == "Energy Balance [MWh]"
+    assert [annotation["text"] for annotation in figure["layout"]["annotations"]] == ["country=DE", "country=FR"]
+
+
+def test_horizontal_bar_facets(balance):
+    """One bar trace per facet, on subplots sharing the ranges of the first one."""
+    totals = balance.sum(axis=1)
+    totals.attrs = {"name": "Optimal Capacity", "unit": "MW"}
+    figure = horizontal_bar_figure(totals, facet_col="country", template=PLOTLY_TEMPLATE_NAME, category_title="")
+
+    first, second = figure["data"]
+    assert list(first["y"]) == ["Wind", "Load", "Storage"]
+    np.testing.assert_array_equal(second["x"], [5.0, 0.0])
+    assert second["hovertemplate"].startswith("country=FR<br>Optimal Capacity [MW]=%{x}")
+    layout = figure["layout"]
+    assert layout["xaxis"]["domain"] == [0.0, 0.49]
+    assert layout["xaxis2"]["domain"] == [0.51, 1.0]
+    assert layout["xaxis2"]["matches"] == "x"
+    assert layout["yaxis2"]["showticklabels"] is False
+    assert layout["yaxis"]["dtick"] == 1
+
+
+def test_grouped_bar_one_trace_per_column():
+    """Every column is one trace over the rows; a zero line is drawn on request."""
+    matrix = pd.DataFrame({"Wind": [1.0, -2.0], "Solar": [3.0, 0.0]}, index=["Base", "High"])
+    figure = grouped_bar_figure(matrix, colors={"Wind": "#74c6f2"}, template=PLOTLY_TEMPLATE_NAME)
+    assert [trace["name"] for trace in figure["data"]] == ["Wind", "Solar"]
+    assert figure["data"][0]["marker"] == {"color": "#74c6f2"}
+    assert "marker" not in figure["data"][1]
+    np.testing.assert_array_equal(figure["data"][0]["y"], [1.0, -2.0])
+    assert figure["data"][0]["x"].tolist() == ["Base", "High"]
+    assert figure["layout"]["barmode"] == "group"
+    assert "shapes" not in figure["layout"]
+    assert grouped_bar_figure(matrix, template=PLOTLY_TEMPLATE_NAME, zero_line=True)["layout"]["shapes"][0]["y0"] == 0
+
+
+def test_facet_layout_single_subplot():
+    """Without facets, one subplot fills the figure and has no title annotation."""
+    layout = facet_layout([None], None, x_title="snapshot", y_title="Value")
+    assert layout == {
+        "xaxis": {"anchor": "y", "domain": [0.0, 1.0], "title": {"text": "snapshot"}},
+        "yaxis": {"anchor": "x", "domain": [0.0, 1.0], "title": {"text": "Value"}},
+    }
+
+
+def test_template_data_is_a_copy():
+    """Templates are plain data that figures may modify independently."""
+    template = template_data(PLOTLY_TEMPLATE_NAME)
+    template["layout"]["font"]["color"] = "red"
+    assert template_data(PLOTLY_TEMPLATE_NAME)["layout"]["font"]["color"] != "red"
+
+
+def test_carrier_color_map(demo_network):
+    """Colors are keyed by nice name; carriers without a name fall back to gray."""
+    colors = carrier_color_map(demo_network)
+    assert colors["Wind"] == "#74c6f2"
+    assert colors["-"] == "gray"
@@ -0,0 +1,65 @@
+"""Tests for the global filter callbacks and the clientside callback asset."""
+
+from dash import Dash
+
+from pypsa_explorer.app import create_app
+from pypsa_explorer.callbacks.filters import register_filter_callbacks
+from pypsa_explorer.config import CLIENTSIDE_NAMESPACE
+
+
+class TestFilterCallbacks:
+    """Test the country selector and tab-specific UI callbacks."""
+
+    def test_filter_callbacks_run_in_browser(self):
+        """Both filter callbacks are clientside callbacks and cost no server round trip."""
+        app = Dash(__name__)
+        register_filter_callbacks(app)
+
+        assert len(app.callback_map) == 2
+        assert [callback["clientside_function"] for callback in app._callback_list] == [
+            {"namespace": CLIENTSIDE_NAMESPACE, "function_name": "toggleGlobalCountrySelector"},
+            {"namespace": CLIENTSIDE_NAMESPACE, "function_name": "handleTabSpecificUi"},
+        ]
+
+    def test_country_selector_follows_mode(self, clientside):
+        """The country selector is disabled for all countries and cleared on every mode change."""
+        assert clientside("toggleGlobalCountrySelector", "All") == (True, [])
+        assert clientside("toggleGlobalCountrySelector", "Specific") == (False, [])
+
+    def test_carrier_selector_hidden_on_expenditure_tabs(self, clientside):
+        """The carrier selector does not apply to the CAPEX and OPEX tabs."""
+        for tab in ("capex", "opex"):
+            assert clientside("handleTabSpecificUi", tab) == ({"display": "none"}, {"display": "block"}, tab)
+        assert clientside("handleTabSpecificUi", "capacity") == ({"display": "block"}, {"display": "none"}, "capacity")
+
+
+def test_clientside_functions_are_served(demo_network):
+    """Every clientside callback of the app is defined in the assets Dash serves with the page."""
+    app = create_app({"Test": demo_network})
+    client = app.server.test_client()
+    page = client.get("/").get_data(as_text=True)
+    sources = []
+    for asset in ("clientside.js", "figure_cache.js"):
+        assert f"/assets/{asset}" in page
+        response = client.get(f"/assets/{asset}")
+        assert response.status_code == 200
+        sources.append(response.get_data(as_text=True))
+
+    functions = {
+        callback["clientside_function"]["function_name"]
+        for callback in app._callback_list
+        if callback["clientside_function"] is not None
+    }
+    assert functions == {
+        "toggleGlobalCountrySelector",
+        "handleTabSpecificUi",
+        "navigatePages",
+        "toggleDarkMode",
+        "lookupCharts",
+        "storeCharts",
+    }
+    assert all(any(f"{function}: " in source for source in sources) for function in functions)
+    # Server-side callbacks are left for data work
+    assert not {"toggle_dark_mode", "navigate_pages"} & {
+        entry["callback"].__wrapped__.__name__ for entry in app.callback_map.values() if "callback" in entry
+    }
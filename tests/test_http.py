@@ -0,0 +1,107 @@
+"""Tests for response compression and the static assets."""
+
+import gzip
+import re
+
+import flask
+import pytest
+
+from pypsa_explorer.app import create_app
+from pypsa_explorer.utils.http import IMMUTABLE_CACHE_CONTROL, StaticAssets, compress, negotiate_encoding
+
+
+@pytest.fixture
+def client(demo_network):
+    """Test client of a dashboard with the demo network."""
+    return create_app({"Test": demo_network}).server.test_client()
+
+
+def _stylesheets(client):
+    page = gzip.decompress(client.get("/", headers={"Accept-Encoding": "gzip"}).data).decode()
+    return re.findall(r'<link rel="stylesheet" href="([^"]+)">', page)
+
+
+class TestCompression:
+    """Test the negotiation and compression of responses."""
+
+    def test_negotiate_encoding(self):
+        """Gzip is picked when accepted, refused codings are ignored."""
+        assert negotiate_encoding("gzip, deflate") == "gzip"
+        assert negotiate_encoding("gzip;q=0, deflate") is None
+        assert negotiate_encoding("") is None
+
+    def test_gzip_roundtrip(self):
+        """Compressed data decompresses to the original."""
+        data = b'{"x": [1.0, 2.0, 3.0]}' * 100
+        assert gzip.decompress(compress(data, "gzip")) == data
+        with pytest.raises(ValueError):
+            compress(data, "deflate")
+
+    def test_layout_is_compressed(self, client):
+        """Large responses are compressed for clients accepting gzip."""
+        plain = client.get("/_dash-layout")
+        compressed = client.get("/_dash-layout", headers={"Accept-Encoding": "gzip"})
+        assert plain.headers.get("Content-Encoding") is None
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in compressed.headers["Vary"]
+        assert gzip.decompress(compressed.data) == plain.data
+        assert len(compressed.data) < len(plain.data)
+
+    def test_small_responses_are_not_compressed(self, client):
+        """Responses below the size threshold are sent as they are."""
+        response = client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+        assert len(response.data) < 1024
+        assert response.headers.get("Content-Encoding") is None
+
+    def test_partial_responses_are_not_compressed(self, client):
+        """Range responses keep their plain body, which their byte ranges refer to."""
+        client.application.add_url_rule(
+            "/partial", "partial", lambda: flask.Response("x" * 4096, status=206, mimetype="text/plain")
+        )
+        response = client.get("/partial", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 206
+        assert response.headers.get("Content-Encoding") is None
+        assert response.data == b"x" * 4096
+
+
+class TestStaticAssets:
+    """Test the content-hashed stylesheets and fonts."""
+
+    def test_page_links_local_stylesheets(self, client):
+        """The page links the bundled stylesheets instead of inlining CSS or using a CDN."""
+        page = gzip.decompress(client.get("/", headers={"Accept-Encoding": "gzip"}).data).decode()
+        assert "cdn" not in page
+        assert "<style>" not in page
+        assert [url.rsplit("/", 1)[-1] for url in _stylesheets(client)] == [
+            "bootstrap.min.css",
+            "fontawesome.min.css",
+            "solid.min.css",
+            "dashboard.css",
+        ]
+        # Fonts come from the bundle or the system, not from a font CDN
+        assert "@import" not in client.get(_stylesheets(client)[-1]).text
+
+    def test_assets_are_immutable(self, client):
+        """Assets are served with immutable cache headers; fonts are found next to the stylesheets."""
+        for url in _stylesheets(client):
+            response = client.get(url)
+            assert response.status_code == 200
+            assert response.headers["Cache-Control"] == IMMUTABLE_CACHE_CONTROL
+        font_url = _stylesheets(client)[1].replace("css/fontawesome.min.css", "webfonts/fa-solid-900.woff2")
+        font = client.get(font_url, headers={"Accept-Encoding": "gzip"})
+        assert font.mimetype == "font/woff2"
+        assert font.headers.get("Content-Encoding") is None
+
+    def test_stale_version_is_not_found(self, client):
+        """URLs of another asset version are not served."""
+        url = _stylesheets(client)[-1]
+        version = StaticAssets().version
+        assert client.get(url.replace(version, "0" * len(version))).status_code == 404
+
+    def test_version_follows_content(self, tmp_path):
+        """Changing an asset changes the version in its URL."""
+        (tmp_path / "css").mkdir()
+        (tmp_path / "css" / "dashboard.css").write_text("body {}")
+        before = StaticAssets(tmp_path).path("css/dashboard.css")
+        (tmp_path / "css" / "dashboard.css").write_text("body { color: red; }")
+        assert StaticAssets(tmp_path).path("css/dashboard.css") != before
@@ -0,0 +1,120 @@
+"""Tests for callback latency instrumentation and the metrics endpoint."""
+
+import logging
+import time
+
+import pytest
+
+from pypsa_explorer.app import create_app
+from pypsa_explorer.config import CHART_TAB_CONTAINERS
+from pypsa_explorer.utils.metrics import CallbackMetrics, CallbackRecord, phase
+
+
+def _capex_request(label):
+    """Body of a Dash update request for the CAPEX tab."""
+    outputs = [{"id": container, "property": "children"} for container in CHART_TAB_CONTAINERS.values()]
+    outputs.append({"id": "chart-tabs-rendered", "property": "data"})
+    return {
+        "output": ".." + "...".join(f"{output['id']}.{output['property']}" for output in outputs) + "..",
+        "outputs": outputs,
+        "inputs": [
+            {
+                "id": "chart-request",
+                "property": "data",
+                "value": {
+                    "tab": "capex",
+                    "network": label,
+                    "carriers": ["AC"],
+                    "country_mode": "All",
+                    "countries": [],
+                    "dark": False,
+                },
+            },
+        ],
+        "changedPropIds": ["chart-request.data"],
+        "state": [{"id": "chart-tabs-rendered", "property": "data", "value": {}}],
+    }
+
+
+class TestPhases:
+    """Test exclusive phase accounting."""
+
+    def test_nested_phases_are_exclusive(self):
+        """Time in a nested phase is not counted for the enclosing phase."""
+        metrics = CallbackMetrics()
+
+        @phase("statistics")
+        def statistics():
+            time.sleep(0.05)
+
+        def callback():
+            with phase("figure"):
+                statistics()
+
+        metrics.wrap(callback)()
+        stats = metrics.snapshot()["callback"]
+        assert stats["calls"] == 1
+        assert stats["phase_seconds"]["statistics"] >= 0.05
+        assert stats["phase_seconds"]["figure"] < 0.05
+
+    def test_phase_outside_callback_is_noop(self):
+        """Phases outside an instrumented callback do nothing."""
+        with phase("figure"):
+            pass
+
+    def test_errors_are_counted(self):
+        """Exceptions are recorded and re-raised."""
+        metrics = CallbackMetrics()
+
+        def failing():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            metrics.wrap(failing)()
+        assert metrics.snapshot()["failing"]["errors"] == 1
+
+
+class TestMetricsEndpoint:
+    """Test instrumentation of a running dashboard."""
+
+    def test_wrapped_callbacks_remain_callable(self, demo_network):
+        """Instrumented callbacks are still reachable through ``__wrapped__``."""
+        app = create_app({"Test": demo_network})
+        names = {entry["callback"].__wrapped__.__name__ for entry in app.callback_map.values() if "callback" in entry}
+        assert {"update_active_tab_charts", "update_map", "toggle_modal_and_load_data"} <= names
+
+    def test_request_is_recorded_and_exposed(self, demo_network, caplog):
+        """A callback request shows up in the Prometheus endpoint with its payload size."""
+        metrics = CallbackMetrics(log_requests=True)
+        app = create_app({"Test": demo_network}, callback_metrics=metrics)
+        client = app.server.test_client()
+
+        with caplog.at_level(logging.INFO, logger="pypsa_explorer.utils.metrics"):
+            response = client.post("/_dash-update-component", json=_capex_request("Test"))
+        assert response.status_code == 200
+
+        stats = metrics.snapshot()["update_active_tab_charts"]
+        assert stats["calls"] == 1
+        assert stats["payload_bytes"] == len(response.data)
+        assert '"callback": "update_active_tab_charts"' in caplog.text
+
+        body = client.get("/metrics").get_data(as_text=True)
+        assert 'pypsa_explorer_callback_duration_seconds_count{callback="update_active_tab_charts"} 1' in body
+        assert 'phase="serialization"' in body
+        assert (
+            f'pypsa_explorer_callback_payload_bytes_total{{callback="update_active_tab_charts"}} {len(response.data)}'
+            in body
+        )
+
+    def test_record_as_dict(self):
+        """Records serialize to flat JSON-friendly dictionaries."""
+        record = CallbackRecord("cb", wall=0.5, phases={"figure": 0.25}, payload_bytes=10)
+        assert record.as_dict() == {
+            "callback": "cb",
+            "wall_ms": 500.0,
+            "statistics_ms": 0.0,
+            "figure_ms": 250.0,
+            "serialization_ms": 0.0,
+            "payload_bytes": 10,
+            "error": False,
+        }
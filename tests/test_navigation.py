@@ -54,20 +54,14 @@ class TestNavigationCallbackRegistration:
 class TestNavigationLogic:
     """Test the navigation logic directly."""
 
-    def test_navigate_to_dashboard(self):
+    def test_navigate_to_dashboard(self, clientside):
         """Test navigation from welcome to dashboard."""
-        app = Dash(__name__)
-        register_navigation_callbacks(app)
-
-        # Get the callback function
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test navigation with button click and welcome page state
-        welcome_style, dashboard_style, page_state, selector_style = callback_func(
-            n_clicks=1,
-            page_state={"current_page": "welcome"},
-            registry={"order": ["Test"], "info": {}},
+        welcome_style, dashboard_style, page_state, selector_style = clientside(
+            "navigatePages",
+            1,
+            {"current_page": "welcome"},
+            {"order": ["Test"], "info": {}},
         )
 
         # Check welcome is hidden
@@ -82,58 +76,40 @@ class TestNavigationLogic:
         # Check network selector is shown
         assert selector_style == {"display": "flex"}
 
-    def test_no_navigation_on_dashboard(self):
+    def test_no_navigation_on_dashboard(self, clientside):
         """Test that navigation doesn't happen when already on dashboard."""
-        app = Dash(__name__)
-        register_navigation_callbacks(app)
-
-        # Get the callback function
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test with already on dashboard
-        result = callback_func(
-            n_clicks=1,
-            page_state={"current_page": "dashboard"},
-            registry={"order": ["Test"], "info": {}},
+        result = clientside(
+            "navigatePages",
+            1,
+            {"current_page": "dashboard"},
+            {"order": ["Test"], "info": {}},
         )
 
         # Should return no_update for all outputs
         assert result == (no_update, no_update, no_update, {"display": "flex"})
 
-    def test_no_navigation_without_click(self):
+    def test_no_navigation_without_click(self, clientside):
         """Test that navigation doesn't happen without button click."""
-        app = Dash(__name__)
-        register_navigation_callbacks(app)
-
-        # Get the callback function
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test with no click
-        result = callback_func(
-            n_clicks=None,
-            page_state={"current_page": "welcome"},
-            registry={"order": ["Test"], "info": {}},
+        result = clientside(
+            "navigatePages",
+            None,
+            {"current_page": "welcome"},
+            {"order": ["Test"], "info": {}},
         )
 
         # Should return no_update for all outputs
         assert result == (no_update, no_update, no_update, {"display": "none"})
 
-    def test_zero_clicks_navigation(self):
+    def test_zero_clicks_navigation(self, clientside):
         """Test that navigation doesn't happen with zero clicks."""
-        app = Dash(__name__)
-        register_navigation_callbacks(app)
-
-        # Get the callback function
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test with zero clicks
-        result = callback_func(
-            n_clicks=0,
-            page_state={"current_page": "welcome"},
-            registry={"order": ["Test"], "info": {}},
+        result = clientside(
+            "navigatePages",
+            0,
+            {"current_page": "welcome"},
+            {"order": ["Test"], "info": {}},
         )
 
         # Should return no_update for all outputs
@@ -197,19 +173,14 @@ class TestNavigationIntegration:
 class TestNavigationEdgeCases:
     """Test edge cases for navigation functionality."""
 
-    def test_multiple_clicks_navigation(self):
+    def test_multiple_clicks_navigation(self, clientside):
         """Test navigation with multiple button clicks."""
-        app = Dash(__name__)
-        register_navigation_callbacks(app)
-
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test with multiple clicks
-        welcome_style, dashboard_style, page_state, selector_style = callback_func(
-            n_clicks=5,
-            page_state={"current_page": "welcome"},
-            registry={"order": ["Test"], "info": {}},
+        welcome_style, dashboard_style, page_state, selector_style = clientside(
+            "navigatePages",
+            5,
+            {"current_page": "welcome"},
+            {"order": ["Test"], "info": {}},
         )
 
         # Should still navigate correctly
@@ -218,46 +189,29 @@ class TestNavigationEdgeCases:
         assert page_state == {"current_page": "dashboard"}
         assert selector_style == {"display": "flex"}
 
-    def test_invalid_page_state(self):
+    def test_invalid_page_state(self, clientside):
         """Test handling of invalid page state."""
-        app = Dash(__name__)
-        register_navigation_callbacks(app)
-
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test with invalid page state (should not navigate)
-        result = callback_func(
-            n_clicks=1,
-            page_state={"current_page": "invalid"},
-            registry={"order": ["Test"], "info": {}},
+        result = clientside(
+            "navigatePages",
+            1,
+            {"current_page": "invalid"},
+            {"order": ["Test"], "info": {}},
         )
 
         # Should return no_update for all outputs
         assert result == (no_update, no_update, no_update, {"display": "none"})
 
-    def test_empty_page_state(self):
+    def test_empty_page_state(self, clientside):
         """Test handling of empty page state."""
-        app = Dash(__name__)
-        register_navigation_callbacks(app)
-
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test with empty page state
-        result = callback_func(n_clicks=1, page_state={}, registry={"order": ["Test"], "info": {}})
+        result = clientside("navigatePages", 1, {}, {"order": ["Test"], "info": {}})
         assert result == (no_update, no_update, no_update, {"display": "none"})
 
-    def test_none_page_state(self):
+    def test_none_page_state(self, clientside):
         """Test handling of None page state."""
-        app = Dash(__name__)
-        register_navigation_callbacks(app)
-
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test with None page state
-        result = callback_func(n_clicks=1, page_state=None, registry={"order": ["Test"], "info": {}})
+        result = clientside("navigatePages", 1, None, {"order": ["Test"], "info": {}})
         assert result == (no_update, no_update, no_update, {"display": "none"})
 
 
@@ -276,19 +230,14 @@ class TestUtilityBarVisibility:
         layout_str = str(layout)
         assert "top-bar-network-selector" in layout_str
 
-    def test_network_selector_shown_after_navigation(self):
+    def test_network_selector_shown_after_navigation(self, clientside):
         """Test that network selector is shown after navigating to dashboard."""
-        app = Dash(__name__)
-        register_navigation_callbacks(app)
-
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Navigate to dashboard
-        _, _, _, selector_style = callback_func(
-            n_clicks=1,
-            page_state={"current_page": "welcome"},
-            registry={"order": ["Test"], "info": {}},
+        _, _, _, selector_style = clientside(
+            "navigatePages",
+            1,
+            {"current_page": "welcome"},
+            {"order": ["Test"], "info": {}},
         )
 
         # Network selector should be visible
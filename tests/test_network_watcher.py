@@ -0,0 +1,202 @@
+"""Tests for directory watching, lazy network registration and scoped cache invalidation."""
+
+import os
+
+import pytest
+
+from pypsa_explorer.app import create_app
+from pypsa_explorer.utils.cache import ResultCache
+from pypsa_explorer.utils.network_loader import LazyNetworks
+from pypsa_explorer.utils.network_watcher import NetworkWatcher, read_network_header
+
+
+@pytest.fixture
+def watch_dir(tmp_path, demo_network):
+    """Directory containing a single exported network."""
+    demo_network.export_to_netcdf(tmp_path / "scenario_a.nc")
+    return tmp_path
+
+
+def _touch_later(path):
+    """Bump a file's modification time so the watcher sees it as modified."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestResultCache:
+    """Test the per-network result cache."""
+
+    def test_get_or_compute_caches(self):
+        """Values are computed once and then served from the cache."""
+        cache = ResultCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_compute("figures", "A", ("x",), compute) == "value"
+        assert cache.get_or_compute("figures", "A", ("x",), compute) == "value"
+        assert len(calls) == 1
+
+    def test_invalidate_is_scoped_to_network(self):
+        """Invalidating one network keeps the entries of other networks."""
+        cache = ResultCache()
+        for label in ("A", "B"):
+            cache.set("statistics", label, (), 1)
+            cache.set("figures", label, ("chart",), 2)
+            cache.set("maps", label, (), 3)
+
+        assert cache.invalidate("A") == 3
+        assert cache.get("figures", "A", ("chart",)) is None
+        assert cache.get("figures", "B", ("chart",)) == 2
+        assert len(cache) == 3
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = ResultCache(max_entries=2)
+        cache.set("figures", "A", (1,), 1)
+        cache.set("figures", "A", (2,), 2)
+        cache.get("figures", "A", (1,))
+        cache.set("figures", "A", (3,), 3)
+        assert cache.get("figures", "A", (2,)) is None
+        assert cache.get("figures", "A", (1,)) == 1
+
+
+class TestLazyNetworks:
+    """Test lazily loaded network collections."""
+
+    def test_lazy_entry_loads_on_access(self, demo_network):
+        """Lazy entries are loaded once, on first access."""
+        networks = LazyNetworks()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return demo_network
+
+        networks.register_lazy("Lazy", loader)
+        assert "Lazy" in networks
+        assert not networks.is_loaded("Lazy")
+        assert networks["Lazy"] is demo_network
+        assert networks["Lazy"] is demo_network
+        assert len(calls) == 1
+
+    def test_unknown_label_raises(self):
+        """Unknown labels raise KeyError."""
+        with pytest.raises(KeyError):
+            LazyNetworks()["missing"]
+
+
+class TestNetworkWatcher:
+    """Test directory indexing and reloading."""
+
+    def test_read_network_header(self, demo_network_path):
+        """Header summaries match the component counts of the network."""
+        assert read_network_header(demo_network_path) == {"buses": 2, "links": 0, "lines": 1}
+
+    def test_scan_registers_lazy_entries(self, watch_dir):
+        """New files are indexed from their header without being loaded."""
+        networks = LazyNetworks()
+        watcher = NetworkWatcher(watch_dir, networks)
+
+        assert watcher.scan(force=True)
+        assert "scenario_a" in networks
+        assert not networks.is_loaded("scenario_a")
+        assert watcher.summaries["scenario_a"]["buses"] == 2
+        assert watcher.summaries["scenario_a"]["origin"] == "watch"
+
+        # Nothing changed on disk
+        assert not watcher.scan(force=True)
+
+    def test_scan_picks_up_new_files(self, watch_dir, demo_network):
+        """Files added after the first scan are registered too."""
+        networks = LazyNetworks()
+        watcher = NetworkWatcher(watch_dir, networks)
+        watcher.scan(force=True)
+
+        demo_network.export_to_netcdf(watch_dir / "scenario_b.nc")
+        assert watcher.scan(force=True)
+        assert "scenario_b" in networks
+
+    def test_modified_file_is_reloaded_and_invalidated(self, watch_dir):
+        """Modifying a file unloads only that network and drops only its cache entries."""
+        networks = LazyNetworks()
+        cache = ResultCache()
+        watcher = NetworkWatcher(watch_dir, networks, cache=cache)
+        watcher.scan(force=True)
+
+        first = networks["scenario_a"]
+        cache.set("figures", "scenario_a", ("chart",), "stale")
+        cache.set("figures", "other", ("chart",), "kept")
+
+        _touch_later(watch_dir / "scenario_a.nc")
+        assert watcher.scan(force=True)
+
+        assert not networks.is_loaded("scenario_a")
+        assert cache.get("figures", "scenario_a", ("chart",)) is None
+        assert cache.get("figures", "other", ("chart",)) == "kept"
+        assert networks["scenario_a"] is not first
+
+    def test_removed_file_is_dropped(self, watch_dir):
+        """Deleting a file removes the network."""
+        networks = LazyNetworks()
+        watcher = NetworkWatcher(watch_dir, networks)
+        watcher.scan(force=True)
+
+        (watch_dir / "scenario_a.nc").unlink()
+        assert watcher.scan(force=True)
+        assert "scenario_a" not in networks
+        assert watcher.summaries == {}
+
+    def test_file_named_like_loaded_network_is_ignored(self, watch_dir, demo_network, caplog):
+        """A watched file does not replace a network of the same label loaded from the command line."""
+        networks = LazyNetworks({"scenario_a": demo_network})
+        watcher = NetworkWatcher(watch_dir, networks)
+
+        with caplog.at_level("WARNING"):
+            assert not watcher.scan(force=True)
+        assert "scenario_a" in caplog.text
+        assert watcher.summaries == {}
+
+        _touch_later(watch_dir / "scenario_a.nc")
+        caplog.clear()
+        assert not watcher.scan(force=True)
+        assert networks["scenario_a"] is demo_network
+        # The conflict is reported once
+        assert caplog.text == ""
+
+    def test_scan_is_throttled(self, watch_dir):
+        """Scans within the poll interval are skipped unless forced."""
+        watcher = NetworkWatcher(watch_dir, LazyNetworks(), poll_interval=60)
+        assert watcher.scan()
+        (watch_dir / "scenario_a.nc").unlink()
+        assert not watcher.scan()
+
+    def test_missing_directory(self, tmp_path):
+        """A missing directory is reported immediately."""
+        with pytest.raises(NotADirectoryError):
+            NetworkWatcher(tmp_path / "missing", LazyNetworks())
+
+
+def test_create_app_with_watch_dir(watch_dir):
+    """Watched networks appear in the registry with their header summaries."""
+    app = create_app(None, watch_dir=str(watch_dir))
+
+    def _find(component, target_id):
+        if getattr(component, "id", None) == target_id:
+            return component
+        children = getattr(component, "children", None)
+        if isinstance(children, list):
+            for child in children:
+                found = _find(child, target_id)
+                if found is not None:
+                    return found
+        elif children is not None:
+            return _find(children, target_id)
+        return None
+
+    registry = _find(app.layout, "network-registry")
+    assert registry.data["order"] == ["scenario_a"]
+    assert registry.data["info"]["scenario_a"]["origin"] == "watch"
+    assert _find(app.layout, "network-watch-interval").disabled is False
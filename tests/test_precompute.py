@@ -0,0 +1,71 @@
+"""Tests for headless cache precomputation."""
+
+from unittest.mock import patch
+
+import pytest
+
+from pypsa_explorer.callbacks.network import build_filter_options, build_network_map
+from pypsa_explorer.callbacks.visualizations import build_energy_balance_figure
+from pypsa_explorer.precompute import precompute_cache
+from pypsa_explorer.utils.cache import ResultCache, create_cache_backend
+from pypsa_explorer.utils.network_loader import load_network_file
+
+
+class TestPrecompute:
+    """Test filling a persistent cache ahead of serving."""
+
+    def test_views_are_served_from_precomputed_cache(self, demo_network_path, tmp_path):
+        """A separate process loading the same file finds every precomputed view."""
+        results = precompute_cache({"Demo": demo_network_path}, tmp_path / "cache", workers=1)
+        assert [(result.label, result.error) for result in results] == [("Demo", None)]
+        assert results[0].charts > 0
+
+        # Simulate the serving host: a fresh cache on the same directory and a fresh network object
+        cache = ResultCache(create_cache_backend(str(tmp_path / "cache")))
+        n = load_network_file(demo_network_path)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("view was recomputed")
+
+        with patch("pypsa_explorer.callbacks.network.get_country_options", fail):
+            _, countries = build_filter_options(n, "Other label", cache)
+        assert [option["value"] for option in countries] == ["DE", "FR"]
+
+        if results[0].map:
+            with patch.object(type(n.plot), "explore", fail):
+                assert build_network_map(n, "Other label", cache)
+
+        with patch("pypsa_explorer.callbacks.visualizations.chart_statistic", fail):
+            for is_dark_mode in (False, True):
+                figure, _ = build_energy_balance_figure(
+                    n, "Other label", "AC", aggregated=False, is_dark_mode=is_dark_mode, cache=cache
+                )
+                assert figure["data"]
+
+    def test_memory_cache_is_rejected(self, demo_network_path):
+        """Precomputing into the in-process cache would be lost, so it is refused."""
+        with pytest.raises(ValueError, match="persistent"):
+            precompute_cache({"Demo": demo_network_path}, "memory")
+
+    def test_missing_file_is_reported(self, tmp_path):
+        """A network that cannot be loaded is reported without aborting the others."""
+        results = precompute_cache({"Missing": str(tmp_path / "missing.nc")}, tmp_path / "cache", workers=1)
+        assert results[0].error is not None
+
+
+@patch("pypsa_explorer.precompute.precompute_cache")
+def test_cli_precompute_subcommand(mock_precompute, tmp_path, monkeypatch):
+    """``pypsa-explorer precompute`` is dispatched to the precompute command."""
+    from pypsa_explorer.cli import cli
+
+    mock_precompute.return_value = []
+    monkeypatch.setattr(
+        "sys.argv", ["pypsa-explorer", "precompute", "a.nc", "b.nc:B", "--out", str(tmp_path), "--theme", "dark"]
+    )
+    with pytest.raises(SystemExit) as exit_info:
+        cli()
+    assert exit_info.value.code == 0
+
+    args, kwargs = mock_precompute.call_args
+    assert args == ({"a": "a.nc", "B": "b.nc"}, str(tmp_path))
+    assert kwargs["themes"] == (True,)
@@ -0,0 +1,49 @@
+"""Tests for the callback profiling mode."""
+
+import pstats
+import time
+
+from pypsa_explorer.app import create_app
+from pypsa_explorer.utils.profiling import CallbackProfiler
+
+
+def _busy_callback():
+    """Callback spending measurable time in a nested function."""
+    deadline = time.perf_counter() + 0.1
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+    return "done"
+
+
+class TestCallbackProfiler:
+    """Test per-invocation profiles and folded stacks."""
+
+    def test_invocation_writes_profile_and_folded_stacks(self, tmp_path):
+        """Each call writes a pstats-readable profile and sampled stacks."""
+        profiler = CallbackProfiler(tmp_path, sample_interval=0.001)
+        wrapped = profiler.wrap(_busy_callback)
+
+        assert wrapped() == "done"
+        assert wrapped.__wrapped__ is _busy_callback
+
+        profiles = sorted((tmp_path / "_busy_callback").glob("*.prof"))
+        assert len(profiles) == 1
+        stats = pstats.Stats(str(profiles[0]))
+        assert any(func[2] == "_busy_callback" for func in stats.stats)
+
+        folded = (tmp_path / "_busy_callback.folded").read_text().splitlines()
+        assert folded
+        stack, samples = folded[0].rsplit(" ", 1)
+        assert stack.split(";")[0] == "tests.test_profiling:_busy_callback"
+        assert int(samples) > 0
+
+    def test_create_app_profiles_data_callbacks(self, demo_network, tmp_path):
+        """Data callbacks of an app started with a profile directory are profiled."""
+        app = create_app({"Test": demo_network}, profile_dir=str(tmp_path))
+        callback = next(
+            entry["callback"].__wrapped__
+            for entry in app.callback_map.values()
+            if "callback" in entry and entry["callback"].__wrapped__.__name__ == "update_map"
+        )
+        callback(None, "Test")
+        assert list((tmp_path / "update_map").glob("*.prof"))
@@ -46,45 +46,24 @@ class TestThemeCallbackRegistration:
 class TestThemeToggleLogic:
     """Test the theme toggle logic directly."""
 
-    def test_dark_mode_enabled(self):
+    def test_dark_mode_enabled(self, clientside):
         """Test dark mode class is applied when toggle is checked."""
-        app = Dash(__name__)
-        register_theme_callbacks(app)
-
-        # Get the callback function
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test with dark mode enabled - returns tuple (className, is_dark)
-        class_name, is_dark = callback_func(["dark"])
+        class_name, is_dark = clientside("toggleDarkMode", ["dark"])
         assert class_name == "dark-mode"
         assert is_dark is True
 
-    def test_dark_mode_disabled(self):
+    def test_dark_mode_disabled(self, clientside):
         """Test no class is applied when toggle is unchecked."""
-        app = Dash(__name__)
-        register_theme_callbacks(app)
-
-        # Get the callback function
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test with dark mode disabled - returns tuple (className, is_dark)
-        class_name, is_dark = callback_func([])
+        class_name, is_dark = clientside("toggleDarkMode", [])
         assert class_name == ""
         assert is_dark is False
 
-    def test_dark_mode_none_value(self):
+    def test_dark_mode_none_value(self, clientside):
         """Test handling of None value (initial state)."""
-        app = Dash(__name__)
-        register_theme_callbacks(app)
-
-        # Get the callback function
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test with None value - returns tuple (className, is_dark)
-        class_name, is_dark = callback_func(None)
+        class_name, is_dark = clientside("toggleDarkMode", None)
         assert class_name == ""
         assert is_dark is False
 
@@ -127,42 +106,24 @@ class TestThemeIntegration:
 class TestThemeEdgeCases:
     """Test edge cases for theme functionality."""
 
-    def test_multiple_values_in_toggle(self):
+    def test_multiple_values_in_toggle(self, clientside):
         """Test handling of unexpected multiple values."""
-        app = Dash(__name__)
-        register_theme_callbacks(app)
-
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test with multiple values (should still work)
-        class_name, is_dark = callback_func(["dark", "other"])
+        class_name, is_dark = clientside("toggleDarkMode", ["dark", "other"])
         assert class_name == "dark-mode"
         assert is_dark is True
 
-    def test_wrong_value_in_toggle(self):
+    def test_wrong_value_in_toggle(self, clientside):
         """Test handling of wrong value in toggle."""
-        app = Dash(__name__)
-        register_theme_callbacks(app)
-
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test with wrong value (not "dark")
-        class_name, is_dark = callback_func(["light"])
+        class_name, is_dark = clientside("toggleDarkMode", ["light"])
         assert class_name == ""
         assert is_dark is False
 
-    def test_empty_list_toggle(self):
+    def test_empty_list_toggle(self, clientside):
         """Test handling of empty list."""
-        app = Dash(__name__)
-        register_theme_callbacks(app)
-
-        callback_info = list(app.callback_map.values())[0]
-        callback_func = callback_info["callback"].__wrapped__
-
         # Test with empty list
-        class_name, is_dark = callback_func([])
+        class_name, is_dark = clientside("toggleDarkMode", [])
         assert class_name == ""
         assert is_dark is False
 
@@ -1,16 +1,21 @@
 """Tests for utility functions."""
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from pypsa_explorer.utils.cache import ResultCache
 from pypsa_explorer.utils.helpers import (
     convert_latex_to_html,
     get_bus_carrier_options,
     get_carrier_nice_name,
     get_country_filter,
     get_country_options,
+    get_country_selection,
     title_except_multi_caps,
 )
 from pypsa_explorer.utils.network_loader import load_networks, parse_cli_network_args
+from pypsa_explorer.utils.statistics import partition_positions, select_countries
 
 
 class TestTextFormatting:
@@ -78,6 +83,34 @@ class TestCountryFilter:
         assert facet is None
         assert error is not None
 
+    def test_country_selection(self):
+        """Test the positional country selection used by the charts."""
+        assert get_country_selection("All", ["DE"]) == (None, None, None)
+        assert get_country_selection("Specific", ["DE", "FR"]) == (["DE", "FR"], "country", None)
+        countries, facet, error = get_country_selection("Specific", [])
+        assert countries is None and facet is None and error is not None
+
+    def test_partition_positions(self):
+        """Test the country to row positions index."""
+        index = pd.MultiIndex.from_tuples(
+            [("DE", "wind"), ("FR", "wind"), ("DE", "solar"), (np.nan, "gas"), ("FR", "gas")], names=["country", "carrier"]
+        )
+        partitions = partition_positions(index)
+        assert set(partitions) == {"DE", "FR"}
+        np.testing.assert_array_equal(partitions["DE"], [0, 2])
+        np.testing.assert_array_equal(partitions["FR"], [1, 4])
+
+    def test_select_countries_matches_query(self, demo_network):
+        """Test that positional selection returns the rows a query would."""
+        kwargs = {"groupby": ["country", "carrier"], "nice_names": True}
+        cache = ResultCache()
+        full = demo_network.statistics.installed_capacity(**kwargs)
+        countries = sorted(full.index.get_level_values("country").unique())[:2]
+        selected = select_countries(demo_network, "demo", "installed_capacity", cache, countries + ["XX"], **kwargs)
+        assert len(countries) == 2
+        pd.testing.assert_series_equal(selected, full[full.index.get_level_values("country").isin(countries)])
+        assert select_countries(demo_network, "demo", "installed_capacity", cache, ["XX"], **kwargs).empty
+
 
 class TestNetworkLoader:
     """Test network loading utilities."""
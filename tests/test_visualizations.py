@@ -0,0 +1,246 @@
+"""Tests for visualization helpers."""
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+import pytest
+from dash import Patch, dcc, no_update
+from dash.exceptions import PreventUpdate
+
+from pypsa_explorer.app import create_app
+from pypsa_explorer.callbacks import visualizations
+from pypsa_explorer.callbacks.visualizations import compute_bar_chart_height, plan_carrier_chart_updates
+from pypsa_explorer.config import CHART_TAB_CONTAINERS
+from pypsa_explorer.utils.cache import ResultCache
+from pypsa_explorer.utils.figure_encoding import decode_typed_array, encode_figure
+
+
+def test_compute_bar_chart_height_with_array_data():
+    """Bar traces holding numpy arrays (Plotly >= 6) are measured without errors."""
+    categories = np.array([f"carrier {i}" for i in range(30)])
+    fig = go.Figure(go.Bar(x=np.arange(30.0), y=categories, orientation="h"))
+
+    height = compute_bar_chart_height(fig)
+    assert 320 <= height <= 1100
+    assert height > compute_bar_chart_height(go.Figure(go.Bar(x=np.arange(2.0), y=categories[:2], orientation="h")))
+
+
+def test_encode_figure_typed_arrays():
+    """Values become float32 typed arrays and evenly spaced snapshots a start date and step."""
+    snapshots = pd.date_range("2030-01-01", periods=48, freq="h")
+    values = np.linspace(0.0, 1000.0, 48)
+    figure = go.Figure(go.Scatter(x=snapshots.to_numpy(), y=values, stackgroup="positive")).to_dict()
+
+    encoded = encode_figure(figure)
+    trace = encoded["data"][0]
+    assert "x" not in trace
+    assert trace["x0"] == "2030-01-01T00:00:00.000"
+    assert trace["dx"] == 3_600_000
+    assert trace["y"]["dtype"] == "f4"
+    np.testing.assert_allclose(decode_typed_array(trace["y"]), values, rtol=1e-6)
+    assert encoded["layout"]["xaxis"]["type"] == "date"
+    # The input figure is left untouched
+    assert "x" in figure["data"][0]
+    assert (
+        len(pio.to_json({"data": encoded["data"]}, validate=False))
+        < len(pio.to_json({"data": figure["data"]}, validate=False)) / 2
+    )
+
+
+def test_encode_figure_irregular_dates_and_precision():
+    """Irregular dates become epoch milliseconds; values beyond float32 keep double precision."""
+    dates = pd.to_datetime(["2030-01-01", "2030-01-02", "2030-01-05"]).to_numpy()
+    figure = {"data": [{"type": "bar", "x": dates, "y": np.array([1.0, 1e300, 2.0]), "xaxis": "x2"}], "layout": {}}
+
+    trace = encode_figure(figure)["data"][0]
+    np.testing.assert_array_equal(decode_typed_array(trace["x"]), dates.astype("datetime64[ms]").astype(np.int64))
+    assert trace["y"]["dtype"] == "f8"
+    assert encode_figure(figure)["layout"]["xaxis2"] == {"type": "date"}
+    assert encode_figure(figure, float32=False)["data"][0]["y"]["dtype"] == "f8"
+
+
+def test_plan_carrier_chart_updates():
+    """Deselected charts are removed from the end first and new carriers appended; other settings render afresh."""
+    rendered = {"key": ["Network", "abc"], "carriers": ["AC", "H2", "gas"]}
+    assert plan_carrier_chart_updates(rendered, ["Network", "abc"], ["gas", "AC", "heat"]) == ([1], ["heat"])
+    assert plan_carrier_chart_updates(rendered, ["Network", "abc"], ["AC", "H2", "gas"]) == ([], [])
+    assert plan_carrier_chart_updates(rendered, ["Network", "def"], ["AC"]) is None
+    assert plan_carrier_chart_updates(rendered, ["Network", "abc"], ["heat"]) is None
+    assert plan_carrier_chart_updates({"key": ["Network", "abc"], "carriers": None}, ["Network", "abc"], ["AC"]) is None
+    assert plan_carrier_chart_updates(None, ["Network", "abc"], ["AC"]) is None
+    # Containers holding placeholders of charts that missed the deadline are rendered afresh
+    assert plan_carrier_chart_updates({**rendered, "partial": True}, ["Network", "abc"], ["AC", "H2", "gas"]) is None
+
+
+def _update_active_tab_charts(app):
+    """The chart dispatcher, called with the filters the ``lookupCharts`` clientside callback forwards."""
+    update = next(
+        entry["callback"].__wrapped__
+        for entry in app.callback_map.values()
+        if "callback" in entry and entry["callback"].__wrapped__.__name__ == "update_active_tab_charts"
+    )
+
+    def call(carriers, country_mode, countries, network, tab, dark, rendered, **session):
+        request = {
+            "tab": tab,
+            "network": network,
+            "carriers": carriers,
+            "country_mode": country_mode,
+            "countries": countries,
+            "dark": dark,
+            **session,
+        }
+        return update(request, rendered)
+
+    return call
+
+
+def _tab_state(outputs):
+    """Tab and render state assigned by the ``Patch`` of the render state store."""
+    (operation,) = outputs[-1].to_plotly_json()["operations"]
+    return operation["location"][0], operation["params"]["value"]
+
+
+def test_capacity_charts_patch_added_carrier(demo_network):
+    """Selecting another carrier appends its chart only; deselecting one deletes its chart."""
+    update = _update_active_tab_charts(create_app({"Network": demo_network}))
+    capacity = list(CHART_TAB_CONTAINERS).index("capacity")
+
+    def select(carriers, rendered):
+        outputs = update(carriers, "All", [], "Network", "capacity", False, rendered)
+        tab, state = _tab_state(outputs)
+        rendered = {**(rendered or {}), tab: state}
+        return outputs[capacity], rendered
+
+    charts, rendered = select(["AC"], None)
+    assert len(charts) == 1
+
+    patch, rendered = select(["AC", "Wind"], rendered)
+    assert isinstance(patch, Patch)
+    assert [operation["operation"] for operation in patch.to_plotly_json()["operations"]] == ["Append"]
+
+    patch, rendered = select(["Wind"], rendered)
+    assert [operation["operation"] for operation in patch.to_plotly_json()["operations"]] == ["Delete"]
+
+
+def test_only_active_tab_is_rendered(demo_network):
+    """Filter changes render the active tab only; a stale hidden tab is rendered when activated."""
+    update = _update_active_tab_charts(create_app({"Network": demo_network}))
+    capex = list(CHART_TAB_CONTAINERS).index("capex")
+    opex = list(CHART_TAB_CONTAINERS).index("opex")
+
+    outputs = update(["AC"], "All", [], "Network", "capex", False, {})
+    assert [position for position, output in enumerate(outputs[:-1]) if output is not no_update] == [capex]
+    tab, state = _tab_state(outputs)
+    assert tab == "capex"
+    rendered = {tab: state}
+
+    # Activating the tab again sends nothing; the theme change renders it afresh
+    assert all(output is no_update for output in update(["AC"], "All", [], "Network", "capex", False, rendered))
+    assert update(["AC"], "All", [], "Network", "capex", True, rendered)[capex] is not no_update
+
+    # The OPEX tab was hidden during the theme change and is rendered on activation
+    outputs = update(["AC"], "All", [], "Network", "opex", True, rendered)
+    assert outputs[opex] is not no_update and outputs[capex] is no_update
+
+    # Tabs without charts are left alone
+    assert all(output is no_update for output in update(["AC"], "All", [], "Network", "network-config", False, {}))
+
+
+def test_superseded_request_is_cancelled(demo_network, monkeypatch):
+    """A newer request of the same session stops the older one before its next carrier."""
+    update = _update_active_tab_charts(create_app({"Network": demo_network}))
+    build_capacity_figure = visualizations.build_capacity_figure
+    built = []
+
+    def build(n, label, carrier, **kwargs):
+        built.append(carrier)
+        if carrier == "AC":
+            # The user selects another carrier while the first chart is rendered
+            update(["Wind"], "All", [], "Network", "capacity", False, {}, session="page", sequence=2)
+        return build_capacity_figure(n, label, carrier, **kwargs)
+
+    monkeypatch.setattr(visualizations, "build_capacity_figure", build)
+    with pytest.raises(PreventUpdate):
+        update(["AC", "Wind", "H2"], "All", [], "Network", "capacity", False, {}, session="page", sequence=1)
+    assert built == ["AC", "Wind"]
+
+    # A request arriving after a newer one is not rendered at all
+    with pytest.raises(PreventUpdate):
+        update(["AC"], "All", [], "Network", "capacity", False, {}, session="page", sequence=1)
+    assert built == ["AC", "Wind"]
+    # Other sessions are unaffected
+    assert update(["AC"], "All", [], "Network", "capacity", False, {}, session="other", sequence=1)[-1] is not no_update
+
+
+def test_chart_deadline_returns_placeholders(demo_network):
+    """Past the deadline, charts that are not cached are placeholders until the background has rendered them."""
+    update = _update_active_tab_charts(create_app({"Network": demo_network}, chart_deadline=0))
+    timeseries = list(CHART_TAB_CONTAINERS).index("energy-balance")
+
+    outputs = update(["AC"], "All", [], "Network", "energy-balance", False, {})
+    _, state = _tab_state(outputs)
+    assert state["partial"] is True
+    assert all("chart-pending" in chart.className for chart in outputs[timeseries])
+
+    # The tab is rendered again while it holds placeholders; cached charts are shown despite the deadline
+    finished = time.monotonic() + 60
+    while state.get("partial") and time.monotonic() < finished:
+        time.sleep(0.05)
+        outputs = update(["AC"], "All", [], "Network", "energy-balance", False, {"energy-balance": state})
+        _, state = _tab_state(outputs)
+    assert "partial" not in state
+    assert all(isinstance(chart, dcc.Graph) for chart in outputs[timeseries])
+
+
+def test_background_renders_are_not_duplicated(demo_network, monkeypatch):
+    """Repeated requests for a chart still rendering in the background do not queue it again."""
+    update = _update_active_tab_charts(create_app({"Network": demo_network}, chart_deadline=0))
+    build_energy_balance_figure = visualizations.build_energy_balance_figure
+    release = threading.Event()
+    background_builds = []
+    finished = threading.Event()
+
+    def build(n, label, carrier, **kwargs):
+        # Requests stop here past their deadline; the background has no deadline
+        visualizations.checkpoint()
+        background_builds.append(carrier)
+        release.wait(10)
+        try:
+            return build_energy_balance_figure(n, label, carrier, **kwargs)
+        finally:
+            finished.set()
+
+    monkeypatch.setattr(visualizations, "build_energy_balance_figure", build)
+    for _ in range(3):
+        _, state = _tab_state(update(["AC"], "All", [], "Network", "energy-balance", False, {}))
+        assert state["partial"] is True
+    release.set()
+    assert finished.wait(30)
+    time.sleep(0.2)
+    assert background_builds == ["AC"]
+
+    # Once finished, the chart can be queued again
+    finished.clear()
+    deadline = time.monotonic() + 30
+    while not finished.is_set() and time.monotonic() < deadline:
+        update(["AC"], "All", [], "Network", "energy-balance", False, {})
+        finished.wait(0.2)
+    assert background_builds[:2] == ["AC", "AC"]
+
+
+def test_warm_chart_cache_renders_both_themes(demo_network):
+    """Preloading warms the charts of the light and the dark theme."""
+    cache = ResultCache()
+    built = visualizations.warm_chart_cache(demo_network, "Demo", cache, carriers=["AC"])
+    assert built == 2 * visualizations.warm_chart_cache(
+        demo_network, "Demo", ResultCache(), carriers=["AC"], themes=(False,)
+    )
+
+    entries = len(cache)
+    visualizations.build_energy_balance_figure(demo_network, "Demo", "AC", aggregated=False, is_dark_mode=True, cache=cache)
+    assert len(cache) == entries
@@ -0,0 +1,51 @@
+"""Tests for the WSGI entry point."""
+
+import gc
+from unittest.mock import patch
+
+import flask
+import pytest
+
+from pypsa_explorer.wsgi import ENV_CHART_DEADLINE, ENV_NETWORKS, ENV_TITLE, create_server
+
+
+@pytest.fixture(autouse=True)
+def unfreeze_gc():
+    """Undo ``gc.freeze`` so preloading does not leak into other tests."""
+    yield
+    gc.unfreeze()
+
+
+def test_create_server_returns_flask_app(demo_network_path):
+    """The factory returns the Flask server of the dashboard."""
+    server = create_server(f"{demo_network_path}:Demo", preload=False)
+    assert isinstance(server, flask.Flask)
+
+    response = server.test_client().get("/")
+    assert response.status_code == 200
+
+
+def test_create_server_reads_environment(monkeypatch, demo_network_path):
+    """Networks and title fall back to environment variables."""
+    monkeypatch.setenv(ENV_NETWORKS, f"{demo_network_path}:Demo")
+    monkeypatch.setenv(ENV_TITLE, "Production Explorer")
+    monkeypatch.setenv(ENV_CHART_DEADLINE, "2.5")
+
+    with patch("pypsa_explorer.wsgi.create_app") as mock_create:
+        create_server(preload=False)
+
+    args, kwargs = mock_create.call_args
+    assert args[0] == {"Demo": demo_network_path}
+    assert kwargs["title"] == "Production Explorer"
+    assert kwargs["load_default_on_start"] is True
+    assert kwargs["chart_deadline"] == 2.5
+
+
+def test_create_server_preload_warms_cache(demo_network_path):
+    """Preloading precomputes charts for every loaded network."""
+    with patch("pypsa_explorer.app.warm_chart_cache") as mock_warm:
+        create_server([f"{demo_network_path}:Demo"], preload=True)
+
+    mock_warm.assert_called_once()
+    assert mock_warm.call_args.args[1] == "Demo"
+    assert gc.get_freeze_count() > 0